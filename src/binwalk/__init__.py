@@ -1,4 +1,4 @@
-__all__ = ['scan', 'execute', 'ModuleException']
+__all__ = ['scan', 'scan_iter', 'execute', 'ModuleException']
 
 from binwalk.core.module import Modules
 from binwalk.core.version import __version__  # 이 파일은 setup.py에 의해 자동으로 생성되며, .gitignore에 의해 무시됩니다.
@@ -10,6 +10,14 @@ def scan(*args, **kwargs):
         objs = m.execute()
     return objs
 
+# 'scan_iter' 함수는 결과를 발견 즉시 (모듈 이름, 결과) 튜플로 생성합니다 (참조: Modules.execute_iter).
+def scan_iter(*args, **kwargs):
+    keep_results = kwargs.pop('keep_results', True)
+    queue_size = kwargs.pop('queue_size', 1024)
+    with Modules(*args, **kwargs) as m:
+        for item in m.execute_iter(keep_results=keep_results, queue_size=queue_size):
+            yield item
+
 # 'execute' 함수는 'scan' 함수를 호출하는 편의 함수로, 동일한 기능을 합니다.
 def execute(*args, **kwargs):
     return scan(*args, **kwargs)
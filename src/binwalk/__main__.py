@@ -25,10 +25,18 @@ import binwalk.modules
 def runme():
     with binwalk.Modules() as modules:
         try:
+            options = modules.argv(binwalk.modules.General)
+
             if len(sys.argv) == 1:
                 # 명령줄 인수가 제공되지 않은 경우, 도움말 메시지를 출력하고 종료합니다.
                 sys.stderr.write(modules.help())
                 sys.exit(1)
+            # --serve가 지정된 경우, 스캔하지 않고 Unix 소켓에서 스캔 요청을 처리합니다.
+            elif options.get('serve_socket'):
+                from binwalk.core.scanserver import ScanServer
+                ScanServer(options['serve_socket'],
+                           workers=options.get('jobs', 1),
+                           extract=options.get('serve_extract', False)).serve_forever()
             # 명시적으로 활성화된 모듈이 없을 경우, 기본 서명 스캔을 명시적으로 활성화한 상태로 다시 실행합니다.
             elif not modules.execute():
                 # Signature 모듈이 로드되어 있는지 확인한 후, 암시적 서명 스캔을 시도합니다.
@@ -2,6 +2,8 @@
 
 import io
 import os
+import mmap
+import codecs
 import re
 import sys
 import ast
@@ -71,6 +73,12 @@ def file_md5(file_name):
     '''
     md5 = hashlib.md5()
 
+    # 등록된 메모리 버퍼 (참조: BufferFile)
+    data = BufferFile.lookup(file_name)
+    if data is not None:
+        md5.update(data)
+        return md5.hexdigest()
+
     with open(file_name, 'rb') as f:
         for chunk in iter(lambda: f.read(128 * md5.block_size), b''):
             md5.update(chunk)
@@ -85,6 +93,11 @@ def file_size(filename):
 
     파일 크기를 반환합니다.
     '''
+    # 등록된 메모리 버퍼 (참조: BufferFile)
+    data = BufferFile.lookup(filename)
+    if data is not None:
+        return len(data)
+
     # open/lseek을 사용하여 정규 파일 및 블록 장치 모두에서 작동하도록 함
     fd = os.open(filename, os.O_RDONLY)
     try:
@@ -234,41 +247,153 @@ class MathExpression(object):
         else:
             raise TypeError(node)
 
-class StringFile(object):
+class MMapFile(io.FileIO):
 
     '''
-    문자열에 파일처럼 접근할 수 있도록 하는 클래스.
-    내부적으로 InternalBlockFile의 조건부 상위 클래스처럼 사용됩니다.
+    mmap을 사용하여 파일에 접근하는 클래스.
+    InternalBlockFile의 상위 클래스로 사용되며 (BlockFile의 subclass 인자), seek/tell은 시스템 호출 없이 커서만 이동합니다.
+    self.window는 데이터를 복사하지 않는 memoryview를 반환하므로, read_block이 블록과 추가 데이터를 복사 없이 반환할 수 있습니다.
+
+    쓰기 모드로 열린 경우 io.FileIO와 동일하게 동작합니다.
     '''
 
     def __init__(self, fname, mode='r'):
-        self.string = fname # 문자열을 설정
-        self.name = "String"
-        self.args.size = len(self.string)  # 문자열의 길이를 설정
+        super(MMapFile, self).__init__(fname, mode)
+
+        self.mmap = None
+        self.view = None
+        self.position = 0
+
+        if 'w' not in mode and '+' not in mode and 'a' not in mode:
+            try:
+                self.mmap = mmap.mmap(self.fileno(), 0, access=mmap.ACCESS_READ)
+            # 빈 파일은 mmap할 수 없음
+            except ValueError:
+                self.mmap = b''
+            self.view = memoryview(self.mmap)
+            self.args.size = len(self.mmap)
+
+    def window(self, offset, n):
+        '''
+        파일의 offset에서 최대 n 바이트를 복사 없이 참조하는 memoryview를 반환합니다.
+        '''
+        return self.view[offset:offset + n]
 
     def read(self, n=-1):
-        # n 바이트만큼 읽거나, n이 -1이면 전체 읽기
-        if n == -1:
-            data = self.string[self.total_read:]
+        if self.mmap is None:
+            return super(MMapFile, self).read(n)
+
+        if n is None or n < 0:
+            data = self.mmap[self.position:]
         else:
-            data = self.string[self.total_read:self.total_read + n]
+            data = self.mmap[self.position:self.position + n]
+
+        self.position += len(data)
         return data
 
+    def seek(self, n, whence=os.SEEK_SET):
+        if self.mmap is None:
+            return super(MMapFile, self).seek(n, whence)
+
+        if whence == os.SEEK_SET:
+            self.position = n
+        elif whence == os.SEEK_CUR:
+            self.position += n
+        elif whence == os.SEEK_END:
+            self.position = len(self.mmap) + n
+
+        return self.position
+
     def tell(self):
-        # 현재 읽은 위치 반환
-        return self.total_read
+        if self.mmap is None:
+            return super(MMapFile, self).tell()
+        return self.position
+
+    def close(self):
+        if self.view is not None:
+            self.view.release()
+            self.view = None
 
-    def write(self, *args, **kwargs):
-        # 쓰기 기능은 구현하지 않음
-        pass
+        # 반환된 memoryview가 아직 사용 중인 경우 mmap을 닫을 수 없으며, 이 경우 가비지 컬렉션 시에 해제됩니다.
+        if self.mmap:
+            try:
+                self.mmap.close()
+            except BufferError:
+                pass
+        self.mmap = None
+
+        super(MMapFile, self).close()
 
-    def seek(self, *args, **kwargs):
-        # 탐색 기능은 구현하지 않음
-        pass
+class BufferFile(MMapFile):
+
+    '''
+    메모리 버퍼 (bytes, bytearray, memoryview)에 파일처럼 접근하는 클래스.
+    InternalBlockFile의 상위 클래스로 사용되며 (BlockFile의 subclass 인자), 버퍼는 self.register로 등록된 이름으로 엽니다.
+    MMapFile과 마찬가지로 self.window는 버퍼를 복사하지 않는 memoryview를 반환합니다.
+
+    등록되지 않은 이름은 MMapFile과 동일하게 파일로 엽니다.
+    '''
+
+    # 등록된 버퍼 (참조: self.register)
+    BUFFERS = {}
+
+    @staticmethod
+    def register(name, data):
+        '''
+        버퍼를 지정된 이름으로 등록합니다.
+
+        @name - 버퍼 이름. 파일 경로와 같은 방식으로 사용됩니다 (예: 결과의 file.path, 추출 디렉터리 이름).
+                이름은 지정된 문자열 그대로 등록되며, 이후에도 같은 문자열로 찾아야 합니다.
+                추출은 프로세스의 작업 디렉터리를 변경하므로 (참조: Extractor.extract), 상대 경로를 해석하지 않습니다.
+                등록하는 쪽에서 절대 경로로 지정합니다 (참조: Modules._register_buffers).
+        @data - bytes, bytearray, memoryview 등 버퍼 프로토콜을 지원하는 객체.
+
+        반환값은 없습니다.
+        '''
+        BufferFile.BUFFERS[name] = memoryview(data).cast('B')
+
+    @staticmethod
+    def unregister(name):
+        '''
+        지정된 이름으로 등록된 버퍼를 해제합니다. 등록되지 않은 이름은 무시됩니다.
+        '''
+        BufferFile.BUFFERS.pop(name, None)
+
+    @staticmethod
+    def lookup(name):
+        '''
+        지정된 이름으로 등록된 버퍼의 memoryview를 반환합니다. 등록되지 않은 경우 None을 반환합니다.
+        '''
+        if not BufferFile.BUFFERS:
+            return None
+        return BufferFile.BUFFERS.get(name)
+
+    def __init__(self, fname, mode='r'):
+        data = None
+        if 'w' not in mode and '+' not in mode and 'a' not in mode:
+            data = BufferFile.lookup(fname)
+
+        if data is None:
+            super(BufferFile, self).__init__(fname, mode)
+        else:
+            # 파일을 열지 않으므로 io.FileIO 생성자는 호출하지 않습니다.
+            self.name = fname
+            self.mmap = data
+            self.view = data
+            self.position = 0
+            self.args.size = len(data)
+
+    def read(self, n=-1):
+        data = super(BufferFile, self).read(n)
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return data
 
     def close(self):
-        # 닫기 기능은 구현하지 않음
-        pass
+        if self.view is not None and self.view is self.mmap:
+            # 등록된 버퍼는 해제하지 않습니다.
+            self.view = self.mmap = None
+        super(BufferFile, self).close()
 
 def BlockFile(fname, mode='r', subclass=io.FileIO, **kwargs):
 
@@ -282,7 +407,7 @@ def BlockFile(fname, mode='r', subclass=io.FileIO, **kwargs):
         이를 통해 두 가지를 보장합니다:
         
         1. 모든 요청된 데이터가 read 및 write 메서드를 통해 읽히거나 쓰여집니다.
-        2. 모든 read는 str 객체를 반환하며, 모든 write는 Python 인터프리터 버전에 관계없이 str 또는 bytes 객체를 받을 수 있습니다.
+        2. 모든 read는 str 객체를 반환하며 (binary=True로 열린 경우 bytes 객체), 모든 write는 Python 인터프리터 버전에 관계없이 str 또는 bytes 객체를 받을 수 있습니다.
 
         단점으로는 다른 io.FileIO 메서드가 Python 3에서 제대로 작동하지 않는다는 점입니다.
         특히 self.read 주위의 래퍼(예: readline, readlines 등)가 문제입니다.
@@ -307,7 +432,7 @@ def BlockFile(fname, mode='r', subclass=io.FileIO, **kwargs):
         # 블록의 크기를 제한할 만큼 충분히 작아야 합니다.
         DEFAULT_BLOCK_READ_SIZE = 1 * 1024 * 1024
 
-        def __init__(self, fname, mode='r', length=0, offset=0, block=DEFAULT_BLOCK_READ_SIZE, peek=DEFAULT_BLOCK_PEEK_SIZE, swap=0):
+        def __init__(self, fname, mode='r', length=0, offset=0, block=DEFAULT_BLOCK_READ_SIZE, peek=DEFAULT_BLOCK_PEEK_SIZE, swap=0, binary=False):
             '''
             클래스 생성자.
 
@@ -318,10 +443,14 @@ def BlockFile(fname, mode='r', subclass=io.FileIO, **kwargs):
             @block  - 읽을 데이터 블록의 크기(추가 크기 제외).
             @peek   - 각 블록의 끝에 추가할 추가 데이터의 크기.
             @swap   - 매 n 바이트마다 데이터를 반전합니다.
+            @binary - True로 설정하면 읽은 데이터를 str로 변환하지 않고 bytes 객체로 반환합니다.
 
             반환값 없음.
             '''
             self.total_read = 0
+            # 마지막으로 읽은 데이터 블록 (추가 데이터 포함) 및 해당 블록의 파일 내 시작 위치 (참조: self.read_block)
+            self.last_block = None
+            self.last_block_start = 0
             self.block_read_size = self.DEFAULT_BLOCK_READ_SIZE
             self.block_peek_size = self.DEFAULT_BLOCK_PEEK_SIZE
 
@@ -333,6 +462,7 @@ def BlockFile(fname, mode='r', subclass=io.FileIO, **kwargs):
                                          block=block,
                                          peek=peek,
                                          swap=swap,
+                                         binary=binary,
                                          size=0)
 
             # Python 2.6에서는 'rb' 또는 'wb'와 같은 모드를 좋아하지 않음
@@ -341,6 +471,7 @@ def BlockFile(fname, mode='r', subclass=io.FileIO, **kwargs):
             super(self.__class__, self).__init__(fname, mode)
 
             self.swap_size = self.args.swap
+            self.binary = self.args.binary
 
             if self.args.size:
                 self.size = self.args.size
@@ -401,7 +532,8 @@ def BlockFile(fname, mode='r', subclass=io.FileIO, **kwargs):
             반전된 문자열을 반환합니다.
             '''
             i = 0
-            data = ""
+            # 블록과 같은 타입(str 또는 bytes)의 빈 문자열
+            data = block[:0]
 
             if self.swap_size > 0:
                 while i < len(block):
@@ -451,7 +583,7 @@ def BlockFile(fname, mode='r', subclass=io.FileIO, **kwargs):
             io.FileIO.read는 모든 요청된 데이터가 읽힌다는 보장이 없으나,
             이 메서드는 모든 데이터가 읽힌다는 보장을 제공합니다.
 
-            읽은 데이터를 포함한 str 객체를 반환합니다.
+            읽은 데이터를 포함한 str 객체를 반환합니다 (self.binary가 True인 경우 bytes 객체).
             '''
             l = 0
             data = b''
@@ -471,7 +603,10 @@ def BlockFile(fname, mode='r', subclass=io.FileIO, **kwargs):
 
                 self.total_read += len(data)
 
-            return self._swap_data_block(bytes2str(data))
+            if not self.binary:
+                data = bytes2str(data)
+
+            return self._swap_data_block(data)
 
         def peek(self, n=-1):
             '''
@@ -496,12 +631,113 @@ def BlockFile(fname, mode='r', subclass=io.FileIO, **kwargs):
             '''
             대상 파일에서 데이터 블록을 읽습니다.
 
-            (str(파일 블록 데이터), 블록 데이터 길이)의 튜플을 반환합니다.
+            (str(파일 블록 데이터), 블록 데이터 길이)의 튜플을 반환합니다. self.binary가 True인 경우 블록 데이터는 bytes입니다.
+            상위 클래스가 복사 없는 데이터 창을 제공하는 경우 (참조: MMapFile), bytes 대신 memoryview가 반환됩니다.
+            '''
+            # 데이터 창을 사용하면 블록과 추가 데이터를 한 번에 (bytes 모드에서는 복사 없이) 가져올 수 있습니다.
+            # 바이트 스왑은 데이터를 수정해야 하므로 일반 read를 사용합니다.
+            if hasattr(self, 'window') and self.view is not None and not self.swap_size:
+                return self._read_block_window()
+
+            position = self.tell()
+
+            # 이전 블록 뒤로 건너뛴 경우 (예: 시그니처 스캔의 jump), 새 블록의 시작 부분은 이미 이전 블록의 추가 데이터로 읽혀 있습니다.
+            # 해당 부분은 파일에서 다시 읽지 않고 재사용합니다.
+            if not self.swap_size and self.last_block and \
+                    self.last_block_start < position < self.last_block_start + len(self.last_block):
+                (data, dlen) = self._read_block_reuse(position)
+            else:
+                data = self.read(self.block_read_size)
+                dlen = len(data)
+                data += self.peek(self.block_peek_size)
+
+            self.last_block = data
+            self.last_block_start = position
+
+            return (data, dlen)
+
+        def _read_block_reuse(self, position):
+            '''
+            self.last_block에 이미 읽힌 데이터를 재사용하여, 지정된 위치에서 read_block과 동일한 데이터 블록을 반환합니다.
+
+            @position - 블록을 읽을 파일 위치 (self.tell()과 같아야 함).
+
+            (블록 데이터, 블록 데이터 길이)의 튜플을 반환합니다.
+            '''
+            # self.read와 마찬가지로 self.length 바이트 이상을 블록 데이터로 반환하지 않습니다.
+            if self.total_read < self.length:
+                n = min(self.block_read_size, self.length - self.total_read)
+            else:
+                n = 0
+            n += self.block_peek_size
+
+            data = self.last_block[position - self.last_block_start:]
+            if len(data) >= n:
+                data = data[:n]
+            else:
+                # 나머지 데이터는 추가 데이터와 마찬가지로 self.length에 관계없이 읽습니다.
+                self.seek(position + len(data))
+                data += self.read(n - len(data), override=True)
+
+            dlen = min(n - self.block_peek_size, len(data))
+            self.seek(position + dlen)
+
+            return (data, dlen)
+
+        def _read_block_window(self):
+            '''
+            self.window를 사용하여 read_block과 동일한 데이터 블록을 반환합니다.
             '''
-            data = self.read(self.block_read_size)
-            dlen = len(data)
-            data += self.peek(self.block_peek_size)
+            position = self.tell()
+
+            # self.read와 마찬가지로 self.length 바이트 이상을 블록 데이터로 반환하지 않습니다.
+            if self.total_read < self.length:
+                dlen = min(self.block_read_size, self.length - self.total_read, max(self.size - position, 0))
+            else:
+                dlen = 0
+
+            data = self.window(position, dlen + self.block_peek_size)
+            self.seek(position + dlen)
+
+            if not self.binary:
+                data = codecs.latin_1_decode(data)[0]
 
             return (data, dlen)
 
     return InternalBlockFile(fname, mode=mode, **kwargs)
+
+class StrBlockFile(object):
+
+    '''
+    bytes 모드로 열린 BlockFile을 감싸서, read/peek/read_block이 str 객체를 반환하도록 하는 클래스.
+    bytes 데이터를 처리하지 않는 기존 플러그인과의 호환성을 위해 사용됩니다 (참조: binwalk.core.plugin.Plugin.BINARY).
+    그 외의 모든 속성과 메서드는 원래 BlockFile 객체에 전달됩니다.
+    '''
+
+    binary = False
+
+    def __init__(self, fp):
+        # self.__setattr__이 원래 BlockFile로 전달되므로 직접 설정
+        self.__dict__['fp'] = fp
+
+    def __getattr__(self, name):
+        return getattr(self.fp, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.fp, name, value)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, t, v, traceback):
+        self.fp.close()
+
+    def read(self, n=-1, override=False):
+        return bytes2str(self.fp.read(n, override))
+
+    def peek(self, n=-1):
+        return bytes2str(self.fp.peek(n))
+
+    def read_block(self):
+        (data, dlen) = self.fp.read_block()
+        return (bytes2str(data), dlen)
@@ -10,6 +10,8 @@ PY_MAJOR_VERSION = sys.version_info[0]
 # Python 3에서는 string.letters가 string.ascii_letters로 대체되었습니다.
 if PY_MAJOR_VERSION > 2:
     string.letters = string.ascii_letters
+    # Python 3에서는 unicode 타입이 str로 통합되었습니다.
+    unicode = str
 
 def get_class_name_from_method(method):
     # 주어진 메서드에서 클래스 이름을 반환합니다. Python 2와 3의 차이를 처리합니다.
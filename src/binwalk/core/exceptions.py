@@ -17,6 +17,16 @@ class ModuleException(Exception):
     pass
 
 
+class ScanStoppedException(BaseException):
+
+    '''
+    스캔이 중단되었을 때 (예: 스트리밍 스캔 (binwalk.scan_iter)의 소비자가 결과 받기를 중단하거나 스캔 서버의 작업이 취소된 경우)
+    스캔 스레드에서 발생하는 예외입니다 (참조: Modules.check_stopped).
+    모듈의 일반 예외 처리 (except Exception)에 잡히지 않고 스캔을 종료하도록 BaseException을 상속합니다.
+    '''
+    pass
+
+
 class IgnoreFileException(Exception):
 
     '''
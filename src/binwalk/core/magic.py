@@ -1,16 +1,26 @@
 __all__ = ['Magic']
 
+import os
 import re
+import ast
+import sys
+import time
+import pickle
 import struct
+import codecs
+import bisect
 import datetime
+import operator as op
 import binwalk.core.common
 import binwalk.core.compat
+import binwalk.core.version
 from binwalk.core.exceptions import ParserException
 
 class SignatureResult(binwalk.core.module.Result):
     '''
     시그니처 결과를 저장하는 클래스입니다.
     '''
+    __slots__ = ('jump', 'many', 'adjust', 'strlen', 'string', 'invalid', 'once', 'overlap', 'end', 'id')
 
     def __init__(self, **kwargs):
         # 시그니처 키워드 태그에 의해 설정되는 값들입니다.
@@ -252,6 +262,163 @@ class SignatureLine(object):
             self.format = ""
 
 
+class OffsetExpression(object):
+    '''
+    시그니처 라인의 오프셋 표현식 (예: '(4.l+12)', '&0', '(0x3c.l)')을 한 번만 파싱하여,
+    각 일치 후보마다 문자열 치환과 ast.parse 없이 평가할 수 있도록 하는 클래스입니다.
+
+    표현식은 정수 연산 노드와 "지정된 오프셋에서 N 바이트를 읽음" 리프 노드로 구성된 트리로 컴파일됩니다.
+    결과는 Magic._do_math와 동일합니다. 동일한 결과를 보장할 수 없는 표현식은 ParserException을 발생시키며,
+    이 경우 호출자는 Magic._do_math를 사용해야 합니다.
+    '''
+
+    # 이전 라인의 끝 값('&' 오프셋 구문)을 나타내는 이름입니다.
+    PREVIOUS_LINE_END = "_ple"
+
+    # 오프셋 표현식의 타입 문자에 대한 (struct 포맷, 크기)입니다 (참조: Magic._do_math).
+    READ_TYPES = {
+        'b': ('b', 1),
+        'B': ('b', 1),
+        's': ('<h', 2),
+        'l': ('<i', 4),
+        'S': ('>h', 2),
+        'L': ('>i', 4),
+    }
+
+    def __init__(self, expression, relative=False):
+        '''
+        클래스 생성자입니다.
+
+        @expression - 파싱할 표현식입니다.
+        @relative   - True로 설정된 경우, '&' 및 '&+'를 이전 라인의 끝 값으로 처리합니다.
+
+        반환값은 없습니다.
+        '''
+        self.expression = expression
+
+        if relative:
+            ple = self.PREVIOUS_LINE_END + '+'
+            expression = expression.replace('&+', ple).replace('&', ple)
+
+        # 읽기 리프 노드의 목록으로, 각 항목은 (주소 함수, struct unpack 함수, 크기) 튜플입니다.
+        self.reads = []
+
+        # 표현식에 오프셋이 포함되어 있습니까? (예: "(4.l+12)")
+        if '.' in expression and '(' in expression:
+            replacements = {}
+
+            for period in [i for (i, c) in enumerate(expression) if c == '.']:
+                # 오프셋 필드를 주소 표현식과 타입 값으로 분리합니다.
+                s = expression[:period].rfind('(') + 1
+                t = expression[period + 1:period + 2]
+                text = "%s.%s" % (expression[s:period], t)
+
+                if binwalk.core.common.has_key(replacements, text):
+                    continue
+
+                if not binwalk.core.common.has_key(self.READ_TYPES, t) or not expression[s:period]:
+                    raise ParserException("지원되지 않는 오프셋 표현식: '%s'" % self.expression)
+
+                (fmt, size) = self.READ_TYPES[t]
+                self.reads.append((self._compile(expression[s:period]), struct.Struct(fmt).unpack, size))
+
+                # 각 읽기 값은 최종 표현식에서 이름으로 참조됩니다.
+                replacements[text] = "_r%d" % (len(self.reads) - 1)
+
+            for (text, name) in binwalk.core.common.iterator(replacements):
+                expression = expression.replace(text, name)
+
+        self.value = self._compile(expression)
+
+    def _compile(self, expression):
+        '''
+        ast 모듈을 사용하여 표현식을 파싱하고 평가 함수로 컴파일합니다.
+
+        @expression - 컴파일할 표현식입니다.
+
+        func(ple, reads) 함수를 반환합니다.
+        '''
+        try:
+            node = ast.parse(expression).body[0].value
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            raise ParserException("오프셋 표현식 '%s'을(를) 파싱하는 데 실패했습니다: %s" % (self.expression, str(e)))
+
+        return self._compile_node(node)
+
+    def _compile_node(self, node):
+        '''
+        ast 노드를 평가 함수로 컴파일합니다 (참조: binwalk.core.common.MathExpression).
+
+        @node - 컴파일할 ast 노드.
+
+        func(ple, reads) 함수를 반환합니다.
+        '''
+        operators = binwalk.core.common.MathExpression.OPERATORS
+
+        # ast.Num은 Python 3.8부터 사용되지 않으므로 ast.Constant의 숫자 값만 허용합니다 (bool은 제외).
+        if (isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and
+                not isinstance(node.value, bool)):
+            n = node.value
+            return lambda ple, reads: n
+        elif isinstance(node, ast.Name) and node.id == self.PREVIOUS_LINE_END:
+            return lambda ple, reads: ple
+        elif isinstance(node, ast.Name) and node.id.startswith('_r') and node.id[2:].isdigit():
+            i = int(node.id[2:])
+            return lambda ple, reads: reads[i]
+        # 텍스트 치환에서 음수 값은 거듭제곱보다 우선순위가 낮으므로, 거듭제곱은 지원하지 않습니다.
+        elif isinstance(node, ast.UnaryOp) and binwalk.core.common.has_key(operators, type(node.op)):
+            operation = operators[type(node.op)]
+            operand = self._compile_node(node.operand)
+            return lambda ple, reads: operation(0, operand(ple, reads))
+        elif (isinstance(node, ast.BinOp) and not isinstance(node.op, ast.Pow) and
+                binwalk.core.common.has_key(operators, type(node.op))):
+            operation = operators[type(node.op)]
+            left = self._compile_node(node.left)
+            right = self._compile_node(node.right)
+            return lambda ple, reads: operation(left(ple, reads), right(ple, reads))
+        else:
+            raise ParserException("지원되지 않는 오프셋 표현식: '%s'" % self.expression)
+
+    def evaluate(self, data, offset, previous_line_end=0):
+        '''
+        표현식을 평가합니다.
+
+        @data              - 시그니처가 적용되는 데이터입니다.
+        @offset            - 현재 시그니처가 시작되는 data 내부의 오프셋입니다.
+        @previous_line_end - 이전 라인의 끝 값입니다 ('&' 오프셋 구문).
+
+        평가된 표현식의 값을 반환하며, 평가에 실패하면 None을 반환합니다.
+        '''
+        values = []
+
+        for (address, unpack, size) in self.reads:
+            # 오프셋 주소를 평가하지 못하면, Magic._do_math와 마찬가지로 TypeError가 발생합니다.
+            try:
+                o = address(previous_line_end, values)
+            except KeyboardInterrupt:
+                raise
+            except Exception:
+                o = None
+
+            # 표현식에 지정된 오프셋은 data 내부의 시작 오프셋에 상대적입니다.
+            o += offset
+
+            try:
+                values.append(unpack(binwalk.core.compat.str2bytes(data[o:o + size]))[0])
+            # struct.error는 지정된 형식 타입에 대해 data에 충분한 바이트가 없는 경우 발생합니다.
+            except struct.error:
+                values.append(0)
+
+        try:
+            return self.value(previous_line_end, values)
+        except KeyboardInterrupt:
+            raise
+        except Exception:
+            return None
+
+
 class Signature(object):
     '''
     시그니처 데이터를 보유하고 시그니처 정규 표현식을 생성하는 클래스입니다.
@@ -270,12 +437,34 @@ class Signature(object):
         self.lines = [first_line]
         self.title = first_line.format
         self.offset = first_line.offset
-        self.regex = self._generate_regex(first_line)
+        # 정규 표현식 타입이 아닌 시그니처의 매직 바이트 문자열입니다 (참조: SignatureMatcher).
+        self.magic = None
+        self._regex = self._generate_regex(first_line)
         try:
             self.confidence = first_line.tags['confidence']
         except KeyError:
             self.confidence = first_line.size
 
+    @property
+    def regex(self):
+        '''
+        시그니처의 컴파일된 정규 표현식입니다.
+        리터럴 시그니처의 정규 표현식은 캐시에서 로드된 경우 처음 사용될 때 다시 컴파일됩니다.
+        '''
+        if self._regex is None:
+            self._regex = re.compile(re.escape(self.magic))
+        return self._regex
+
+    def __getstate__(self):
+        '''
+        시그니처 캐시에 저장될 상태를 반환합니다 (참조: Magic.load_files).
+        리터럴 시그니처의 정규 표현식은 self.magic으로부터 다시 생성할 수 있으므로 저장하지 않습니다.
+        '''
+        state = self.__dict__.copy()
+        if self.magic is not None:
+            state['_regex'] = None
+        return state
+
     def _generate_regex(self, line):
         '''
         시그니처의 매직 바이트에서 정규 표현식을 생성합니다.
@@ -345,6 +534,8 @@ class Signature(object):
                     binwalk.core.common.warning("시그니처 '%s'는 자기 중첩 시그니처입니다!" % line.text)
                     break
 
+        self.magic = restr
+
         return re.compile(re.escape(restr))
 
     def append(self, line):
@@ -360,11 +551,178 @@ class Signature(object):
         self.lines.append(line)
 
 
+class SignatureMatcher(object):
+    '''
+    로드된 모든 시그니처의 매직 바이트를 한 번에 검색하는 클래스입니다.
+
+    시그니처마다 정규 표현식을 따로 실행하는 대신, 같은 첫 바이트로 시작하는 매직 바이트들을
+    하나의 트라이 형태의 정규 표현식으로 병합합니다. re 모듈은 각 정규 표현식의 리터럴 접두사로
+    후보 위치를 빠르게 건너뛸 수 있으므로, 데이터 블록당 검색 횟수가 시그니처 수가 아닌
+    서로 다른 첫 바이트의 수로 줄어듭니다.
+    '''
+
+    def __init__(self, signatures, binary=False):
+        '''
+        클래스 생성자입니다.
+
+        @signatures - 신뢰도 순으로 정렬된 Signature 객체 목록.
+        @binary     - True로 설정하면 str 대신 bytes 데이터를 검색합니다.
+
+        반환값은 없습니다.
+        '''
+        # 매직 바이트 문자열과 해당 문자열을 사용하는 (순위, 시그니처) 목록입니다.
+        self.literals = {}
+        # 정규 표현식 타입의 (순위, 시그니처, 정규 표현식) 목록입니다. 이들은 병합할 수 없으므로 개별적으로 검색합니다.
+        self.regex_signatures = []
+
+        for (rank, signature) in enumerate(signatures):
+            if signature.magic is None:
+                regex = signature.regex
+                # bytes 데이터에는 같은 패턴의 bytes 정규 표현식을 사용합니다 (모든 문자는 latin1 범위입니다).
+                if binary:
+                    regex = re.compile(binwalk.core.compat.str2bytes(regex.pattern), regex.flags & ~re.UNICODE)
+                self.regex_signatures.append((rank, signature, regex))
+            elif binary:
+                self.literals.setdefault(binwalk.core.compat.str2bytes(signature.magic), []).append((rank, signature))
+            else:
+                self.literals.setdefault(signature.magic, []).append((rank, signature))
+
+        # 트라이 정규 표현식은 한 위치에서 가장 긴 매직 바이트만 반환하므로,
+        # 같은 위치에서 일치하는 더 짧은 매직 바이트(접두사)들을 미리 계산해 둡니다.
+        self.prefixes = {}
+        for literal in self.literals:
+            self.prefixes[literal] = [literal[:i] for i in range(1, len(literal) + 1)
+                                      if binwalk.core.compat.has_key(self.literals, literal[:i])]
+
+        groups = {}
+        for literal in self.literals:
+            groups.setdefault(literal[:1], []).append(binwalk.core.compat.bytes2str(literal))
+
+        self.patterns = []
+        for (_, group) in sorted(groups.items()):
+            regex = self._trie_regex(group)
+            if binary:
+                regex = binwalk.core.compat.str2bytes(regex)
+            self.patterns.append(re.compile(regex))
+
+    def _trie_regex(self, literals):
+        '''
+        문자열 목록을 트라이 형태의 정규 표현식 문자열로 변환합니다.
+
+        @literals - 정규 표현식으로 변환할 문자열 목록.
+
+        정규 표현식 문자열을 반환합니다.
+        '''
+        trie = {}
+
+        for literal in literals:
+            node = trie
+            for c in literal:
+                node = node.setdefault(c, {})
+            # 빈 문자열 키는 문자열의 끝을 표시합니다.
+            node[''] = {}
+
+        return self._trie_node_regex(trie)
+
+    def _trie_node_regex(self, node):
+        branches = [re.escape(c) + self._trie_node_regex(child) for (c, child) in sorted(node.items()) if c]
+
+        if not branches:
+            return ''
+        elif len(branches) == 1 and not binwalk.core.compat.has_key(node, ''):
+            return branches[0]
+
+        regex = '(?:%s)' % '|'.join(branches)
+
+        # 현재 노드에서 끝나는 문자열이 있는 경우, 하위 노드는 선택 사항입니다.
+        # 탐욕적 일치로 인해 항상 가장 긴 문자열이 먼저 시도됩니다.
+        if binwalk.core.compat.has_key(node, ''):
+            regex += '?'
+
+        return regex
+
+    def candidates(self, data, dlen):
+        '''
+        데이터 블록에서 잠재적인 시그니처 일치를 검색합니다.
+
+        각 시그니처에 대해 re.finditer와 동일하게 중첩되지 않는 일치만 보고하므로,
+        시그니처별로 정규 표현식을 실행한 것과 같은 후보가 생성됩니다.
+
+        @data - 검색할 데이터.
+        @dlen - 이 값을 초과하는 오프셋에서 시작하는 시그니처는 무시합니다.
+
+        오프셋과 시그니처 순위로 정렬된 (오프셋, 순위, 시그니처) 튜플 목록을 반환합니다.
+        '''
+        candidates = []
+        # 각 매직 바이트에 대해 다음 일치가 허용되는 최소 위치입니다.
+        next_start = {}
+
+        for pattern in self.patterns:
+            search = pattern.search
+            match = search(data)
+
+            while match is not None:
+                position = match.start()
+
+                for literal in self.prefixes[match.group()]:
+                    if position < next_start.get(literal, 0):
+                        continue
+                    next_start[literal] = position + len(literal)
+
+                    for (rank, signature) in self.literals[literal]:
+                        # 시그니처의 시작 오프셋을 고려합니다.
+                        offset = position - signature.offset
+                        if 0 <= offset < dlen:
+                            candidates.append((offset, rank, signature))
+
+                # 다른 매직 바이트가 현재 일치와 중첩될 수 있으므로, 다음 위치부터 다시 검색합니다.
+                match = search(data, position + 1)
+
+        for (rank, signature, regex) in self.regex_signatures:
+            for match in regex.finditer(data):
+                offset = match.start() - signature.offset
+                if 0 <= offset < dlen:
+                    candidates.append((offset, rank, signature))
+
+        candidates.sort(key=lambda x: (x[0], x[1]))
+
+        return candidates
+
+
 class Magic(object):
     '''
     시그니처 파일을 로드하고 임의의 데이터 블록에서 일치하는 시그니처를
     스캔하는 주요 클래스입니다.
     '''
+    # 시그니처 캐시 형식 버전입니다. Signature/SignatureLine의 속성이 변경되면 증가시켜야 합니다 (참조: self.load_files).
+    CACHE_VERSION = 1
+
+    # 시그니처 라인의 데이터 타입에 지정된 연산자에 대한 함수입니다 (예: 'belong&0xFF').
+    OPERATORS = {
+        '**': op.pow,
+        '<<': op.lshift,
+        '>>': op.rshift,
+        '&': op.and_,
+        '|': op.or_,
+        '*': op.mul,
+        '+': op.add,
+        '-': op.sub,
+        '/': op.truediv,
+        '~': lambda dvalue, opval: ~opval,
+        '^': op.xor,
+    }
+
+    # 시그니처 라인의 비교 조건에 대해, 비교 값이 주어지면 데이터 값을 검사하는 함수를 생성하는 함수입니다.
+    CONDITIONS = {
+        '=': lambda value: lambda dvalue: dvalue == value,
+        '>': lambda value: lambda dvalue: dvalue > value,
+        '<': lambda value: lambda dvalue: dvalue < value,
+        '!': lambda value: lambda dvalue: dvalue != value,
+        '~': lambda value: lambda dvalue: dvalue == ~value,
+        '^': lambda value: lambda dvalue: dvalue ^ value,
+        '&': lambda value: lambda dvalue: dvalue & value,
+        '|': lambda value: lambda dvalue: dvalue | value,
+    }
 
     def __init__(self, exclude=[], include=[], invalid=False):
         '''
@@ -380,9 +738,20 @@ class Magic(object):
         self.data = ""
         # Signature 클래스 객체의 목록으로, self.parse에 의해 채워집니다 (참조: self.load).
         self.signatures = []
+        # self.signatures로부터 생성된 SignatureMatcher 인스턴스의 딕셔너리로, 키는 self.binary 값입니다 (참조: self.scan).
+        self.matchers = {}
         # 'once' 키워드가 있는 시그니처 중 이미 한 번 표시된 시그니처 목록입니다.
         self.display_once = set()
+        # (시그니처 ID, self.binary)와 컴파일된 시그니처 평가기의 딕셔너리입니다 (참조: self._compile).
+        self.evaluators = {}
+        # self.data가 str 대신 bytes인 경우 True입니다 (참조: self.scan).
+        self.binary = False
+        # self.scan_iter가 이 오프셋 이전의 후보를 분석하지 않습니다 (참조: self.skip).
+        self.skip_offset = 0
+        # 시그니처 목록이 변경되어 self.matchers를 다시 생성해야 하는 경우 True입니다.
         self.dirty = True
+        # 시그니처별 후보 수와 분석 결과 및 시간을 기록하는 binwalk.core.stats.Stats 인스턴스입니다 (선택 사항).
+        self.stats = None
 
         self.show_invalid = invalid
         self.includes = [re.compile(x) for x in include]
@@ -402,6 +771,29 @@ class Magic(object):
     def reset(self):
         self.display_once = set()
 
+    def copy(self):
+        '''
+        로드된 시그니처, 매직 바이트 검색기 및 컴파일된 평가기를 공유하는 새 Magic 인스턴스를 생성합니다.
+        스캔 상태 (self.data, self.display_once 등)는 공유하지 않으므로, 복사본은 다른 스캔에서 동시에 사용할 수 있습니다.
+        복사본에는 시그니처를 추가하지 않아야 합니다.
+
+        새 Magic 인스턴스를 반환합니다.
+        '''
+        # 검색기는 복사본에서 생성되더라도 공유되도록, 복사하기 전에 다시 생성할 준비를 합니다 (참조: self._candidates).
+        if self.dirty:
+            self.matchers = {}
+            self.dirty = False
+
+        magic = Magic(invalid=self.show_invalid)
+        magic.includes = self.includes
+        magic.excludes = self.excludes
+        magic.signatures = self.signatures
+        magic.matchers = self.matchers
+        magic.evaluators = self.evaluators
+        magic.dirty = False
+
+        return magic
+
     def _filtered(self, text):
         '''
         문자열이 필터링되어야 하는지 테스트합니다.
@@ -506,6 +898,213 @@ class Magic(object):
 
         return value
 
+    def _compile_line(self, line, binary=False):
+        '''
+        SignatureLine을 평가하는 함수를 생성합니다. 정적 오프셋, struct 포맷, 연산자 함수 및
+        비교 조건은 여기서 한 번만 결정되므로, 각 일치 후보마다 라인을 다시 해석할 필요가 없습니다.
+
+        @line   - 컴파일할 SignatureLine 객체.
+        @binary - True로 설정하면 str 대신 bytes 데이터에 대한 함수를 생성합니다.
+
+        func(data, offset, previous_line_end, tags) 함수를 반환합니다.
+        라인이 데이터와 일치하면 (line_offset, dvalue) 튜플을, 그렇지 않으면 None을 반환합니다.
+        '''
+        size = line.size
+        value = line.value
+
+        # 시그니처 라인의 상대적 오프셋이 정수 값이 아닌 경우, 복잡한 표현식을 평가합니다.
+        # 가능한 경우 표현식은 여기서 한 번만 파싱됩니다 (참조: OffsetExpression).
+        offset_expression = None
+        if isinstance(line.offset, int):
+            static_offset = line.offset
+            get_offset = None
+        else:
+            static_offset = None
+
+            try:
+                offset_expression = OffsetExpression(line.offset, relative=True)
+            except ParserException:
+                pass
+
+        if offset_expression is not None:
+            def get_offset(offset, previous_line_end):
+                line_offset = offset_expression.evaluate(self.data, offset, previous_line_end)
+
+                # 유효성 검사
+                if not isinstance(line_offset, int):
+                    raise ParserException("오프셋 '%s'을(를) 숫자로 변환하는 데 실패했습니다: '%s'" % (line.offset, line.text))
+
+                return line_offset
+        elif static_offset is None:
+            def get_offset(offset, previous_line_end):
+                # 이전 라인의 끝 값을 문자열로 포맷합니다. '+' 기호를 추가하여
+                # 이 값이 표현식의 나머지 값에 추가되어야 함을 명시적으로 표시합니다
+                # (예: '&0'이 '4+0'으로 변환됨).
+                ple = '%d+' % previous_line_end
+                # 사용자가 '&0' (libmagic) 또는 '&+0' (명시적 추가) 구문을 사용할 수 있도록 허용합니다.
+                # 둘 다 ple 텍스트로 교체합니다.
+                line_offset = self._do_math(offset, line.offset.replace('&+', ple).replace('&', ple))
+
+                # 유효성 검사
+                if not isinstance(line_offset, int):
+                    raise ParserException("오프셋 '%s'을(를) 숫자로 변환하는 데 실패했습니다: '%s'" % (line.offset, line.text))
+
+                return line_offset
+
+        # bytes (또는 memoryview) 데이터에서 읽은 문자열은 비교 및 포맷을 위해 str로 변환됩니다.
+        # 문자열 필드는 작으므로, 데이터 블록 전체를 변환하는 것보다 훨씬 저렴합니다.
+        if binary:
+            to_str = lambda string: codecs.latin_1_decode(string)[0]
+        else:
+            to_str = lambda string: string
+
+        # 라인에 패킹된 포맷 문자열이 있는 경우, 이를 언팩합니다.
+        if line.pkfmt:
+            unpack = struct.Struct(line.pkfmt).unpack
+            if binary:
+                str2bytes = lambda string: string
+            else:
+                str2bytes = binwalk.core.compat.str2bytes
+
+            def read(data, start, tags):
+                try:
+                    return unpack(str2bytes(data[start:start + size]))[0]
+                # self.data에 지정된 포맷 크기에 대해 충분한 바이트가 남아 있지 않음
+                except struct.error:
+                    return 0
+        # 와일드카드 문자열의 경우 line.value == None입니다.
+        elif value is None:
+            # 이 문자열의 크기가 이전 시그니처 라인에서 지정될 수 있는 경우 이를 확인합니다.
+            use_strlen = binwalk.core.compat.has_key(line.tags, 'string')
+
+            def read(data, start, tags):
+                if use_strlen and binwalk.core.compat.has_key(tags, 'strlen'):
+                    return to_str(data[start:(start + tags['strlen'])])
+                # 그렇지 않으면, 문자열을 첫 번째 줄바꿈, 캐리지 리턴 또는 NULL 바이트에서 종료합니다.
+                return to_str(data[start:start + size]).split('\x00')[0].split('\r')[0].split('\n')[0]
+        # 비 와일드카드 문자열의 경우, 시그니처 라인에서 지정된 알려진 길이를 가집니다.
+        elif binary:
+            def read(data, start, tags):
+                return to_str(data[start:start + size])
+        else:
+            def read(data, start, tags):
+                return data[start:start + size]
+
+        # 일부 정수 값에는 비교를 수행하기 전에 수행해야 하는 특수 연산이 있습니다
+        # (예: "belong&0x0000FFFF"). 복잡한 수식도 여기에 지원됩니다.
+        if line.operator:
+            operation = self.OPERATORS[line.operator]
+            opvalue = line.opvalue
+
+            opvalue_expression = None
+            if not isinstance(opvalue, int):
+                try:
+                    opvalue_expression = OffsetExpression(opvalue)
+                except ParserException:
+                    pass
+
+            def apply(dvalue, offset):
+                try:
+                    # 이 시그니처 라인의 연산자 값이 정수 값인 경우 이를 사용하고,
+                    # 그렇지 않은 경우 복잡한 표현식을 평가합니다.
+                    if isinstance(opvalue, int):
+                        return operation(dvalue, opvalue)
+                    elif opvalue_expression is not None:
+                        return operation(dvalue, opvalue_expression.evaluate(self.data, offset))
+                    else:
+                        return operation(dvalue, self._do_math(offset, opvalue))
+                except KeyboardInterrupt:
+                    raise
+                except Exception as e:
+                    raise ParserException("연산 '" +
+                                          str(dvalue) +
+                                          " " +
+                                          str(line.operator) +
+                                          "= " +
+                                          str(opvalue) +
+                                          "' 실패: " + str(e))
+        else:
+            apply = None
+
+        # 데이터 (dvalue)가 지정된 비교와 일치하는지 확인하는 함수입니다.
+        # 와일드카드 값은 항상 일치합니다.
+        if value is None:
+            compare = None
+        else:
+            compare = self.CONDITIONS[line.condition](value)
+            if line.regex:
+                condition = compare
+                compare = lambda dvalue: value.match(dvalue) or condition(dvalue)
+
+        # 이 시점까지, 날짜 필드는 정수 값으로 처리되지만,
+        # 이를 멋지게 형식화된 문자열로 표시하고자 합니다.
+        is_date = (line.type == 'date')
+
+        def evaluate(data, offset, previous_line_end, tags):
+            if get_offset is None:
+                line_offset = static_offset
+            else:
+                line_offset = get_offset(offset, previous_line_end)
+
+            # 이 라인에서 필요한 데이터의 시작은 offset + line_offset입니다.
+            dvalue = read(data, offset + line_offset, tags)
+
+            if apply is not None:
+                dvalue = apply(dvalue, offset)
+
+            if compare is not None and not compare(dvalue):
+                return None
+
+            if is_date:
+                try:
+                    ts = datetime.datetime.utcfromtimestamp(dvalue)
+                    dvalue = ts.strftime("%Y-%m-%d %H:%M:%S")
+                except KeyboardInterrupt:
+                    raise
+                except Exception:
+                    dvalue = "잘못된 타임스탬프"
+
+            return (line_offset, dvalue)
+
+        return evaluate
+
+    def _compile(self, signature, binary=False):
+        '''
+        시그니처의 모든 라인을 self._analyze에서 사용하는 평가기 목록으로 컴파일합니다.
+
+        @signature - 컴파일할 Signature 객체.
+        @binary    - True로 설정하면 str 대신 bytes 데이터에 대한 평가기를 생성합니다.
+
+        각 라인에 대한 (level, evaluate, format, format_arity, tags, track_end, is_string, size) 튜플 목록을 반환합니다.
+        '''
+        evaluators = []
+
+        for n, line in enumerate(signature.lines):
+            # 태그 값이 문자열인 경우 평가 시 포맷하며, 포맷 인자의 개수를 미리 계산합니다.
+            # 그렇지 않은 경우, 원시 태그 값이 사용됩니다.
+            tags = []
+            for (tag_name, tag_value) in binwalk.core.compat.iterator(line.tags):
+                if isinstance(tag_value, str):
+                    tags.append((tag_name, tag_value, len(self.fmtstr.findall(tag_value))))
+                else:
+                    tags.append((tag_name, tag_value, None))
+
+            # 시그니처의 다음 라인을 미리 봅니다.
+            # 다음 라인의 들여쓰기 수준이 이 라인보다 높으면, 이 라인의 데이터 끝을 추적해야 합니다.
+            # 이는 이후 라인에서 '>>&0' 오프셋 구문을 사용하여 이전 라인에서 상대적 오프셋을 지정할 수 있도록 합니다.
+            track_end = (n + 1 < len(signature.lines) and signature.lines[n + 1].level > line.level)
+
+            evaluators.append((line.level,
+                               self._compile_line(line, binary),
+                               line.format,
+                               len(self.fmtstr.findall(line.format)),
+                               tags,
+                               track_end,
+                               line.type == 'string',
+                               line.size))
+
+        return evaluators
+
     def _analyze(self, signature, offset):
         '''
         지정된 오프셋에서 지정된 시그니처 데이터를 분석합니다.
@@ -518,162 +1117,47 @@ class Magic(object):
         description = []
         max_line_level = 0
         previous_line_end = 0
+        data = self.data
         tags = {'id': signature.id, 'offset': offset, 'invalid': False, 'once': False}
 
+        # 시그니처는 데이터 타입별로 처음 사용될 때 한 번만 컴파일됩니다 (참조: self._compile).
+        key = (signature.id, self.binary)
+        try:
+            evaluators = self.evaluators[key]
+        except KeyError:
+            evaluators = self.evaluators[key] = self._compile(signature, self.binary)
+
         # 지정된 오프셋에서 self.data의 각 시그니처 라인을 적용합니다.
-        for n, line in enumerate(signature.lines):
+        for (level, evaluate, fmt, fmt_arity, line_tags, track_end, is_string, size) in evaluators:
 
             # 현재 최대 들여쓰기 수준보다 높은 들여쓰기 수준은 무시합니다.
-            if line.level <= max_line_level:
-                # 시그니처 라인의 상대적 오프셋이 정수 값인 경우 이를 사용합니다.
-                if isinstance(line.offset, int):
-                    line_offset = line.offset
-                # 그렇지 않은 경우, 복잡한 표현식을 평가합니다.
-                else:
-                    # 이전 라인의 끝 값을 문자열로 포맷합니다. '+' 기호를 추가하여
-                    # 이 값이 표현식의 나머지 값에 추가되어야 함을 명시적으로 표시합니다
-                    # (예: '&0'이 '4+0'으로 변환됨).
-                    ple = '%d+' % previous_line_end
-                    # 사용자가 '&0' (libmagic) 또는 '&+0' (명시적 추가) 구문을 사용할 수 있도록 허용합니다.
-                    # 둘 다 ple 텍스트로 교체합니다.
-                    line_offset_text = line.offset.replace('&+', ple).replace('&', ple)
-                    # 표현식을 평가합니다.
-                    line_offset = self._do_math(offset, line_offset_text)
-
-                # 유효성 검사
-                if not isinstance(line_offset, int):
-                    raise ParserException("오프셋 '%s'을(를) 숫자로 변환하는 데 실패했습니다: '%s'" % (line.offset, line.text))
-
-                # 이 라인에서 필요한 데이터의 시작은 offset + line_offset입니다.
-                # 데이터의 끝은 line.size 바이트 이후입니다.
-                start = offset + line_offset
-                end = start + line.size
-
-                # 라인에 패킹된 포맷 문자열이 있는 경우, 이를 언팩합니다.
-                if line.pkfmt:
-                    try:
-                        dvalue = struct.unpack(line.pkfmt, binwalk.core.compat.str2bytes(self.data[start:end]))[0]
-                    # self.data에 지정된 포맷 크기에 대해 충분한 바이트가 남아 있지 않음
-                    except struct.error:
-                        dvalue = 0
-                # 그렇지 않으면, 이것은 문자열입니다.
-                else:
-                    # 와일드카드 문자열의 경우 line.value == None입니다.
-                    if line.value is None:
-                        # 이 문자열의 크기가 알려져 있고 이전 시그니처 라인에서 지정된 경우 이를 확인합니다.
-                        if binwalk.core.compat.has_key(tags, 'strlen') and binwalk.core.compat.has_key(line.tags, 'string'):
-                            dvalue = self.data[start:(start + tags['strlen'])]
-                        # 그렇지 않으면, 문자열을 첫 번째 줄바꿈, 캐리지 리턴 또는 NULL 바이트에서 종료합니다.
-                        else:
-                            dvalue = self.data[start:end].split('\x00')[0].split('\r')[0].split('\n')[0]
-                    # 비 와일드카드 문자열의 경우, 시그니처 라인에서 지정된 알려진 길이를 가집니다.
-                    else:
-                        dvalue = self.data[start:end]
-
-                # 일부 정수 값에는 비교를 수행하기 전에 수행해야 하는 특수 연산이 있습니다
-                # (예: "belong&0x0000FFFF"). 복잡한 수식도 여기에 지원됩니다.
-                # if isinstance(dvalue, int) and line.operator:
-                if line.operator:
-                    try:
-                        # 이 시그니처 라인의 연산자 값이 정수 값인 경우 이를 사용합니다.
-                        if isinstance(line.opvalue, int):
-                            opval = line.opvalue
-                        # 그렇지 않은 경우, 복잡한 표현식을 평가합니다.
-                        else:
-                            opval = self._do_math(offset, line.opvalue)
-
-                        # 지정된 연산을 수행합니다.
-                        if line.operator == '**':
-                            dvalue **= opval
-                        elif line.operator == '<<':
-                            dvalue <<= opval
-                        elif line.operator == '>>':
-                            dvalue >>= opval
-                        elif line.operator == '&':
-                            dvalue &= opval
-                        elif line.operator == '|':
-                            dvalue |= opval
-                        elif line.operator == '*':
-                            dvalue *= opval
-                        elif line.operator == '+':
-                            dvalue += opval
-                        elif line.operator == '-':
-                            dvalue -= opval
-                        elif line.operator == '/':
-                            dvalue /= opval
-                        elif line.operator == '~':
-                            dvalue = ~opval
-                        elif line.operator == '^':
-                            dvalue ^= opval
-                    except KeyboardInterrupt:
-                        raise
-                    except Exception as e:
-                        raise ParserException("연산 '" +
-                                              str(dvalue) +
-                                              " " +
-                                              str(line.operator) +
-                                              "= " +
-                                              str(line.opvalue) +
-                                              "' 실패: " + str(e))
+            if level <= max_line_level:
+                match = evaluate(data, offset, previous_line_end, tags)
 
                 # 데이터 (dvalue)가 지정된 비교와 일치합니까?
-                if ((line.value is None) or
-                    (line.regex and line.value.match(dvalue)) or
-                    (line.condition == '=' and dvalue == line.value) or
-                    (line.condition == '>' and dvalue > line.value) or
-                    (line.condition == '<' and dvalue < line.value) or
-                    (line.condition == '!' and dvalue != line.value) or
-                    (line.condition == '~' and (dvalue == ~line.value)) or
-                    (line.condition == '^' and (dvalue ^ line.value)) or
-                    (line.condition == '&' and (dvalue & line.value)) or
-                        (line.condition == '|' and (dvalue | line.value))):
-
-                    # 이 시점까지, 날짜 필드는 정수 값으로 처리되지만,
-                    # 이를 멋지게 형식화된 문자열로 표시하고자 합니다.
-                    if line.type == 'date':
-                        try:
-                            ts = datetime.datetime.utcfromtimestamp(dvalue)
-                            dvalue = ts.strftime("%Y-%m-%d %H:%M:%S")
-                        except KeyboardInterrupt:
-                            raise
-                        except Exception:
-                            dvalue = "잘못된 타임스탬프"
-
-                    # 포맷 문자열에 대한 튜플을 생성합니다.
-                    dvalue_tuple = ()
-                    for _ in self.fmtstr.finditer(line.format):
-                        dvalue_tuple += (dvalue,)
-
-                    # 설명 문자열을 포맷합니다.
-                    desc = line.format % dvalue_tuple
-
-                    # 설명 문자열이 있는 경우 이를 설명 문자열 부분 목록에 추가합니다.
+                if match is not None:
+                    (line_offset, dvalue) = match
+
+                    # 설명 문자열을 포맷하고, 설명 문자열이 있는 경우 이를 설명 문자열 부분 목록에 추가합니다.
+                    desc = fmt % ((dvalue,) * fmt_arity)
                     if desc:
                         description.append(desc)
 
                     # 시그니처 라인에 지정된 태그 키워드를 처리합니다.
                     # 이 태그들은 원래 포맷 문자열에서 파싱되어 출력된 설명 문자열과 별도로 처리됩니다.
-                    for (tag_name, tag_value) in binwalk.core.compat.iterator(line.tags):
-                        # 태그 값이 문자열인 경우 이를 포맷하려고 시도합니다.
-                        if isinstance(tag_value, str):
-                            # 포맷 문자열에 대한 튜플을 생성합니다.
-                            dvalue_tuple = ()
-                            for _ in self.fmtstr.finditer(tag_value):
-                                dvalue_tuple += (dvalue,)
-
-                            # 태그 문자열을 포맷합니다.
-                            tags[tag_name] = tag_value % dvalue_tuple
-                        # 그렇지 않은 경우, 원시 태그 값을 사용합니다.
-                        else:
+                    for (tag_name, tag_value, tag_arity) in line_tags:
+                        if tag_arity is None:
                             tags[tag_name] = tag_value
+                        else:
+                            tags[tag_name] = tag_value % ((dvalue,) * tag_arity)
 
-                        # 일부 태그 값은 정수 값으로 변환되어야 하므로, 이를 시도합니다.
-                        try:
-                            tags[tag_name] = int(tags[tag_name], 0)
-                        except KeyboardInterrupt:
-                            raise
-                        except Exception:
-                            pass
+                            # 일부 태그 값은 정수 값으로 변환되어야 하므로, 이를 시도합니다.
+                            try:
+                                tags[tag_name] = int(tags[tag_name], 0)
+                            except KeyboardInterrupt:
+                                raise
+                            except Exception:
+                                pass
 
                     # 이 시그니처가 무효로 표시되면 처리 중단합니다, 
                     # 유효하지 않은 결과가 명시적으로 요청되지 않는 한 처리 중단합니다.
@@ -681,29 +1165,22 @@ class Magic(object):
                     if not self.show_invalid and tags['invalid']:
                         break
 
-                    # 시그니처의 다음 라인을 미리 봅니다. 
-                    # 이 라인의 들여쓰기 수준이 현재 라인보다 높으면, 
-                    # 현재 라인의 데이터 끝을 추적합니다. 
-                    # 이는 이후 라인에서 '>>&0' 오프셋 구문을 사용하여 이전 라인에서 상대적 오프셋을 지정할 수 있도록 합니다.
-                    try:
-                        next_line = signature.lines[n + 1]
-                        if next_line.level > line.level:
-                            if line.type == 'string':
-                                previous_line_end = line_offset + len(dvalue)
-                            else:
-                                previous_line_end = line_offset + line.size
-                    except IndexError:
-                        pass
+                    # 다음 라인이 이 라인의 데이터 끝을 기준으로 한 상대적 오프셋을 사용할 수 있도록 이를 추적합니다.
+                    if track_end:
+                        if is_string:
+                            previous_line_end = line_offset + len(dvalue)
+                        else:
+                            previous_line_end = line_offset + size
 
                     # 이 라인이 비교를 만족했다면, 최대 들여쓰기 수준을 +1 합니다.
-                    max_line_level = line.level + 1
+                    max_line_level = level + 1
                 else:
                     # 첫 번째 라인에서 일치하지 않으면 중단합니다.
-                    if line.level == 0:
+                    if level == 0:
                         break
                     else:
                         # 이 라인이 비교를 만족하지 않았다면, 더 높은 들여쓰기 수준은 허용되지 않습니다.
-                        max_line_level = line.level
+                        max_line_level = level
 
         # 형식화된 설명 문자열을 결합하고 백스페이스 문자 (및 앞의 문자)를 제거합니다.
         tags['description'] = self.bspace.sub('', " ".join(description))
@@ -733,55 +1210,306 @@ class Magic(object):
         '''
         데이터 블록에서 일치하는 시그니처를 스캔합니다.
 
-        @data - 스캔할 데이터 문자열입니다.
+        @data - 스캔할 데이터 문자열입니다 (str 또는 bytes).
         @dlen - 지정된 경우, 이 값을 초과하는 오프셋에서 시그니처를 무시합니다.
 
-        SignatureResult 객체 목록을 반환합니다.
+        오프셋 순서로 정렬된 SignatureResult 객체 목록을 반환합니다.
+        '''
+        return list(self.scan_iter(data, dlen))
+
+    def scan_iter(self, data, dlen=None):
+        '''
+        데이터 블록에서 일치하는 시그니처를 오프셋 순서로 하나씩 생성합니다 (참조: self.scan).
+
+        후보는 호출자가 다음 결과를 요청할 때 분석됩니다. 생성된 결과를 처리하는 동안 self.skip을 호출하면,
+        지정된 오프셋 이전의 나머지 후보는 분석되지 않습니다 (예: 시그니처 스캔의 jump).
+
+        @data - 스캔할 데이터 문자열입니다 (str 또는 bytes).
+        @dlen - 지정된 경우, 이 값을 초과하는 오프셋에서 시그니처를 무시합니다.
+
+        SignatureResult 객체를 생성하는 생성기를 반환합니다.
         '''
-        results = []
         matched_offsets = set()
 
+        candidates = self._candidates(data, dlen)
+        offsets = [candidate[0] for candidate in candidates]
+        self.skip_offset = 0
+
+        i = 0
+        while i < len(candidates):
+            (offset, rank, signature) = candidates[i]
+
+            # 건너뛰도록 요청된 오프셋 이전의 후보는 분석하지 않습니다 (참조: self.skip).
+            if offset < self.skip_offset:
+                i = bisect.bisect_left(offsets, self.skip_offset, i)
+                continue
+            i += 1
+
+            # 시그니처는 매직 바이트 길이에 따라 정렬됩니다 (가장 긴 것부터).
+            # 이 오프셋이 이전 시그니처와 이미 일치한 경우,
+            # self.show_invalid이 지정되지 않는 한 이를 무시합니다.
+            if offset not in matched_offsets or self.show_invalid:
+                # 이 오프셋에서 현재 시그니처 규칙을 사용하여 데이터를 분석합니다.
+                if self.stats is None:
+                    tags = self._analyze(signature, offset)
+                else:
+                    tags = self._timed_analyze(signature, offset)
+
+                # 시그니처가 유효하거나 유효하지 않은 결과가 요청된 경우, SignatureResult 객체를 생성합니다.
+                if (not tags['invalid'] or self.show_invalid) and not self._filtered(tags['description']):
+                    # 'once' 태그가 있는 결과는 한 번만 표시합니다.
+                    if tags['once']:
+                        if signature.title in self.display_once:
+                            continue
+                        else:
+                            self.display_once.add(signature.title)
+
+                    # 이 오프셋을 matched_offsets 세트에 추가하여, 이후 후보에서 무시되도록 합니다.
+                    matched_offsets.add(offset)
+
+                    yield SignatureResult(**tags)
+
+    def analyze(self, data, dlen=None):
+        '''
+        데이터 블록의 시그니처 후보를 미리 분석합니다.
+        분석 결과는 다른 프로세스로 전달하여 self.scan_analyzed로 결과를 생성할 수 있습니다.
+
+        건너뛰기 요청 (self.skip)과 'once' 태그는 결과를 생성하는 시점에 순서대로 적용되어야 하므로 여기서는 적용하지 않습니다.
+
+        @data - 스캔할 데이터 문자열입니다 (str 또는 bytes).
+        @dlen - 지정된 경우, 이 값을 초과하는 오프셋에서 시그니처를 무시합니다.
+
+        오프셋 순서로 정렬된 (오프셋, [태그 딕셔너리, ...]) 튜플 목록을 반환합니다.
+        각 목록은 self.scan_iter가 해당 오프셋에서 생성할 수 있는 결과의 태그를 시그니처 순위 순서로 포함합니다.
+        '''
+        analyzed = []
+
+        for (offset, rank, signature) in self._candidates(data, dlen):
+            if not analyzed or analyzed[-1][0] != offset:
+                analyzed.append((offset, []))
+            results = analyzed[-1][1]
+
+            # 'once' 태그가 없는 결과가 이미 있으면, self.scan_iter는 이 오프셋에서 다른 결과를 생성하지 않습니다.
+            # 'once' 태그가 있는 결과는 표시되지 않을 수 있으므로 다음 후보도 분석합니다.
+            if not self.show_invalid and [tags for tags in results if not tags['once']]:
+                continue
+
+            if self.stats is None:
+                tags = self._analyze(signature, offset)
+            else:
+                tags = self._timed_analyze(signature, offset)
+            if (not tags['invalid'] or self.show_invalid) and not self._filtered(tags['description']):
+                results.append(tags)
+
+        return [(offset, results) for (offset, results) in analyzed if results]
+
+    def scan_analyzed(self, analyzed):
+        '''
+        self.analyze로 분석된 데이터 블록에서 self.scan_iter와 동일한 결과를 생성합니다.
+        self.skip 및 'once' 태그는 self.scan_iter와 동일하게 적용됩니다.
+
+        @analyzed - self.analyze의 반환값.
+
+        SignatureResult 객체를 생성하는 생성기를 반환합니다.
+        '''
+        titles = dict([(signature.id, signature.title) for signature in self.signatures])
+        self.skip_offset = 0
+
+        for (offset, results) in analyzed:
+            for tags in results:
+                if offset < self.skip_offset:
+                    break
+
+                if tags['once']:
+                    if titles[tags['id']] in self.display_once:
+                        continue
+                    else:
+                        self.display_once.add(titles[tags['id']])
+
+                yield SignatureResult(**tags)
+
+                if not self.show_invalid:
+                    break
+
+    def _candidates(self, data, dlen=None):
+        '''
+        데이터 블록에서 모든 시그니처의 후보를 검색하고, 분석을 위해 self.data를 설정합니다.
+
+        @data - 스캔할 데이터 문자열입니다 (str 또는 bytes).
+        @dlen - 지정된 경우, 이 값을 초과하는 오프셋에서 시그니처를 무시합니다.
+
+        (오프셋, 순위, 시그니처) 튜플 목록을 반환합니다 (참조: SignatureMatcher.candidates).
+        '''
         # 데이터는 잠재적으로 매우 클 수 있으므로, 이를 클래스 속성을 통해 사용할 수 있도록 하여
         # 다른 메서드에 전달되지 않도록 합니다.
         self.data = data
+        self.binary = not isinstance(data, str)
 
         # dlen이 지정되지 않은 경우, self.data 전체를 검색합니다.
         if dlen is None:
             dlen = len(data)
 
-        for signature in self.signatures:
-            # 정규 표현식을 사용하여 데이터 블록에서 잠재적인 시그니처 일치를 검색합니다 (빠름).
-            for match in signature.regex.finditer(data):
-                # 시그니처의 시작 오프셋을 고려합니다.
-                offset = match.start() - signature.offset
+        # 시그니처 목록이 변경된 경우 결합된 매직 바이트 검색기를 다시 생성합니다.
+        if self.dirty:
+            self.matchers = {}
+            self.dirty = False
 
-                # 시그니처는 매직 바이트 길이에 따라 정렬됩니다 (가장 긴 것부터).
-                # 이 오프셋이 이전 시그니처와 이미 일치한 경우, 
-                # self.show_invalid이 지정되지 않는 한 이를 무시합니다. 
-                # 또한 명백히 유효하지 않은 오프셋 (<0) 및 self.data 범위 (dlen) 밖의 오프셋도 무시합니다.
-                if (offset not in matched_offsets or self.show_invalid) and 0 <= offset < dlen:
-                    # 이 오프셋에서 현재 시그니처 규칙을 사용하여 데이터를 분석합니다.
-                    tags = self._analyze(signature, offset)
+        try:
+            matcher = self.matchers[self.binary]
+        except KeyError:
+            matcher = self.matchers[self.binary] = SignatureMatcher(self.signatures, self.binary)
+
+        # 모든 시그니처의 잠재적인 일치를 데이터 블록에 대한 한 번의 검색으로 찾습니다 (빠름).
+        # 후보는 오프셋 순서로, 같은 오프셋에서는 시그니처 순위 순서로 반환됩니다.
+        candidates = matcher.candidates(data, dlen)
+
+        if self.stats is not None:
+            self.stats.candidates(candidates)
+
+        return candidates
+
+    def _timed_analyze(self, signature, offset):
+        '''
+        self._analyze와 동일하지만, 분석 시간과 결과를 self.stats에 기록합니다.
+        '''
+        start = time.time()
+        tags = self._analyze(signature, offset)
+        self.stats.analyzed(signature, time.time() - start, tags['invalid'])
+        return tags
+
+    def skip(self, offset):
+        '''
+        self.scan_iter가 지정된 오프셋 이전의 후보를 분석하지 않도록 합니다.
+
+        @offset - 현재 데이터 블록에서 다음 결과가 시작될 수 있는 최소 오프셋.
+
+        반환값은 없습니다.
+        '''
+        self.skip_offset = offset
+
+    def load_files(self, fnames, cache=None):
+        '''
+        여러 시그니처 파일에서 시그니처를 로드합니다.
+        캐시 디렉토리가 지정된 경우, 파싱된 시그니처는 이후 실행에서 파싱 없이 한 번에 로드됩니다.
+
+        캐시 파일의 이름은 입력 (시그니처 파일 경로와 include/exclude 필터)으로 정해지며 (참조: self._cache_name),
+        파일에는 시그니처 파일의 내용과 버전으로 계산된 키 (참조: self._cache_key)가 함께 저장됩니다.
+        시그니처 파일이나 binwalk/Python 버전이 바뀌면 키가 일치하지 않으므로 다시 파싱하여 같은 캐시 파일을 덮어씁니다.
+        따라서 캐시 디렉토리에는 사용된 입력 조합마다 하나의 파일만 남습니다.
+
+        @fnames - 시그니처 파일 경로 목록.
+        @cache  - 시그니처 캐시 디렉토리의 경로 (선택 사항).
+
+        반환값은 없습니다.
+        '''
+        if not cache:
+            for fname in fnames:
+                self.load(fname)
+            return
 
-                    # 시그니처가 유효하거나 유효하지 않은 결과가 요청된 경우, SignatureResult 객체를 생성하여 결과 목록에 추가합니다.
-                    if (not tags['invalid'] or self.show_invalid) and not self._filtered(tags['description']):
-                        # 'once' 태그가 있는 결과는 한 번만 표시합니다.
-                        if tags['once']:
-                            if signature.title in self.display_once:
-                                continue
-                            else:
-                                self.display_once.add(signature.title)
+        # 캐시 키를 계산할 수 없으면 (예: 시그니처 파일을 읽을 수 없음) 캐시 없이 로드합니다.
+        try:
+            cache_file = os.path.join(cache, "magic-%s.pickle" % self._cache_name(fnames))
+            cache_key = self._cache_key(fnames)
+        except KeyboardInterrupt as e:
+            raise e
+        except Exception as e:
+            binwalk.core.common.debug("시그니처 캐시 키를 계산하지 못했습니다: %s" % str(e))
+            return self.load_files(fnames)
 
-                        # 결과를 결과 목록에 추가합니다.
-                        results.append(SignatureResult(**tags))
+        try:
+            with open(cache_file, "rb") as fp:
+                (key, signatures) = pickle.load(fp)
+            if key == cache_key:
+                self._add_signatures(signatures)
+                return
+        except KeyboardInterrupt as e:
+            raise e
+        except Exception:
+            pass
 
-                        # 이 오프셋을 matched_offsets 세트에 추가하여, 이후 루프에서 무시되도록 합니다.
-                        matched_offsets.add(offset)
+        # 캐시된 시그니처가 이미 로드된 시그니처에 의존하지 않도록, 같은 필터를 가진 빈 Magic 인스턴스로 파싱합니다.
+        magic = Magic()
+        magic.includes = self.includes
+        magic.excludes = self.excludes
+        for fname in fnames:
+            magic.load(fname)
 
-        # 결과를 오프셋 순서로 정렬합니다.
-        results.sort(key=lambda x: x.offset, reverse=False)
+        try:
+            # 동시에 실행 중인 다른 binwalk 프로세스가 불완전한 캐시 파일을 읽지 않도록 원자적으로 교체합니다.
+            tmp_file = "%s.%d" % (cache_file, os.getpid())
+            with open(tmp_file, "wb") as fp:
+                pickle.dump((cache_key, magic.signatures), fp, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except KeyboardInterrupt as e:
+            raise e
+        except Exception as e:
+            binwalk.core.common.debug("시그니처 캐시 '%s'를 저장하지 못했습니다: %s" % (cache_file, str(e)))
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
 
-        return results
+        self._add_signatures(magic.signatures)
+
+    def _add_signatures(self, signatures):
+        '''
+        다른 Magic 인스턴스에서 파싱된 시그니처를 시그니처 목록에 추가합니다.
+
+        @signatures - ID가 0부터 시작하는 Signature 객체 목록.
+
+        반환값은 없습니다.
+        '''
+        # self.parse와 동일한 ID가 되도록, 이미 로드된 시그니처 뒤에서부터 ID를 할당합니다.
+        for signature in signatures:
+            signature.id += len(self.signatures)
+        self.signatures += signatures
+        self.signatures.sort(key=lambda x: x.confidence, reverse=True)
+        self.dirty = True
+
+    def _cache_name(self, fnames):
+        '''
+        시그니처 캐시 파일 이름의 키를 계산합니다. 시그니처 파일의 내용과 버전은 포함하지 않습니다 (참조: self._cache_key).
+
+        @fnames - 시그니처 파일 경로 목록.
+
+        시그니처 파일 경로와 include/exclude 필터에 대한 16진수 해시 문자열을 반환합니다.
+        '''
+        import hashlib
+
+        md5 = hashlib.md5()
+        for regex in self.includes:
+            md5.update(("include %s\n" % regex.pattern).encode('utf-8'))
+        for regex in self.excludes:
+            md5.update(("exclude %s\n" % regex.pattern).encode('utf-8'))
+        for fname in fnames:
+            md5.update(("file %s\n" % os.path.abspath(fname)).encode('utf-8', 'surrogateescape'))
+
+        return md5.hexdigest()
+
+    def _cache_key(self, fnames):
+        '''
+        시그니처 캐시 키를 계산합니다.
+
+        @fnames - 시그니처 파일 경로 목록.
+
+        시그니처 파일의 내용, include/exclude 필터, 캐시 형식 및 Python 버전에 대한 16진수 해시 문자열을 반환합니다.
+        '''
+        import hashlib
+
+        md5 = hashlib.md5()
+        md5.update(("%d %s %s\n" % (self.CACHE_VERSION, binwalk.core.version.__version__, sys.version)).encode('utf-8'))
+        for regex in self.includes:
+            md5.update(("include %s\n" % regex.pattern).encode('utf-8'))
+        for regex in self.excludes:
+            md5.update(("exclude %s\n" % regex.pattern).encode('utf-8'))
+        for fname in fnames:
+            with open(fname, "rb") as fp:
+                data = fp.read()
+            md5.update(("file %s %d\n" % (os.path.abspath(fname), len(data))).encode('utf-8', 'surrogateescape'))
+            md5.update(data)
+
+        return md5.hexdigest()
 
     def load(self, fname):
         '''
@@ -838,3 +1566,4 @@ class Magic(object):
 
         # 시그니처를 신뢰도(즉, 매직 바이트 길이)에 따라 정렬합니다. 가장 긴 것부터.
         self.signatures.sort(key=lambda x: x.confidence, reverse=True)
+        self.dirty = True
@@ -8,13 +8,15 @@ import sys
 import time
 import inspect
 import argparse
+import itertools
 import traceback
+from array import array
 from copy import copy
 import binwalk
-import binwalk.core.statuserver
 import binwalk.core.common
 import binwalk.core.settings
 import binwalk.core.plugin
+import binwalk.core.stats
 from binwalk.core.compat import *
 from binwalk.core.exceptions import *
 
@@ -103,7 +105,11 @@ class Dependency(object):
 class Result(object):
     '''
     스캔 결과를 저장하고 접근하기 위한 일반 클래스입니다.
+    기본 속성은 슬롯에 저장되며, 추가 kwargs 속성에만 __dict__가 사용됩니다.
     '''
+    FIELDS = ('offset', 'size', 'description', 'module', 'file', 'valid', 'display', 'extract', 'plot', 'name')
+
+    __slots__ = FIELDS + ('__dict__',)
 
     def __init__(self, **kwargs):
         '''
@@ -137,6 +143,163 @@ class Result(object):
         for (k, v) in iterator(kwargs):
             setattr(self, k, v)
 
+class ResultStore(object):
+    '''
+    모듈 결과를 속성별 열로 저장하는 목록입니다 (참조: Module.COMPACT_RESULTS).
+    정수 및 실수 값은 배열에, 설명 및 파일과 같은 그 밖의 값은 중복 없이 테이블에 저장됩니다.
+
+    항목을 가져올 때마다 저장된 값으로 새 결과 객체를 생성합니다.
+    따라서 가져온 결과를 수정해도 저장된 값은 바뀌지 않습니다.
+    '''
+    # 값 형식별 배열 형식 코드입니다. 그 밖의 값은 테이블 열에 저장됩니다.
+    TYPECODES = {bool: 'B', int: 'q', float: 'd'}
+
+    def __init__(self, results=[]):
+        self.count = 0
+        # 속성 이름별 열 목록과, 결과 클래스별 속성 이름 목록입니다.
+        self.columns = {}
+        self.classes = _ResultColumn(0)
+        self.class_fields = {}
+
+        self.extend(results)
+
+    def append(self, r):
+        cls = r.__class__
+        try:
+            fields = self.class_fields[cls]
+        except KeyError:
+            fields = self.class_fields[cls] = _result_fields(cls)
+
+        self.classes.append(cls)
+
+        names = fields + tuple(getattr(r, '__dict__', ()))
+        for name in names:
+            try:
+                column = self.columns[name]
+            except KeyError:
+                column = self.columns[name] = _ResultColumn(self.count)
+            column.append(getattr(r, name, _ResultColumn.MISSING))
+
+        self.count += 1
+
+        # 이 결과에 없는 속성의 열을 채웁니다.
+        if len(self.columns) > len(names):
+            for column in self.columns.values():
+                if len(column) < self.count:
+                    column.append(_ResultColumn.MISSING)
+
+    def extend(self, results):
+        for r in results:
+            self.append(r)
+
+    def __iadd__(self, results):
+        self.extend(results)
+        return self
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for i in range(0, self.count):
+            yield self._result(i)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._result(j) for j in range(*i.indices(self.count))]
+
+        if i < 0:
+            i += self.count
+        if i < 0 or i >= self.count:
+            raise IndexError("ResultStore 인덱스가 범위를 벗어났습니다")
+
+        return self._result(i)
+
+    def _result(self, i):
+        cls = self.classes[i]
+        r = cls.__new__(cls)
+
+        for (name, column) in iterator(self.columns):
+            value = column[i]
+            if value is not _ResultColumn.MISSING:
+                setattr(r, name, value)
+
+        return r
+
+class _ResultColumn(object):
+    '''
+    ResultStore의 속성 하나에 대한 값 목록입니다.
+    첫 번째 값의 형식이 ResultStore.TYPECODES에 있으면 배열에, 그렇지 않으면 중복 없는 값 테이블의 인덱스로 저장됩니다.
+    배열에 저장할 수 없는 값이 추가되면 테이블 열로 변환됩니다.
+    '''
+    # 결과에 해당 속성이 없음을 나타내는 값입니다.
+    MISSING = object()
+
+    def __init__(self, count):
+        self.values = None
+        self.table = None
+        self.index = None
+
+        if count:
+            self._to_table([self.MISSING] * count)
+
+    def _to_table(self, values):
+        self.table = []
+        self.index = {}
+        self.values = array('I')
+        for value in values:
+            self._append_table(value)
+
+    def _append_table(self, value):
+        try:
+            i = self.index[value]
+        except KeyError:
+            i = self.index[value] = len(self.table)
+            self.table.append(value)
+        except TypeError:
+            # 해시할 수 없는 값은 중복 제거 없이 저장합니다.
+            i = len(self.table)
+            self.table.append(value)
+        self.values.append(i)
+
+    def append(self, value):
+        if self.values is None:
+            typecode = ResultStore.TYPECODES.get(type(value))
+            if typecode is None:
+                self._to_table([])
+            else:
+                self.values = array(typecode)
+
+        if self.table is None:
+            if ResultStore.TYPECODES.get(type(value)) == self.values.typecode:
+                try:
+                    self.values.append(value)
+                    return
+                except OverflowError:
+                    pass
+            self._to_table([self[i] for i in range(0, len(self))])
+
+        self._append_table(value)
+
+    def __len__(self):
+        return len(self.values) if self.values is not None else 0
+
+    def __getitem__(self, i):
+        if self.table is None:
+            value = self.values[i]
+            return bool(value) if self.values.typecode == 'B' else value
+        return self.table[self.values[i]]
+
+def _result_fields(cls):
+    '''
+    결과 클래스와 상위 클래스의 __slots__에 선언된 속성 이름을 반환합니다.
+    '''
+    fields = []
+    for c in reversed(cls.__mro__):
+        for name in c.__dict__.get('__slots__', ()):
+            if name not in ['__dict__', '__weakref__'] and name not in fields:
+                fields.append(name)
+    return tuple(fields)
+
 class Error(Result):
     '''
     binwalk.core.module.Result의 하위 클래스입니다.
@@ -217,9 +380,17 @@ class Module(object):
     # 주 모듈이 아닌 경우 False로 설정합니다 (예: General, Extractor 모듈).
     PRIMARY = True
 
+    # 모듈이 bytes 데이터 블록을 처리할 수 있는 경우 True로 설정합니다.
+    # 사용자가 bytes 모드(--binary)를 요청하면, 이 모듈의 대상 파일은 bytes를 반환하는 BlockFile로 열립니다.
+    BINARY = False
+
+    # 결과가 많은 모듈 (예: Entropy)은 True로 설정합니다.
+    # self.results는 결과 객체 목록 대신 결과를 속성별 열로 저장하는 binwalk.core.module.ResultStore가 됩니다.
+    COMPACT_RESULTS = False
+
     def __init__(self, parent, **kwargs):
         self.errors = []
-        self.results = []
+        self.results = self._new_results()
 
         self.parent = parent
         self.target_file_list = []
@@ -376,6 +547,8 @@ class Module(object):
             except Exception:
                 pass
 
+        self.parent.check_stopped()
+
         # 대기 중인 추출된 파일을 target_files 목록에 추가하고 추출기의 대기 파일 목록을 재설정합니다.
         self.target_file_list += self.extractor.pending
 
@@ -388,7 +561,7 @@ class Module(object):
 
             # self.target_file_list의 값은 이미 열려 있는 파일(BlockFile 인스턴스) 또는 스캔을 위해 열어야 하는 파일 경로입니다.
             if isinstance(next_target_file, (str, unicode)):
-                fp = self.config.open_file(next_target_file)
+                fp = self.config.open_file(next_target_file, binary=(self.BINARY and self.config.binary))
             else:
                 fp = next_target_file
 
@@ -422,10 +595,15 @@ class Module(object):
         결과와 오류 목록을 초기화합니다.
         '''
         if results:
-            self.results = []
+            self.results = self._new_results()
         if errors:
             self.errors = []
 
+    def _new_results(self):
+        if self.COMPACT_RESULTS:
+            return ResultStore()
+        return []
+
     def result(self, r=None, **kwargs):
         '''
         결과를 검증하고 self.results에 저장하며 출력합니다.
@@ -435,6 +613,8 @@ class Module(object):
 
         반환 값은 binwalk.core.module.Result의 인스턴스입니다.
         '''
+        self.parent.check_stopped()
+
         if r is None:
             r = Result(**kwargs)
 
@@ -460,7 +640,8 @@ class Module(object):
                 continue
 
         if r.valid:
-            self.results.append(r)
+            if self.parent.keep_results:
+                self.results.append(r)
 
             if r.display:
                 display_args = self._build_display_args(r)
@@ -468,6 +649,9 @@ class Module(object):
                     self.config.display.format_strings(self.HEADER_FORMAT, self.RESULT_FORMAT)
                     self.config.display.result(*display_args)
 
+            if self.parent.result_handler is not None:
+                self.parent.result_handler(self.name, r)
+
         return r
 
     def error(self, **kwargs):
@@ -542,7 +726,8 @@ class Module(object):
         self.reset_dependencies()
 
         try:
-            self.init()
+            with self._timer('init'):
+                self.init()
         except KeyboardInterrupt:
             raise
         except Exception as e:
@@ -557,20 +742,29 @@ class Module(object):
             self.error(exception=e)
             return False
 
-        self._plugins_pre_scan()
+        with self._timer('pre_scan'):
+            self._plugins_pre_scan()
 
         try:
-            retval = self.run()
+            with self._timer('run'):
+                retval = self.run()
         except KeyboardInterrupt:
             raise
         except Exception as e:
             self.error(exception=e)
             return False
 
-        self._plugins_post_scan()
+        with self._timer('post_scan'):
+            self._plugins_post_scan()
 
         return retval
 
+    def _timer(self, phase):
+        '''
+        self.main 단계의 실행 시간을 측정하는 컨텍스트 관리자를 반환합니다 (참조: binwalk.core.stats).
+        '''
+        return binwalk.core.stats.timer(self.parent.stats, 'modules', "%s.%s" % (self.name, phase))
+
 class Status(object):
     '''
     모듈 상태를 추적하는 클래스(예: 완료 %).
@@ -588,6 +782,8 @@ class Modules(object):
     '''
     모듈 실행 및 관리에 사용되는 주요 클래스입니다.
     '''
+    # 병렬 스캔 (--jobs) 시 작업자 프로세스당 생성할 작업 수입니다 (참조: self._execute_parallel).
+    PARALLEL_TASKS_PER_JOB = 4
 
     def __init__(self, *argv, **kargv):
         '''
@@ -600,10 +796,23 @@ class Modules(object):
         '''
         self.arguments = []
         self.executed_modules = {}
+        # 모듈 클래스별로 로드된 의존성 모듈의 (kwargs, 인스턴스) 목록입니다 (참조: self._load_dependency).
         self.default_dependency_modules = {}
         self.status = Status(completed=0, total=0, fp=None, running=False, shutdown=False, finished=False)
         self.status_server_started = False
         self.status_service = None
+        # 발견된 모듈 클래스 목록과 명령 줄 인수별 파싱 결과입니다 (참조: self.list, self.argv).
+        self.discovered_modules = None
+        self.parsed_arguments = {}
+        # 유효한 결과를 module.results에 저장할지 여부와, 유효한 결과마다 (모듈 이름, 결과)로 호출되는 함수입니다 (참조: self.execute_iter).
+        self.keep_results = True
+        self.result_handler = None
+        # 스캔 대상으로 등록된 메모리 버퍼 이름입니다 (참조: self._register_buffers).
+        self.buffer_names = []
+        # 설정되면 실행 중인 스캔을 중단하는 threading.Event입니다 (참조: self.check_stopped).
+        self.stop_event = None
+        # --stats-file이 지정된 경우 self.execute 실행의 성능 통계를 수집하는 binwalk.core.stats.Stats 인스턴스입니다.
+        self.stats = None
 
         self._set_arguments(list(argv), kargv)
 
@@ -612,6 +821,10 @@ class Modules(object):
             self.status_service.server.socket.shutdown(1)
             self.status_service.server.socket.close()
 
+        for name in self.buffer_names:
+            binwalk.core.common.BufferFile.unregister(name)
+        self.buffer_names = []
+
     def __enter__(self):
         return self
 
@@ -619,6 +832,11 @@ class Modules(object):
         self.cleanup()
 
     def _set_arguments(self, argv=None, kargv=None):
+        # 메모리 버퍼 대상은 명령 줄 인수로 전달할 수 없으므로, 등록된 버퍼 이름을 대상 파일로 지정합니다.
+        if kargv and has_key(kargv, 'data'):
+            kargv = dict(kargv)
+            argv += self._register_buffers(kargv.pop('data')) + ['--buffer']
+
         if kargv:
             for (k, v) in iterator(kargv):
                     k = self._parse_api_opt(k)
@@ -640,6 +858,47 @@ class Modules(object):
         elif argv:
             self.arguments = argv
 
+    def _register_buffers(self, data):
+        '''
+        메모리 버퍼를 스캔 대상으로 등록합니다 (참조: binwalk.core.common.BufferFile).
+        등록된 버퍼는 self.cleanup에서 해제됩니다.
+
+        @data - bytes, bytearray 또는 memoryview 객체, 그러한 객체의 목록, 또는 {이름: 객체} 사전.
+                이름이 지정되지 않은 버퍼는 프로세스 내에서 고유한 이름 (data-N)으로 등록됩니다.
+                이름은 등록할 때 현재 작업 디렉터리를 기준으로 한 절대 경로로 고정됩니다.
+
+        등록된 버퍼 이름 목록을 반환합니다.
+        '''
+        if isinstance(data, dict):
+            buffers = list(iterator(data))
+        else:
+            if not isinstance(data, (list, tuple)):
+                data = [data]
+            buffers = [("data-%d" % next(_BUFFER_IDS), buf) for buf in data]
+
+        names = []
+        for (name, buf) in buffers:
+            name = os.path.abspath(name)
+            if binwalk.core.common.BufferFile.lookup(name) is not None:
+                raise ModuleException("버퍼 이름 '%s'은(는) 이미 사용 중입니다" % name)
+            binwalk.core.common.BufferFile.register(name, buf)
+            self.buffer_names.append(name)
+            names.append(name)
+
+        return names
+
+    def check_stopped(self):
+        '''
+        self.stop_event가 설정된 경우 ScanStoppedException을 발생시켜 실행 중인 스캔을 중단합니다.
+        모듈은 결과를 보고하거나 다음 파일을 열 때 이 메서드를 호출합니다.
+        결과 없이 오래 실행될 수 있는 루프 (예: RawCompression의 오프셋별 압축 해제, 디스어셈블리 스캔, 엔트로피 피라미드 생성,
+        외부 추출기 프로세스 대기)에서도 호출하여, 중단 요청이 스캔의 끝까지 지연되지 않도록 합니다.
+
+        반환 값은 없습니다.
+        '''
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise ScanStoppedException()
+
     def _parse_api_opt(self, opt):
         # 인수가 이미 하이픈으로 시작하면 앞에 하이픈을 추가하지 않습니다.
         if opt.startswith('-'):
@@ -647,8 +906,9 @@ class Modules(object):
         # 짧은 옵션은 1자입니다.
         elif len(opt) == 1:
             return '-' + opt
+        # 긴 옵션 이름의 하이픈은 키워드 인수에서 밑줄로 지정할 수 있습니다 (예: stats_file=은 --stats-file).
         else:
-            return '--' + opt
+            return '--' + opt.replace('_', '-')
 
     def list(self, attribute="run"):
         '''
@@ -658,13 +918,31 @@ class Modules(object):
 
         지정된 속성을 포함하는 모듈 목록을 반환합니다.
         '''
-        import binwalk.modules
         modules = {}
 
-        for (name, module) in inspect.getmembers(binwalk.modules):
-            if inspect.isclass(module) and hasattr(module, attribute):
+        for module in self._discover():
+            if hasattr(module, attribute):
                 modules[module] = module.PRIORITY
 
+        return sorted(modules, key=modules.get, reverse=True)
+
+    def _discover(self):
+        '''
+        binwalk.modules 및 사용자 정의 모듈 디렉토리의 모든 클래스를 찾습니다.
+        사용자 정의 모듈은 Modules 인스턴스당 한 번만 로드됩니다.
+
+        클래스 목록을 반환합니다.
+        '''
+        if self.discovered_modules is not None:
+            return self.discovered_modules
+
+        import binwalk.modules
+        modules = []
+
+        for (name, module) in inspect.getmembers(binwalk.modules):
+            if inspect.isclass(module):
+                modules.append(module)
+
         # 사용자 정의 모듈
         import imp
         user_modules = binwalk.core.settings.Settings().user.modules
@@ -678,12 +956,14 @@ class Modules(object):
                 raise
             except Exception as e:
                 binwalk.core.common.warning("모듈 '%s' 로드 중 오류 발생: %s" % (file_name, str(e)))
+                continue
 
             for (name, module) in inspect.getmembers(user_module):
-                if inspect.isclass(module) and hasattr(module, attribute):
-                    modules[module] = module.PRIORITY
+                if inspect.isclass(module):
+                    modules.append(module)
 
-        return sorted(modules, key=modules.get, reverse=True)
+        self.discovered_modules = modules
+        return modules
 
     def help(self):
         '''
@@ -739,26 +1019,217 @@ class Modules(object):
         if args or kwargs:
             self._set_arguments(list(args), kwargs)
 
-        # 모든 모듈 실행
-        for module in self.list():
-            obj = self.run(module)
+        # 의존성 모듈 인스턴스는 실행마다 새로 로드합니다.
+        self.default_dependency_modules = {}
+
+        (jobs, files, log_file, stats_file) = self._execute_options()
+
+        # --stats-file이 지정된 경우 이 실행의 성능 통계를 수집합니다.
+        if stats_file:
+            self.stats = binwalk.core.stats.Stats()
+        else:
+            self.stats = None
+
+        # --jobs가 지정되고 대상 파일이 여러 개인 경우, 대상 파일을 작업자 프로세스에 나누어 스캔합니다.
+        if jobs > 1 and len(files) > 1:
+            run_modules = self._execute_parallel(jobs, files, log_file)
+        else:
+            # 모든 모듈 실행
+            for module in self.list():
+                obj = self.run(module)
 
-        # enabled로 표시된 모든 모듈을 run_modules 목록에 추가합니다.
-        for (module, obj) in iterator(self.executed_modules):
-            # 모듈이 활성화되었으며 기본 모듈이거나 결과/오류를 보고한 경우
-            if obj.enabled and (obj.PRIMARY or obj.results or obj.errors):
-                run_modules.append(obj)
+            # enabled로 표시된 모든 모듈을 run_modules 목록에 추가합니다.
+            for (module, obj) in iterator(self.executed_modules):
+                # 모듈이 활성화되었으며 기본 모듈이거나 결과/오류를 보고한 경우
+                if obj.enabled and (obj.PRIMARY or obj.results or obj.errors):
+                    run_modules.append(obj)
+
+        if self.stats is not None:
+            self.stats.save(stats_file)
 
         self.arguments = orig_arguments
 
         return run_modules
 
+    def execute_iter(self, *args, **kwargs):
+        '''
+        self.execute와 같이 모듈을 실행하지만, 모듈은 별도의 스레드에서 실행되며
+        유효한 결과는 Module.result에서 검증되는 즉시 생성됩니다.
+
+        @keep_results - False인 경우 결과를 module.results에 저장하지 않습니다 (기본값: True).
+        @queue_size   - 소비되지 않은 결과의 최대 개수입니다 (기본값: 1024).
+                        대기 중인 결과가 이 개수에 도달하면, 스캔은 결과가 소비될 때까지 대기합니다.
+
+        그 외의 args/kwargs는 self.execute와 동일합니다.
+        스캔 중 발생한 예외는 이 생성기에서 다시 발생합니다.
+
+        생성기를 닫으면 (break 또는 close()) self.stop_event를 설정하고 스캔 스레드가 끝날 때까지 대기합니다.
+        스캔 스레드는 다음 self.check_stopped 호출에서 중단되며, 모듈은 오래 실행되는 루프에서도 이를 호출하므로
+        (외부 추출기와 추출기가 생성한 프로세스는 프로세스 그룹 단위로 종료됩니다) 대기 시간은 스캔의 남은 시간이 아니라 루프 한 번의 시간으로 제한됩니다.
+
+        (모듈 이름, binwalk.core.module.Result) 튜플을 생성합니다.
+        '''
+        import threading
+        try:
+            import queue
+        except ImportError:
+            import Queue as queue
+
+        self.keep_results = kwargs.pop('keep_results', True)
+        pending = queue.Queue(kwargs.pop('queue_size', 1024))
+        stopped = self.stop_event = threading.Event()
+        # 스캔 종료를 알리는 모듈 이름입니다. 결과 대신 발생한 예외 (또는 None)가 전달됩니다.
+        finished = object()
+
+        def put(item):
+            # 소비자가 중단하면 스캔 스레드를 종료합니다.
+            while True:
+                if stopped.is_set():
+                    raise ScanStoppedException()
+                try:
+                    pending.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def scan():
+            try:
+                self.execute(*args, **kwargs)
+                put((finished, None))
+            except ScanStoppedException:
+                pass
+            except BaseException as e:
+                try:
+                    put((finished, e))
+                except ScanStoppedException:
+                    pass
+
+        self.result_handler = lambda name, r: put((name, r))
+        thread = threading.Thread(target=scan)
+        thread.daemon = True
+        thread.start()
+
+        try:
+            while True:
+                (name, r) = pending.get()
+                if name is finished:
+                    if r is not None:
+                        raise r
+                    break
+                yield (name, r)
+        finally:
+            stopped.set()
+            thread.join()
+            self.result_handler = None
+            self.keep_results = True
+            self.stop_event = None
+
+    def _execute_options(self):
+        '''
+        병렬 스캔 및 통계 수집에 필요한 General 모듈의 옵션을 가져옵니다.
+
+        (작업자 프로세스 수, 대상 파일 목록, 로그 파일 경로, 통계 파일 경로)의 튜플을 반환합니다.
+        '''
+        import binwalk.modules
+
+        kwargs = self.argv(binwalk.modules.General, argv=self.arguments)
+
+        # General 모듈과 마찬가지로 디렉토리는 무시합니다.
+        files = [fname for fname in kwargs.get('files', []) if not os.path.isdir(fname)]
+
+        return (kwargs.get('jobs', 1), files, kwargs.get('log_file', None), kwargs.get('stats_file', None))
+
+    def _execute_parallel(self, jobs, files, log_file=None):
+        '''
+        대상 파일을 작업자 프로세스에 나누어 스캔합니다.
+        작업자의 화면 출력, 로그 파일 출력, 결과 및 오류는 대상 파일 순서대로 수집됩니다.
+
+        @jobs     - 작업자 프로세스 수.
+        @files    - 대상 파일 목록.
+        @log_file - 로그 파일 경로 (선택 사항).
+
+        실행된 모듈 객체 목록을 반환합니다. 이 모듈 객체에는 결과 및 오류만 포함됩니다.
+        '''
+        import multiprocessing
+
+        # 대상 파일을 제외한 명령 줄 인수는 모든 작업자에게 동일하게 전달됩니다.
+        # 대상 파일은 명령 줄 인수의 끝에 오므로, 각 파일의 마지막 항목을 제거합니다.
+        argv = list(self.arguments)
+        for fname in files:
+            del argv[len(argv) - 1 - argv[::-1].index(fname)]
+
+        # 작업자는 하나의 파일만 스캔하므로, 여러 파일을 스캔할 때 활성화되는 자세한 출력을 명시적으로 지정합니다.
+        # 상태 서버는 하나의 포트만 사용할 수 있으므로 작업자에서는 시작하지 않습니다.
+        argv += ['--jobs', '1', '--status', '0', '--verbose']
+
+        modules = {}
+        module_classes = dict([(module.__name__, module) for module in self.list()])
+
+        # 모듈 로드 비용을 줄이기 위해, 각 작업자 작업은 연속된 여러 대상 파일을 스캔합니다.
+        # 작업 결과는 작업 순서대로 수집되므로 출력은 대상 파일 순서를 유지합니다.
+        size = max(1, len(files) // (jobs * self.PARALLEL_TASKS_PER_JOB))
+        tasks = [(argv + files[i:i + size], bool(log_file), self.stats is not None) for i in range(0, len(files), size)]
+
+        pool = multiprocessing.Pool(jobs, _parallel_worker_init)
+        try:
+            for (output, log, stats, summary, exception) in pool.imap(_parallel_worker, tasks):
+                for (fd, data) in zip([sys.stdout, sys.stderr], output):
+                    fd.write(data)
+                    fd.flush()
+
+                if log:
+                    with open(log_file, "a") as fp:
+                        fp.write(log)
+
+                if stats:
+                    self.stats.merge(stats)
+
+                if exception is not None:
+                    raise exception
+
+                for (name, results, errors) in summary:
+                    module = module_classes[name]
+
+                    # 작업자의 모듈 객체는 전달할 수 없으므로, 결과와 오류만 가진 모듈 객체를 생성합니다.
+                    if not has_key(modules, module):
+                        obj = module.__new__(module)
+                        obj.name = name
+                        obj.enabled = True
+                        obj.clear()
+                        modules[module] = obj
+
+                    if self.keep_results:
+                        modules[module].results += results
+                    modules[module].errors += errors
+
+                    if self.result_handler is not None:
+                        for r in results:
+                            self.result_handler(name, r)
+            pool.close()
+        except (KeyboardInterrupt, Exception):
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+        # 모듈 실행 순서대로 반환합니다.
+        run_modules = []
+        for module in self.list():
+            if has_key(modules, module):
+                self.executed_modules[module] = modules[module]
+                run_modules.append(modules[module])
+
+        return run_modules
+
     def run(self, module, dependency=False, kwargs={}):
         '''
         특정 모듈을 실행합니다.
         '''
         try:
-            obj = self.load(module, kwargs)
+            if dependency:
+                obj = self._load_dependency(module, kwargs)
+            else:
+                obj = self.load(module, kwargs)
 
             if isinstance(obj, binwalk.core.module.Module) and obj.enabled:
                 obj.main()
@@ -788,6 +1259,27 @@ class Modules(object):
         argv.update(self.dependencies(module, argv['enabled']))
         return module(self, **argv)
 
+    def _load_dependency(self, module, kwargs={}):
+        '''
+        의존성 모듈을 로드합니다.
+        같은 클래스와 kwargs의 의존성 모듈은 self.execute 실행당 한 번만 로드되어 모든 모듈이 공유하며,
+        각 주 모듈이 시작될 때 Module.reset이 호출됩니다 (참조: Module.reset_dependencies).
+
+        @module - 로드할 모듈 클래스입니다.
+        @kwargs - 의존성 선언에 지정된 kwargs입니다.
+
+        모듈 인스턴스를 반환합니다.
+        '''
+        loaded = self.default_dependency_modules.setdefault(module, [])
+
+        for (dependency_kwargs, obj) in loaded:
+            if dependency_kwargs == kwargs:
+                return obj
+
+        obj = self.load(module, kwargs)
+        loaded.append((dict(kwargs), obj))
+        return obj
+
     def dependencies(self, module, module_enabled):
         import binwalk.modules
         attributes = {}
@@ -827,32 +1319,8 @@ class Modules(object):
         '''
         kwargs = {'enabled': False}
         last_priority = {}
-        parser = argparse.ArgumentParser(add_help=False)
-        parser.short_to_long = {}
-
-        for m in self.list(attribute="CLI"):
-            for module_option in m.CLI:
-                parser_args = []
-                parser_kwargs = {}
-
-                if not module_option.long:
-                    continue
-
-                if module_option.short:
-                    parser_args.append('-' + module_option.short)
-                parser_args.append('--' + module_option.long)
-                parser_kwargs['dest'] = module_option.long
-
-                if module_option.type is None:
-                    parser_kwargs['action'] = 'store_true'
-                elif module_option.type == list:
-                    parser_kwargs['action'] = 'append'
-                    parser.short_to_long[module_option.short] = module_option.long
 
-                parser.add_argument(*parser_args, **parser_kwargs)
-
-        args, unknown = parser.parse_known_args(argv)
-        args = args.__dict__
+        (args, unknown) = self._parse_arguments(argv)
 
         for module_option in module.CLI:
             if module_option.type == binwalk.core.common.BlockFile:
@@ -872,6 +1340,49 @@ class Modules(object):
         binwalk.core.common.debug("%s :: %s => %s" % (module.TITLE, str(argv), str(kwargs)))
         return kwargs
 
+    def _parse_arguments(self, argv):
+        '''
+        모든 모듈의 명령 줄 옵션으로 명령 줄 인수를 파싱합니다.
+        같은 명령 줄 인수에 대한 파싱 결과는 Modules 인스턴스 내에서 재사용됩니다.
+
+        @argv - 명령 줄 인수 목록입니다(argv[0]을 제외한).
+
+        (옵션 이름과 값의 딕셔너리, 알 수 없는 인수 목록) 튜플을 반환합니다.
+        '''
+        key = tuple(argv)
+
+        if not has_key(self.parsed_arguments, key):
+            parser = argparse.ArgumentParser(add_help=False)
+            parser.short_to_long = {}
+
+            for m in self.list(attribute="CLI"):
+                for module_option in m.CLI:
+                    parser_args = []
+                    parser_kwargs = {}
+
+                    if not module_option.long:
+                        continue
+
+                    if module_option.short:
+                        parser_args.append('-' + module_option.short)
+                    parser_args.append('--' + module_option.long)
+                    parser_kwargs['dest'] = module_option.long
+
+                    if module_option.type is None:
+                        parser_kwargs['action'] = 'store_true'
+                    elif module_option.type == list:
+                        parser_kwargs['action'] = 'append'
+                        parser.short_to_long[module_option.short] = module_option.long
+
+                    parser.add_argument(*parser_args, **parser_kwargs)
+
+            (args, unknown) = parser.parse_known_args(argv)
+            self.parsed_arguments[key] = (args.__dict__, unknown)
+
+        # 모듈이 옵션 값 (예: 리스트)을 수정할 수 있으므로 복사본을 반환합니다.
+        (args, unknown) = self.parsed_arguments[key]
+        return (dict([(k, copy(v)) for (k, v) in iterator(args)]), list(unknown))
+
     def kwargs(self, obj, kwargs):
         '''
         모듈의 kwargs를 처리합니다. 모든 모듈은 이 메서드를 사용하여 kwarg 처리를 해야 합니다.
@@ -903,10 +1414,105 @@ class Modules(object):
         if not self.status_server_started:
             self.status_server_started = True
             try:
+                import binwalk.core.statuserver
                 self.status_service = binwalk.core.statuserver.StatusServer(port, self)
             except Exception as e:
                 binwalk.core.common.warning("포트 %d에서 상태 서버를 시작하지 못했습니다: %s" % (port, str(e)))
 
+# 이름이 지정되지 않은 메모리 버퍼의 일련 번호 (참조: Modules._register_buffers)
+_BUFFER_IDS = itertools.count()
+
+def _parallel_worker_init():
+    '''
+    병렬 스캔 작업자 프로세스를 초기화합니다 (참조: Modules._execute_parallel).
+    Ctrl+C는 부모 프로세스에서만 처리합니다.
+    '''
+    import signal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _parallel_worker(task):
+    '''
+    작업자 프로세스에서 대상 파일에 대해 모듈을 실행합니다 (참조: Modules._execute_parallel).
+
+    @task - (대상 파일을 포함한 명령 줄 인수 목록, 로그 파일 출력 여부, 통계 수집 여부)의 튜플.
+
+    ((stdout 출력, stderr 출력), 로그 파일 출력, 통계 (Stats.report), [(모듈 이름, 결과 목록, 오류 목록), ...], 예외)의 튜플을 반환합니다.
+    '''
+    import json
+    import tempfile
+
+    (argv, log, stats) = task
+    argv = list(argv)
+    log_data = ''
+    log_file = None
+    stats_data = None
+    stats_file = None
+    summary = []
+    exception = None
+
+    if log:
+        (fd, log_file) = tempfile.mkstemp(prefix='binwalk-')
+        os.close(fd)
+        argv += ['--log', log_file]
+
+    if stats:
+        (fd, stats_file) = tempfile.mkstemp(prefix='binwalk-')
+        os.close(fd)
+        argv += ['--stats-file', stats_file]
+
+    (stdout, stderr) = (sys.stdout, sys.stderr)
+    sys.stdout = io.StringIO()
+    sys.stderr = io.StringIO()
+
+    try:
+        with Modules(*argv) as m:
+            for obj in m.execute():
+                summary.append((obj.name,
+                                [_portable_result(r) for r in obj.results],
+                                [_portable_result(e) for e in obj.errors]))
+    except Exception as e:
+        exception = e
+    finally:
+        output = (sys.stdout.getvalue(), sys.stderr.getvalue())
+        (sys.stdout, sys.stderr) = (stdout, stderr)
+
+    if log_file:
+        with open(log_file, "r") as fp:
+            log_data = fp.read()
+        os.unlink(log_file)
+
+    if stats_file:
+        try:
+            with open(stats_file, "r") as fp:
+                stats_data = json.load(fp)
+        except ValueError:
+            pass
+        os.unlink(stats_file)
+
+    return (output, log_data, stats_data, summary, exception)
+
+def _portable_result(r):
+    '''
+    다른 프로세스로 전달할 수 있도록 결과의 복사본을 생성합니다.
+    열린 파일 객체 (예: r.file)는 파일 정보만 가진 binwalk.core.common.GenericContainer로 대체됩니다.
+
+    @r - binwalk.core.module.Result의 인스턴스.
+
+    결과의 복사본을 반환합니다.
+    '''
+    r = copy(r)
+
+    for k in _result_fields(r.__class__) + tuple(getattr(r, '__dict__', ())):
+        v = getattr(r, k, None)
+        if isinstance(v, io.IOBase) or hasattr(v, 'read_block'):
+            setattr(r, k, binwalk.core.common.GenericContainer(name=getattr(v, 'name', None),
+                                                               path=getattr(v, 'path', None),
+                                                               size=getattr(v, 'size', 0),
+                                                               offset=getattr(v, 'offset', 0),
+                                                               length=getattr(v, 'length', 0)))
+
+    return r
+
 def process_kwargs(obj, kwargs):
     '''
     binwalk.core.module.Modules.kwargs의 편의 래퍼입니다.
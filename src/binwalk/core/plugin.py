@@ -2,6 +2,7 @@
 
 import os
 import imp
+import time
 import inspect
 import binwalk.core.common
 import binwalk.core.settings
@@ -17,6 +18,16 @@ class Plugin(object):
     # 모듈 이름이 지정되지 않은 경우, 플러그인은 모든 모듈에 대해 로드됩니다.
     MODULES = []
 
+    # 플러그인이 bytes 데이터를 처리할 수 있는 경우 True로 설정합니다.
+    # 그렇지 않은 경우, bytes 모드(--binary)에서 플러그인 콜백에 전달되는 BlockFile (및 결과의 file 속성)은
+    # str을 반환하는 binwalk.core.common.StrBlockFile로 감싸집니다.
+    BINARY = False
+
+    # scan 콜백이 처리하는 결과 설명의 접두사 목록입니다 (소문자).
+    # 지정된 경우, 설명이 이 접두사 중 하나로 시작하는 결과에 대해서만 scan이 호출됩니다 (참조: Plugins.scan_callbacks).
+    # 지정되지 않은 경우, 모든 결과에 대해 scan이 호출됩니다.
+    SCAN_DESCRIPTIONS = []
+
     def __init__(self, module):
         '''
         클래스 생성자입니다.
@@ -88,6 +99,10 @@ class Plugins(object):
     POSTSCAN = 'post_scan'
     MODULE_EXTENSION = '.py'
 
+    # 프로세스 내에서 공유되는 플러그인 파일 경로와 (파일 상태, Plugin 클래스 또는 로드 중 발생한 예외)의 딕셔너리입니다.
+    # 각 플러그인 파일은 변경되지 않는 한 프로세스당 한 번만 로드됩니다 (참조: self._load_plugin_class).
+    REGISTRY = {}
+
     def __init__(self, parent=None):
         self.scan = []
         self.pre_scan = []
@@ -96,6 +111,8 @@ class Plugins(object):
         self.post_scan = []
         self.parent = parent
         self.settings = binwalk.core.settings.Settings()
+        # self.scan 콜백을 결과 설명 접두사로 찾기 위한 색인입니다 (참조: self._scan_dispatch).
+        self.scan_index = None
 
     def __enter__(self):
         return self
@@ -104,13 +121,39 @@ class Plugins(object):
         pass
 
     def _call_plugins(self, callback_list, obj=None):
+        # obj가 bytes 모드로 열린 파일(new_file/load_file)이거나 그러한 파일의 결과(scan)인지 확인합니다.
+        # 이 경우 bytes를 지원하지 않는 플러그인에는 str 래퍼를 전달합니다.
+        if self._is_binary_file(obj):
+            binary_fp = obj
+        elif self._is_binary_file(getattr(obj, 'file', None)):
+            binary_fp = obj.file
+        else:
+            binary_fp = None
+
+        # 성능 통계를 수집하는 경우 콜백별 실행 시간을 기록합니다 (참조: binwalk.core.stats).
+        stats = getattr(getattr(self.parent, 'parent', None), 'stats', None)
+
         for callback in callback_list:
+            arg = obj
+            # 결과의 file 속성을 래퍼로 교체한 경우, 콜백 후에 복원해야 합니다.
+            wrapped_file = False
+            failed = False
+            if stats is not None:
+                start = time.time()
+
+            if binary_fp is not None and not getattr(getattr(callback, '__self__', None), 'BINARY', False):
+                if obj is binary_fp:
+                    arg = binwalk.core.common.StrBlockFile(binary_fp)
+                else:
+                    obj.file = binwalk.core.common.StrBlockFile(binary_fp)
+                    wrapped_file = True
+
             try:
                 try:
                     callback()
                 except TypeError:
-                    if obj is not None:
-                        callback(obj)
+                    if arg is not None:
+                        callback(arg)
             except KeyboardInterrupt:
                 raise
             except IgnoreFileException:
@@ -118,8 +161,57 @@ class Plugins(object):
             except SystemError:
                 raise
             except Exception as e:
+                failed = True
                 binwalk.core.common.warning(
                     "%s.%s 실패 [%s]: '%s'" % (callback.__module__, callback.__name__, type(e), e))
+            finally:
+                if wrapped_file:
+                    obj.file = binary_fp
+                if stats is not None:
+                    stats.add('plugins', self._callback_name(callback), time.time() - start, failed)
+
+    def _callback_name(self, callback):
+        # 플러그인 메서드는 '플러그인 클래스 이름.메서드 이름'으로 표시합니다.
+        plugin = getattr(callback, '__self__', None)
+        if plugin is not None:
+            return "%s.%s" % (plugin.__class__.__name__, callback.__name__)
+        return "%s.%s" % (callback.__module__, callback.__name__)
+
+    def _is_binary_file(self, fp):
+        return hasattr(fp, 'read_block') and getattr(fp, 'binary', False)
+
+    def _load_plugin_class(self, module, file_path):
+        '''
+        플러그인 파일에서 Plugin 클래스를 로드합니다.
+        로드된 클래스는 self.REGISTRY에 저장되며, 파일이 변경되지 않은 경우 다시 로드하지 않습니다.
+
+        @module    - 플러그인 모듈 이름.
+        @file_path - 플러그인 파일의 경로.
+
+        Plugin 클래스를 반환합니다. 플러그인 로드에 실패한 경우, 처음 로드할 때와 동일한 예외를 발생시킵니다.
+        '''
+        st = os.stat(file_path)
+        state = (st.st_mtime, st.st_size)
+
+        try:
+            (cached_state, plugin_class) = self.REGISTRY[file_path]
+        except KeyError:
+            cached_state = None
+
+        if cached_state != state:
+            try:
+                plugin_class = self._find_plugin_class(imp.load_source(module, file_path))
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                plugin_class = e
+            self.REGISTRY[file_path] = (state, plugin_class)
+
+        # 같은 예외 객체를 다시 발생시킬 때 traceback이 누적되지 않도록 합니다.
+        if isinstance(plugin_class, Exception):
+            raise plugin_class.with_traceback(None)
+
+        return plugin_class
 
     def _find_plugin_class(self, plugin):
         for (name, klass) in inspect.getmembers(plugin, inspect.isclass):
@@ -176,8 +268,7 @@ class Plugins(object):
                         module = file_name[:-len(self.MODULE_EXTENSION)]
 
                         try:
-                            plugin = imp.load_source(module, os.path.join(plugins[key]['path'], file_name))
-                            plugin_class = self._find_plugin_class(plugin)
+                            plugin_class = self._load_plugin_class(module, os.path.join(plugins[key]['path'], file_name))
 
                             plugins[key]['enabled'][module] = True
                             plugins[key]['modules'].append(module)
@@ -213,8 +304,11 @@ class Plugins(object):
                 continue
 
             try:
-                plugin = imp.load_source(module, file_path)
-                plugin_class = self._find_plugin_class(plugin)
+                plugin_class = self._load_plugin_class(module, file_path)
+
+                # 이 모듈에 대해 로드되지 않는 플러그인은 인스턴스를 생성하지 않습니다 (참조: Plugin.MODULES).
+                if self.parent is not None and plugin_class.MODULES and self.parent.name not in plugin_class.MODULES:
+                    continue
 
                 class_instance = plugin_class(self.parent)
                 if not class_instance._enabled:
@@ -273,4 +367,48 @@ class Plugins(object):
         return self._call_plugins(self.post_scan)
 
     def scan_callbacks(self, obj):
-        return self._call_plugins(self.scan, obj)
+        return self._call_plugins(self._scan_dispatch(obj), obj)
+
+    def _scan_dispatch(self, obj):
+        '''
+        결과에 대해 호출해야 하는 scan 콜백 목록을 가져옵니다 (참조: Plugin.SCAN_DESCRIPTIONS).
+
+        @obj - 결과, binwalk.core.module.Result의 인스턴스.
+
+        self.scan과 같은 순서의 콜백 목록을 반환합니다.
+        '''
+        try:
+            description = obj.description.lower()
+        except AttributeError:
+            return self.scan
+
+        # self.scan이 변경된 경우 색인을 다시 생성합니다.
+        if self.scan_index is None or self.scan_index[0] != len(self.scan):
+            catch_all = []
+            prefixes = {}
+
+            for (i, callback) in enumerate(self.scan):
+                descriptions = getattr(getattr(callback, '__self__', None), 'SCAN_DESCRIPTIONS', None)
+                if descriptions:
+                    for prefix in descriptions:
+                        prefixes.setdefault(prefix, []).append(i)
+                else:
+                    catch_all.append(i)
+
+            lengths = sorted(set([len(prefix) for prefix in prefixes]))
+            # 일치하는 접두사 조합별 콜백 목록입니다.
+            callbacks = {}
+            self.scan_index = (len(self.scan), catch_all, prefixes, lengths, callbacks)
+
+        (count, catch_all, prefixes, lengths, callbacks) = self.scan_index
+
+        matches = tuple([description[:n] for n in lengths if has_key(prefixes, description[:n])])
+
+        try:
+            return callbacks[matches]
+        except KeyError:
+            indexes = set(catch_all)
+            for prefix in matches:
+                indexes.update(prefixes[prefix])
+            callbacks[matches] = [self.scan[i] for i in sorted(indexes)]
+            return callbacks[matches]
@@ -0,0 +1,460 @@
+# Unix 소켓 서비스를 통해 스캔 요청을 처리합니다 (binwalk --serve).
+# 서명과 추출 규칙은 프로세스 내에서 한 번만 로드되므로 (참조: Signature.MAGIC_REGISTRY, Extractor.RULES_REGISTRY),
+# 작은 파일을 많이 스캔할 때 실행마다 인터프리터 시작, 모듈 검색, 플러그인 및 서명 로드 비용이 들지 않습니다.
+#
+# 요청은 한 줄에 하나의 JSON 객체입니다:
+#
+#   {"id": 1, "files": ["/path/to/file"], "options": {"signature": true}}
+#   {"id": 2, "data": "<base64>", "options": {"entropy": true, "nplot": true}}
+#   {"cancel": 1}
+#
+# 결과는 한 줄에 하나의 JSON 객체 (NDJSON)로 전송되며, 각 작업은 상태 메시지로 끝납니다:
+#
+#   {"id": 1, "module": "Signature", "result": {"offset": 0, "description": "...", ...}}
+#   {"id": 1, "status": "done", "errors": []}
+#   {"id": 2, "status": "cancelled"}
+#   {"id": 3, "status": "error", "error": "..."}
+#
+# options에는 binwalk.scan의 키워드 인수 (예: "signature", "entropy", 짧은 옵션 "B")를 지정합니다.
+# 소켓에 접근할 수 있는 클라이언트는 스캔 옵션 (ThreadedScanServer.SCAN_OPTIONS)만 사용할 수 있으며, 그 외의 옵션은 거부됩니다.
+# 추출 옵션 (ThreadedScanServer.EXTRACT_OPTIONS; 예: "extract", "dd", "run_as", "directory")은 외부 명령을 실행하고
+# 클라이언트가 지정한 경로에 파일을 쓰므로, 서버가 --serve-extract로 시작된 경우에만 사용할 수 있습니다.
+# 옵션 이름은 정확히 일치해야 하며, 긴 옵션의 약어나 여러 짧은 옵션의 조합 (예: "-Bf")은 사용할 수 없습니다.
+
+import os
+import json
+import errno
+import socket
+import base64
+import threading
+import binwalk.core.common
+import binwalk.core.module
+from binwalk.core.compat import *
+from binwalk.core.exceptions import ScanStoppedException
+
+# Python 2/3 호환성
+try:
+    import SocketServer
+except ImportError:
+    import socketserver as SocketServer
+
+
+class ScanRequestHandler(SocketServer.StreamRequestHandler):
+    '''
+    클라이언트 연결을 처리하는 클래스입니다.
+    요청된 스캔 작업을 서버의 작업자 풀에 제출하고, 결과를 작업이 끝날 때까지 클라이언트로 전송합니다.
+    '''
+
+    def setup(self):
+        SocketServer.StreamRequestHandler.setup(self)
+        # 여러 작업자 스레드가 같은 연결에 쓰므로, 메시지 단위로 잠급니다.
+        self.send_lock = threading.Lock()
+        # 작업 ID별 (취소 이벤트, future)입니다. 작업 ID는 연결마다 구분됩니다.
+        self.jobs = {}
+        self.job_ids = 0
+
+    def handle(self):
+        while True:
+            try:
+                line = self.rfile.readline()
+            except (IOError, OSError) as e:
+                # 클라이언트 연결이 끊어진 경우, 이 연결의 모든 작업을 취소합니다.
+                binwalk.core.common.debug("ScanRequestHandler 수신 실패: %s" % str(e))
+                self.cancel_all()
+                return
+
+            if not line:
+                break
+
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                request = json.loads(bytes2str(line))
+                if not isinstance(request, dict):
+                    raise ValueError("요청은 JSON 객체여야 합니다")
+            except ValueError as e:
+                self.send({'status': 'error', 'error': "잘못된 요청: %s" % str(e)})
+                continue
+
+            if has_key(request, 'cancel'):
+                self.cancel(request['cancel'])
+            else:
+                self.submit(request)
+
+        # 클라이언트가 요청 전송을 마친 후 (읽기 쪽 종료)에도 진행 중인 작업의 결과는 모두 전송합니다.
+        for (event, future) in list(self.jobs.values()):
+            future.result()
+
+    def submit(self, request):
+        '''
+        스캔 작업을 작업자 풀에 제출합니다.
+
+        @request - 요청 객체 (파일 상단의 프로토콜 참조).
+
+        반환 값은 없습니다.
+        '''
+        if has_key(request, 'id'):
+            job_id = request['id']
+        else:
+            self.job_ids += 1
+            job_id = self.job_ids
+
+        if has_key(self.jobs, job_id) and not self.jobs[job_id][1].done():
+            self.send({'id': job_id, 'status': 'error', 'error': "작업 ID가 이미 사용 중입니다"})
+            return
+
+        event = threading.Event()
+        future = self.server.pool.submit(self.run_job, job_id, request, event)
+        self.jobs[job_id] = (event, future)
+        # 끝난 작업은 목록에서 제거합니다. 이미 끝난 경우 콜백은 즉시 호출됩니다.
+        future.add_done_callback(lambda f: self.jobs.pop(job_id, None))
+
+    def cancel(self, job_id):
+        '''
+        진행 중이거나 대기 중인 작업을 취소합니다. 작업은 'cancelled' 상태로 끝납니다.
+
+        @job_id - 취소할 작업 ID.
+
+        반환 값은 없습니다.
+        '''
+        try:
+            (event, future) = self.jobs[job_id]
+            event.set()
+        except KeyError:
+            self.send({'id': job_id, 'status': 'error', 'error': "알 수 없는 작업 ID입니다"})
+
+    def run_job(self, job_id, request, event):
+        '''
+        작업자 스레드에서 스캔 작업을 실행하고 결과를 전송합니다.
+
+        반환 값은 없습니다.
+        '''
+        try:
+            if event.is_set():
+                raise ScanStoppedException()
+
+            (files, kwargs) = self.server.job_arguments(request)
+
+            with binwalk.core.module.Modules(*files, **kwargs) as modules:
+                modules.stop_event = event
+                modules.keep_results = False
+                modules.result_handler = lambda name, r: self.send({'id': job_id, 'module': name, 'result': _result_dict(r)})
+
+                self.server.execute(modules)
+
+                errors = [_error_string(e) for obj in _loaded_modules(modules) for e in obj.errors]
+
+            self.send({'id': job_id, 'status': 'done', 'errors': errors})
+        except ScanStoppedException:
+            self.send({'id': job_id, 'status': 'cancelled'})
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            # 잘못된 명령 줄 옵션에 대해 argparse는 SystemExit를 발생시킵니다.
+            self.send({'id': job_id, 'status': 'error', 'error': str(e) or e.__class__.__name__})
+
+    def send(self, message):
+        '''
+        메시지를 한 줄의 JSON으로 클라이언트에 전송합니다.
+        클라이언트 연결이 끊어진 경우, 이 연결의 모든 작업을 취소합니다.
+
+        반환 값은 없습니다.
+        '''
+        line = str2bytes(json.dumps(message, default=str) + "\n")
+
+        with self.send_lock:
+            try:
+                self.wfile.write(line)
+                self.wfile.flush()
+            except (IOError, OSError) as e:
+                binwalk.core.common.debug("ScanRequestHandler 전송 실패: %s" % str(e))
+                self.cancel_all()
+
+    def cancel_all(self):
+        for (event, future) in list(self.jobs.values()):
+            event.set()
+
+
+class ThreadedScanServer(SocketServer.ThreadingMixIn, SocketServer.UnixStreamServer):
+    '''
+    다중 스레드로 작동하는 스캔 서버 클래스입니다.
+    각 연결은 별도의 스레드에서 처리되며, 스캔 작업은 작업자 풀에서 실행됩니다.
+    '''
+    daemon_threads = True  # 데몬 스레드로 설정하여 서버가 강제 종료될 수 있도록 함
+
+    # 모든 작업에 적용되는 옵션입니다. 결과는 소켓으로만 전송되며, 작업은 서버 프로세스 안에서만 실행됩니다.
+    JOB_OPTIONS = {'quiet': True, 'jobs': 1, 'status': 0, 'nplot': True}
+
+    # 요청에서 사용할 수 있는 스캔 옵션 (긴 옵션 이름)입니다 (파일 상단의 프로토콜 참조).
+    # 파일을 쓰는 옵션 (예: --log, --save, 현재 디렉터리에 피라미드를 저장하는 --pyramid)은 포함하지 않습니다.
+    SCAN_OPTIONS = ['signature', 'raw', 'opcodes', 'magic', 'dumb', 'invalid', 'exclude', 'include',
+                    'entropy', 'fast', 'nlegend', 'nplot', 'high', 'low', 'step', 'classify',
+                    'deflate', 'lzma', 'partial', 'stop',
+                    'disasm', 'minsn', 'continue',
+                    'hexdump', 'green', 'red', 'blue', 'similar', 'terse',
+                    'length', 'offset', 'base', 'block', 'swap', 'binary', 'mmap', 'skip', 'finclude', 'fexclude']
+
+    # 서버가 추출을 허용한 경우 (--serve-extract)에만 사용할 수 있는 추출 옵션 (긴 옵션 이름)입니다.
+    EXTRACT_OPTIONS = ['extract', 'dd', 'matryoshka', 'depth', 'directory', 'size', 'count',
+                       'run-as', 'preserve-symlinks', 'rm', 'carve', 'subdirs']
+
+    def job_arguments(self, request):
+        '''
+        요청에서 Modules 인자를 생성합니다.
+        상대 파일 경로는 서버가 시작된 디렉터리를 기준으로 합니다 (추출 중에는 작업 디렉터리가 변경됩니다).
+
+        (대상 파일 목록, kwargs)의 튜플을 반환합니다.
+        '''
+        files = [os.path.join(self.directory, fname) for fname in request.get('files', [])]
+
+        kwargs = dict(request.get('options', {}))
+        for name in kwargs:
+            if _option_name(name) not in self.options:
+                raise ValueError("옵션 '%s'은(는) 스캔 서버 요청에서 사용할 수 없습니다" % name)
+        kwargs.update(self.JOB_OPTIONS)
+
+        # 버퍼 이름도 서버 디렉터리 기준의 절대 경로로 지정합니다.
+        # 다른 작업의 추출로 작업 디렉터리가 변경되어도 등록된 이름은 달라지지 않습니다 (참조: BufferFile.register).
+        data = request.get('data')
+        if isinstance(data, dict):
+            buffers = list(iterator(data))
+        elif isinstance(data, list):
+            buffers = [(None, value) for value in data]
+        elif data is not None:
+            buffers = [(None, data)]
+
+        if data is not None:
+            kwargs['data'] = dict([(self.buffer_name(name), base64.b64decode(value)) for (name, value) in buffers])
+
+        # 대상이 없으면 Modules는 명령 줄 인수 (이 서버의 인수)를 사용하므로, 요청을 거부합니다.
+        if not files and data is None:
+            raise ValueError("스캔할 파일 (files) 또는 데이터 (data)가 지정되지 않았습니다")
+
+        return (files, kwargs)
+
+    def buffer_name(self, name=None):
+        '''
+        요청된 버퍼 이름을 서버 디렉터리 기준의 절대 경로로 반환합니다.
+        이름이 지정되지 않은 버퍼는 Modules와 같은 고유한 이름 (data-N)을 사용합니다.
+        '''
+        if name is None:
+            name = "data-%d" % next(binwalk.core.module._BUFFER_IDS)
+        return os.path.join(self.directory, name)
+
+    def execute(self, modules):
+        '''
+        명령 줄과 마찬가지로 모듈을 실행합니다. 활성화된 모듈이 없는 경우 서명 스캔을 실행합니다.
+        추출은 프로세스의 작업 디렉터리를 변경하므로 (참조: Extractor.extract), 추출 작업은 다른 모든 작업과 동시에 실행되지 않습니다.
+        추출하지 않는 작업은 서로 동시에 실행됩니다 (참조: _SharedLock).
+
+        반환 값은 없습니다.
+        '''
+        import binwalk.modules
+
+        if modules.argv(binwalk.modules.Extractor, argv=modules.arguments)['enabled']:
+            lock = self.extract_lock.exclusive()
+        else:
+            lock = self.extract_lock.shared()
+
+        with lock:
+            if not modules.execute():
+                modules.execute(*modules.arguments, signature=True)
+
+
+class ScanServer(object):
+    '''
+    스캔 서버를 초기화하고 실행하는 클래스입니다.
+    '''
+
+    def __init__(self, path, workers=1, extract=False):
+        '''
+        초기화 메서드입니다. 서명을 미리 로드하고 Unix 소켓을 생성합니다.
+
+        @path    - Unix 소켓 경로.
+        @workers - 동시에 실행할 스캔 작업 수.
+        @extract - True인 경우 요청에서 추출 옵션 (ThreadedScanServer.EXTRACT_OPTIONS)을 허용합니다.
+        '''
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.path = path
+        self._remove_stale_socket()
+
+        # 기본 서명 스캔에 사용되는 서명과 플러그인을 미리 로드합니다.
+        binwalk.scan(data=b'', signature=True, quiet=True)
+
+        self.server = ThreadedScanServer(path, ScanRequestHandler)
+        self.server.directory = os.getcwd()
+        allowed = ThreadedScanServer.SCAN_OPTIONS
+        if extract:
+            allowed = allowed + ThreadedScanServer.EXTRACT_OPTIONS
+        self.server.options = _request_options(allowed)
+        self.server.pool = ThreadPoolExecutor(max_workers=max(workers, 1))
+        self.server.extract_lock = _SharedLock()
+
+    def serve_forever(self):
+        '''
+        서버가 종료될 때까지 (예: KeyboardInterrupt) 요청을 처리합니다.
+
+        반환 값은 없습니다.
+        '''
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            self.server.pool.shutdown(wait=False)
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+    def _remove_stale_socket(self):
+        '''
+        이전 서버가 남긴 소켓 파일을 삭제합니다. 다른 서버가 사용 중인 소켓은 삭제하지 않습니다.
+        '''
+        if not os.path.exists(self.path):
+            return
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+        except (IOError, OSError) as e:
+            if e.errno in [errno.ECONNREFUSED, errno.ENOENT]:
+                os.unlink(self.path)
+                return
+            raise
+        finally:
+            sock.close()
+
+        raise IOError(errno.EADDRINUSE, "스캔 서버가 이미 실행 중입니다", self.path)
+
+
+class _SharedLock(object):
+    '''
+    여러 스레드가 함께 획득하는 공유 잠금과 하나의 스레드만 획득하는 배타적 잠금을 제공합니다 (참조: ThreadedScanServer.execute).
+    배타적 잠금을 기다리는 스레드가 있으면 새로운 공유 잠금은 대기하므로, 추출 작업은 계속 지연되지 않습니다.
+    '''
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.readers = 0
+        self.writer = False
+        self.writers_waiting = 0
+
+    def shared(self):
+        return _LockContext(self._acquire_shared, self._release_shared)
+
+    def exclusive(self):
+        return _LockContext(self._acquire_exclusive, self._release_exclusive)
+
+    def _acquire_shared(self):
+        with self.condition:
+            while self.writer or self.writers_waiting:
+                self.condition.wait()
+            self.readers += 1
+
+    def _release_shared(self):
+        with self.condition:
+            self.readers -= 1
+            if not self.readers:
+                self.condition.notify_all()
+
+    def _acquire_exclusive(self):
+        with self.condition:
+            self.writers_waiting += 1
+            try:
+                while self.writer or self.readers:
+                    self.condition.wait()
+            finally:
+                self.writers_waiting -= 1
+            self.writer = True
+
+    def _release_exclusive(self):
+        with self.condition:
+            self.writer = False
+            self.condition.notify_all()
+
+
+class _LockContext(object):
+
+    def __init__(self, acquire, release):
+        self.acquire = acquire
+        self.release = release
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, t, v, traceback):
+        self.release()
+
+
+def _request_options(allowed):
+    '''
+    스캔 요청에서 사용할 수 있는 옵션 이름 (긴 옵션 이름과 짧은 옵션 문자)의 집합을 반환합니다.
+    allowed에 포함된 긴 옵션 이름의 옵션만 포함되며, 숨겨진 옵션은 제외됩니다.
+    '''
+    import inspect
+    import binwalk.modules
+
+    options = set()
+
+    for (name, module) in inspect.getmembers(binwalk.modules):
+        if not inspect.isclass(module):
+            continue
+
+        for option in getattr(module, 'CLI', []):
+            if option.hidden or option.long not in allowed:
+                continue
+            options.add(option.long)
+            if option.short:
+                options.add(option.short)
+
+    return options
+
+
+def _option_name(name):
+    '''
+    요청 옵션 키를 명령 줄 옵션 이름으로 변환합니다 (참조: Modules._parse_api_opt).
+    '''
+    return str(name).lstrip('-').replace('_', '-')
+
+
+def _loaded_modules(modules):
+    '''
+    Modules 실행에서 로드된 모든 모듈 (의존성 모듈 포함) 인스턴스를 생성합니다.
+    '''
+    for obj in modules.executed_modules.values():
+        yield obj
+    for loaded in modules.default_dependency_modules.values():
+        for (kwargs, obj) in loaded:
+            yield obj
+
+
+def _error_string(e):
+    if e.exception is not None:
+        return "%s: %s" % (e.module, str(e.exception))
+    return "%s: %s" % (e.module, e.description)
+
+
+def _result_dict(r):
+    '''
+    결과를 JSON으로 직렬화할 수 있는 딕셔너리로 변환합니다.
+    열린 파일 객체 (예: r.file)는 파일 경로로 대체됩니다.
+
+    @r - binwalk.core.module.Result의 인스턴스.
+
+    결과 속성의 딕셔너리를 반환합니다.
+    '''
+    result = {}
+
+    for k in binwalk.core.module._result_fields(r.__class__) + tuple(getattr(r, '__dict__', ())):
+        v = getattr(r, k, None)
+        if hasattr(v, 'read_block') or hasattr(v, 'read'):
+            v = getattr(v, 'path', getattr(v, 'name', None))
+        elif isinstance(v, bytes):
+            v = bytes2str(v)
+        result[k] = v
+
+    return result
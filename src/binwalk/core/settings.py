@@ -17,6 +17,7 @@ class Settings(object):
 
         o BINWALK_MAGIC_FILE  - 기본 binwalk 매직 파일의 경로.
         o PLUGINS             - 플러그인 디렉토리의 경로.
+        o CACHE               - 컴파일된 시그니처 캐시 디렉토리의 경로 (사용자 전용).
     '''
     # 서브 디렉토리들
     BINWALK_USER_DIR = "binwalk"
@@ -24,6 +25,7 @@ class Settings(object):
     BINWALK_CONFIG_DIR = "config"
     BINWALK_MODULES_DIR = "modules"
     BINWALK_PLUGINS_DIR = "plugins"
+    BINWALK_CACHE_DIR = "cache"
 
     # 파일 이름들
     PLUGINS = "plugins"
@@ -45,7 +47,8 @@ class Settings(object):
             magic=self._magic_signature_files(user_only=True),
             extract=self._user_path(self.BINWALK_CONFIG_DIR, self.EXTRACT_FILE),
             modules=self._user_path(self.BINWALK_MODULES_DIR),
-            plugins=self._user_path(self.BINWALK_PLUGINS_DIR))
+            plugins=self._user_path(self.BINWALK_PLUGINS_DIR),
+            cache=self._user_path(self.BINWALK_CACHE_DIR))
 
         # 모든 시스템 전역 파일의 경로를 빌드합니다.
         self.system = common.GenericContainer(
@@ -0,0 +1,232 @@
+# 스캔할 필요가 없는 대상 파일의 영역 (고정 값 패딩, 높은 엔트로피)을 찾습니다 (--skip).
+# 시그니처 스캔과 원시 압축 스캔은 파일을 스캔하기 전에 영역 목록을 만들고, 데이터 블록을 읽을 때 이 영역을 건너뜁니다.
+
+import math
+import bisect
+import binwalk.core.common
+from binwalk.core.compat import *
+
+
+class SkipMap(object):
+    '''
+    대상 파일에서 건너뛸 영역 목록을 만드는 클래스입니다.
+
+    'fill' 영역은 하나의 바이트 값이 반복되는 구간입니다 (예: NAND 덤프의 0xFF 지우기 패딩).
+    FILL_SIZE 크기의 청크 단위로 찾은 후, 영역의 시작은 이전 청크에서 바이트 단위로 확장됩니다.
+    영역 바로 뒤의 헤더는 패딩과 같은 바이트로 시작할 수 있으므로 (예: 0xFF로 시작하는 Snappy 스트림 헤더),
+    영역은 다음 값 (패딩이 아닌 바이트)보다 margin 바이트 앞에서 끝납니다. 파일 끝까지 계속되는 영역은 파일 끝에서 끝납니다.
+
+    'entropy' 영역은 ENTROPY_WINDOW 크기 창의 Shannon 엔트로피가 HIGH_ENTROPY 이상인 연속된 구간입니다 (압축 또는 암호화된 데이터).
+    데이터의 헤더 (예: 압축 데이터의 시그니처)는 구간의 시작 부분에 있으므로, 각 구간의 첫 번째 창은 건너뛰지 않습니다.
+    '''
+
+    FILL = 'fill'
+    ENTROPY = 'entropy'
+    KINDS = [FILL, ENTROPY]
+
+    # 'fill' 영역을 찾는 청크 크기 (최소 영역 크기)
+    FILL_SIZE = 4 * 1024
+
+    # 'fill' 영역의 끝과 다음 값 사이에 남겨 두는 최소 바이트 수 (참조: margin)
+    FILL_MARGIN = 16
+
+    # 'entropy' 영역을 찾는 창 크기와 엔트로피 임계값 (0 - 1)
+    ENTROPY_WINDOW = 64 * 1024
+    HIGH_ENTROPY = .99
+
+    def __init__(self, fp, kinds, margin=0):
+        '''
+        클래스 생성자. 파일의 현재 위치부터 데이터를 읽어 영역 목록을 만들고, 파일 위치를 원래대로 되돌립니다.
+
+        @fp     - 대상 파일의 BlockFile 객체.
+        @kinds  - 건너뛸 영역 종류 목록 (self.KINDS).
+        @margin - 'fill' 영역 뒤의 값보다 앞에서 스캔할 바이트 수 (최소 self.FILL_MARGIN).
+                  헤더의 시작 오프셋이 첫 번째 패딩이 아닌 바이트보다 앞설 수 있는 최대 거리입니다 (예: 시그니처의 오프셋 + 매직 길이).
+
+        반환값은 없습니다.
+        '''
+        self.kinds = kinds
+        self.margin = max(margin, self.FILL_MARGIN)
+        # 시작 오프셋 순서로 정렬된 (시작, 끝, 종류) 목록
+        self.regions = []
+        self.starts = []
+
+        self._fill_run = None
+        self._fill_prev = b''
+        self._entropy_run = None
+        self._numpy = None
+
+        if self.ENTROPY in self.kinds:
+            try:
+                import numpy
+                self._numpy = numpy
+            except ImportError:
+                pass
+
+        position = fp.tell()
+        try:
+            self._build(fp)
+        finally:
+            fp.seek(position)
+
+        for (start, end, kind) in self.regions:
+            binwalk.core.common.debug("건너뛸 영역 (%s): 0x%X - 0x%X" % (kind, start, end))
+
+    def _build(self, fp):
+        regions = []
+
+        while True:
+            start = fp.tell()
+            (data, dlen) = fp.read_block()
+            if dlen < 1:
+                break
+
+            if isinstance(data, memoryview):
+                data = data.tobytes()
+            elif isinstance(data, str):
+                data = str2bytes(data)
+
+            if self.FILL in self.kinds:
+                regions += self._fill_regions(data, dlen, start)
+            if self.ENTROPY in self.kinds:
+                regions += self._entropy_regions(data, dlen, start)
+
+        # 파일 끝에서 진행 중인 영역을 닫습니다.
+        if self._fill_run is not None:
+            regions.append((self._fill_run[1], self._fill_run[2], self.FILL))
+        if self._entropy_run is not None:
+            regions += self._close_entropy_run()
+
+        # 겹치는 영역은 먼저 시작하는 영역으로 합칩니다.
+        for (start, end, kind) in sorted(regions):
+            if end <= start:
+                continue
+            if self.regions and start <= self.regions[-1][1]:
+                (prev_start, prev_end, prev_kind) = self.regions[-1]
+                self.regions[-1] = (prev_start, max(prev_end, end), prev_kind)
+            else:
+                self.regions.append((start, end, kind))
+
+        self.starts = [region[0] for region in self.regions]
+
+    def _fill_regions(self, data, dlen, start):
+        '''
+        데이터 블록에서 끝난 'fill' 영역 목록을 반환합니다. 블록 끝에서 계속되는 영역은 다음 블록에서 반환됩니다.
+        '''
+        regions = []
+        size = self.FILL_SIZE
+
+        for i in range(0, dlen, size):
+            chunk = data[i:min(i + size, dlen)]
+            fill = chunk[0:1]
+            constant = (len(chunk) == size and chunk.count(fill) == size)
+
+            if self._fill_run is not None:
+                (run_fill, run_start, run_end) = self._fill_run
+
+                if constant and fill == run_fill:
+                    self._fill_run = (run_fill, run_start, start + i + size)
+                    self._fill_prev = chunk
+                    continue
+
+                # 영역 뒤의 값 (이 청크의 시작 부분의 같은 값 다음)보다 self.margin 바이트 앞에서 영역을 끝냅니다.
+                run_end += len(chunk) - len(chunk.lstrip(run_fill))
+                regions.append((run_start, run_end - self.margin, self.FILL))
+                self._fill_run = None
+
+            if constant:
+                # 영역의 시작을 이전 청크의 끝 부분의 같은 값으로 확장합니다.
+                run_start = start + i - (len(self._fill_prev) - len(self._fill_prev.rstrip(fill)))
+                self._fill_run = (fill, run_start, start + i + size)
+
+            self._fill_prev = chunk
+
+        return regions
+
+    def _entropy_regions(self, data, dlen, start):
+        '''
+        데이터 블록에서 끝난 'entropy' 영역 목록을 반환합니다. 블록 끝에서 계속되는 영역은 다음 블록에서 반환됩니다.
+        '''
+        regions = []
+        size = self.ENTROPY_WINDOW
+
+        for (i, entropy) in zip(range(0, dlen, size), self._entropies(data, dlen, size)):
+            end = start + min(i + size, dlen)
+
+            if entropy >= self.HIGH_ENTROPY:
+                if self._entropy_run is None:
+                    self._entropy_run = (start + i, end)
+                else:
+                    self._entropy_run = (self._entropy_run[0], end)
+            elif self._entropy_run is not None:
+                regions += self._close_entropy_run()
+
+        return regions
+
+    def _close_entropy_run(self):
+        (run_start, run_end) = self._entropy_run
+        self._entropy_run = None
+        # 첫 번째 창 (헤더가 있을 수 있는 부분)은 스캔합니다.
+        return [(min(run_start + self.ENTROPY_WINDOW, run_end), run_end, self.ENTROPY)]
+
+    def _entropies(self, data, dlen, size):
+        '''
+        데이터 블록의 각 창 (data[i:i + size], i < dlen)의 Shannon 엔트로피 (0 - 1) 목록을 반환합니다.
+        numpy가 설치된 경우 모든 창의 히스토그램을 한 번에 계산합니다.
+        '''
+        windows = [data[i:min(i + size, dlen)] for i in range(0, dlen, size)]
+
+        if self._numpy is not None:
+            np = self._numpy
+            counts = [np.bincount(np.frombuffer(window, dtype=np.uint8), minlength=256) for window in windows]
+        else:
+            counts = [[window.count(bytes(bytearray([x]))) for x in range(0, 256)] for window in windows]
+
+        entropies = []
+        for (window, count) in zip(windows, counts):
+            length = float(len(window))
+            entropy = 0.0
+            for c in count:
+                if c:
+                    p_x = c / length
+                    entropy -= p_x * math.log(p_x, 2)
+            entropies.append(entropy / 8)
+
+        return entropies
+
+    def region(self, offset):
+        '''
+        지정된 오프셋을 포함하는 영역을 반환합니다.
+
+        @offset - 파일 오프셋.
+
+        (시작, 끝, 종류) 튜플을 반환합니다. 오프셋이 영역에 포함되지 않으면 None을 반환합니다.
+        '''
+        i = bisect.bisect_right(self.starts, offset) - 1
+        if i >= 0 and offset < self.regions[i][1]:
+            return self.regions[i]
+        return None
+
+    def limit(self, position, dlen):
+        '''
+        position에서 읽은 데이터 블록에서 다음 영역이 시작하기 전까지의 길이를 반환합니다.
+
+        @position - 데이터 블록의 파일 오프셋.
+        @dlen     - 데이터 블록 길이.
+
+        스캔할 데이터 블록 길이 (dlen 이하)를 반환합니다.
+        '''
+        i = bisect.bisect_right(self.starts, position)
+        if i < len(self.starts) and self.starts[i] < position + dlen:
+            return self.starts[i] - position
+        return dlen
+
+    def summary(self):
+        '''
+        자세한 출력에 표시할 건너뛰기 정책과 영역 크기의 요약 문자열을 반환합니다.
+        '''
+        parts = []
+        for kind in self.kinds:
+            regions = [(start, end) for (start, end, k) in self.regions if k == kind]
+            parts.append("%s (%d개 영역, %d 바이트)" % (kind, len(regions), sum([end - start for (start, end) in regions])))
+        return ", ".join(parts)
@@ -0,0 +1,174 @@
+# 스캔 단계, 플러그인, 추출기 명령 및 시그니처별 실행 시간과 카운터를 수집합니다 (--stats-file).
+# 통계는 --stats-file이 지정된 경우에만 수집되며 (참조: Modules.stats), 그렇지 않으면 측정 코드는 실행되지 않습니다.
+
+import json
+import time
+
+
+class Stats(object):
+    '''
+    Modules 실행의 성능 통계를 수집하는 클래스입니다.
+
+    시간 측정 항목은 그룹 (예: 'modules', 'plugins', 'extractor')과 이름으로 구분되며, 호출 횟수, 실패 횟수, 총 시간을 기록합니다.
+    시그니처 항목은 시그니처 ID별로 후보 수, 분석된 유효/유효하지 않은 결과 수, 분석 시간을 기록합니다 (참조: Magic.scan_iter).
+    '''
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        # (그룹, 이름)별 [호출 횟수, 실패 횟수, 총 시간 (초)]
+        self.timers = {}
+        # 시그니처 ID별 [제목, 후보 수, 유효한 결과 수, 유효하지 않은 결과 수, 분석 시간 (초)]
+        self.signatures = {}
+
+    def add(self, group, name, seconds, failed=False, calls=1):
+        '''
+        시간 측정 항목에 실행 시간을 추가합니다.
+
+        @group   - 항목 그룹.
+        @name    - 항목 이름.
+        @seconds - 실행 시간 (초).
+        @failed  - 실행이 실패한 경우 True.
+        @calls   - 호출 횟수.
+
+        반환값은 없습니다.
+        '''
+        try:
+            timer = self.timers[(group, name)]
+        except KeyError:
+            timer = self.timers[(group, name)] = [0, 0, 0.0]
+
+        timer[0] += calls
+        timer[1] += int(failed)
+        timer[2] += seconds
+
+    def timer(self, group, name):
+        '''
+        with 블록의 실행 시간을 측정하는 컨텍스트 관리자를 반환합니다. 블록에서 예외가 발생하면 실패로 기록합니다.
+        '''
+        return _Timer(self, group, name)
+
+    def _signature(self, signature):
+        try:
+            return self.signatures[signature.id]
+        except KeyError:
+            entry = self.signatures[signature.id] = [signature.title, 0, 0, 0, 0.0]
+            return entry
+
+    def candidates(self, candidates):
+        '''
+        시그니처 후보를 기록합니다.
+
+        @candidates - SignatureMatcher.candidates가 반환한 (오프셋, 순위, 시그니처) 튜플 목록.
+
+        반환값은 없습니다.
+        '''
+        for (offset, rank, signature) in candidates:
+            self._signature(signature)[1] += 1
+
+    def analyzed(self, signature, seconds, invalid):
+        '''
+        시그니처 후보의 분석 결과를 기록합니다.
+
+        @signature - 분석된 Signature 객체.
+        @seconds   - 분석 시간 (초).
+        @invalid   - 분석 결과가 유효하지 않은 경우 True.
+
+        반환값은 없습니다.
+        '''
+        entry = self._signature(signature)
+        entry[3 if invalid else 2] += 1
+        entry[4] += seconds
+
+    def report(self):
+        '''
+        수집된 통계를 JSON으로 직렬화할 수 있는 딕셔너리로 반환합니다.
+        시그니처 항목은 분석 시간이 긴 순서로 정렬됩니다.
+        '''
+        report = {}
+
+        for ((group, name), (calls, failures, seconds)) in self.timers.items():
+            report.setdefault(group, {})[name] = {'calls': calls, 'failures': failures, 'seconds': seconds}
+
+        report['signatures'] = [{'id': sid,
+                                 'title': title,
+                                 'candidates': candidates,
+                                 'valid': valid,
+                                 'invalid': invalid,
+                                 'seconds': seconds}
+                                for (sid, (title, candidates, valid, invalid, seconds))
+                                in sorted(self.signatures.items(), key=lambda x: x[1][4], reverse=True)]
+
+        return report
+
+    def merge(self, report):
+        '''
+        다른 프로세스에서 수집된 통계 (self.report의 반환값)를 추가합니다.
+
+        반환값은 없습니다.
+        '''
+        for (group, timers) in report.items():
+            if group == 'signatures':
+                continue
+            for (name, timer) in timers.items():
+                self.add(group, name, timer['seconds'], calls=timer['calls'])
+                self.timers[(group, name)][1] += timer['failures']
+
+        for entry in report.get('signatures', []):
+            try:
+                current = self.signatures[entry['id']]
+            except KeyError:
+                current = self.signatures[entry['id']] = [entry['title'], 0, 0, 0, 0.0]
+            current[1] += entry['candidates']
+            current[2] += entry['valid']
+            current[3] += entry['invalid']
+            current[4] += entry['seconds']
+
+    def save(self, fname):
+        '''
+        수집된 통계를 JSON 파일로 저장합니다.
+
+        @fname - 저장할 파일 경로.
+
+        반환값은 없습니다.
+        '''
+        with open(fname, "w") as fp:
+            json.dump(self.report(), fp, indent=2, sort_keys=True)
+
+
+class _Timer(object):
+
+    def __init__(self, stats, group, name):
+        self.stats = stats
+        self.group = group
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.time()
+        return self
+
+    def __exit__(self, t, v, traceback):
+        self.stats.add(self.group, self.name, time.time() - self.start, failed=(t is not None))
+
+
+class _NullTimer(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, t, v, traceback):
+        pass
+
+
+# 통계를 수집하지 않을 때 사용되는 컨텍스트 관리자입니다 (참조: timer).
+_NULL_TIMER = _NullTimer()
+
+
+def timer(stats, group, name):
+    '''
+    Stats.timer의 편의 래퍼입니다. stats가 None인 경우 아무것도 측정하지 않는 컨텍스트 관리자를 반환합니다.
+    '''
+    if stats is None:
+        return _NULL_TIMER
+    return stats.timer(group, name)
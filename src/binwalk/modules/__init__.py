@@ -1,23 +1,7 @@
-# capstone 모듈을 찾을 수 없는 경우 disasm 모듈을 로드하지 않음
-
-try:
-
-    from binwalk.modules.disasm import Disasm
-
-except ImportError:
-
-    pass
-
-# lzma 모듈을 찾을 수 없는 경우 compression 모듈을 로드하지 않음
-try:
-
-    from binwalk.modules.compression import RawCompression
-
-except ImportError:
-
-    pass
-
-# 기타 필수 모듈들 로드
+# 모듈 클래스는 메타데이터 (TITLE, CLI, KWARGS 등)만으로 등록됩니다.
+# 무거운 외부 의존성 (capstone, lzma, numba, matplotlib 등)은 각 모듈이 활성화된 경우에만 가져옵니다.
+from binwalk.modules.disasm import Disasm               # 디스어셈블리 스캔 모듈 (capstone)
+from binwalk.modules.compression import RawCompression  # 원시 압축 스트림 스캔 모듈 (lzma)
 from binwalk.modules.signature import Signature   # 시그니처 스캔 모듈
 from binwalk.modules.hexdiff import HexDiff       # 이진 비교 모듈
 from binwalk.modules.general import General       # 일반적인 파일 분석 모듈
@@ -4,16 +4,9 @@ import zlib
 import struct
 import binwalk.core.compat
 import binwalk.core.common
+import binwalk.core.skipmap
 from binwalk.core.module import Option, Kwarg, Module
 
-try:
-
-    import lzma
-
-except ImportError:
-
-    from backports import lzma  # lzma 모듈이 없는 경우 대체 라이브러리 사용
-
 class LZMAHeader(object):   # LZMA 헤더 정보를 저장하는 클래스
 
     def __init__(self, **kwargs):
@@ -34,6 +27,17 @@ class LZMA(object):    # LZMA 압축 스트림을 처리하는 클래스
         self.module = module
         self.properties = None
 
+        # lzma 모듈은 이 모듈이 활성화된 경우에만 가져옵니다.
+        try:
+
+            import lzma
+
+        except ImportError:
+
+            from backports import lzma  # lzma 모듈이 없는 경우 대체 라이브러리 사용
+
+        self.decompressor = lzma.decompress
+
         self.build_properties()
         self.build_dictionaries()
         self.build_headers()
@@ -160,7 +164,7 @@ class LZMA(object):    # LZMA 압축 스트림을 처리하는 클래스
         
                 final_data = binwalk.core.compat.str2bytes(header + data)
         
-                lzma.decompress(final_data)
+                self.decompressor(final_data)
         
                 result = self.parse_header(header)
         
@@ -283,6 +287,8 @@ class RawCompression(Module):   # 원시 압축 해제를 수행하는 모듈
                description='첫 번째 결과에서 중지'),
     ]
 
+    VERBOSE_FORMAT = "%s    %s"  # 자세한 출력 형식 (--skip)
+
     KWARGS = [
         Kwarg(name='enabled', default=False),
         Kwarg(name='partial_scan', default=False),
@@ -309,10 +315,31 @@ class RawCompression(Module):   # 원시 압축 해제를 수행하는 모듈
         for fp in iter(self.next_file, None):
         
             file_done = False
+
+            # 건너뛸 영역은 스캔 전에 찾으며, 자세한 출력에 표시됩니다 (--skip).
+            skip_map = None
+
+            if self.config.skip_regions:
+
+                skip_map = binwalk.core.skipmap.SkipMap(fp, self.config.skip_regions)
+                self.VERBOSE = ["Skipped:", skip_map.summary()]
         
             self.header()
 
             while not file_done:
+
+                position = fp.tell()
+
+                # 건너뛸 영역 안에 있으면 영역의 끝으로 이동합니다.
+                if skip_map is not None:
+
+                    region = skip_map.region(position)
+
+                    if region is not None:
+
+                        fp.seek(region[1])
+
+                        continue
         
                 (data, dlen) = fp.read_block()
         
@@ -320,7 +347,21 @@ class RawCompression(Module):   # 원시 압축 해제를 수행하는 모듈
         
                     break
 
+                # 블록 안에서 건너뛸 영역이 시작되면, 영역의 시작까지만 스캔합니다.
+                if skip_map is not None:
+
+                    limit = skip_map.limit(position, dlen)
+
+                    if limit < dlen:
+
+                        fp.seek(position + limit)
+
+                        dlen = limit
+
                 for i in range(0, dlen):
+
+                    # 오프셋마다 압축 해제를 시도하므로 블록 하나의 처리에도 오래 걸릴 수 있습니다. 중단 요청을 오프셋마다 확인합니다.
+                    self.parent.check_stopped()
         
                     for decompressor in self.decompressors:
         
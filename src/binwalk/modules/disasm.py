@@ -1,7 +1,7 @@
-import capstone
 import binwalk.core.common
 import binwalk.core.compat
 from binwalk.core.module import Module, Option, Kwarg
+from binwalk.core.exceptions import ModuleException
 
 class ArchResult(object):   # 아키텍처 분석 결과를 저장하는 클래스
     
@@ -51,43 +51,44 @@ class Disasm(Module):   # Disasm 클래스는 파일에서 CPU 아키텍처를 
         Kwarg(name='min_insn_count', default=DEFAULT_MIN_INSN_COUNT),
     ]
 
-    # 지원되는 아키텍처 목록
+    # 지원되는 아키텍처 목록 (capstone 상수 이름)
+    # capstone은 이 모듈이 활성화된 경우에만 가져옵니다 (참조: self.init).
     ARCHITECTURES = [
-        Architecture(type=capstone.CS_ARCH_ARM,
-                     mode=capstone.CS_MODE_ARM,
-                     endianness=capstone.CS_MODE_BIG_ENDIAN,
+        Architecture(type='CS_ARCH_ARM',
+                     mode='CS_MODE_ARM',
+                     endianness='CS_MODE_BIG_ENDIAN',
                      description="ARM 실행 코드, 32비트, 빅 엔디안"),
-        Architecture(type=capstone.CS_ARCH_ARM,
-                     mode=capstone.CS_MODE_ARM,
-                     endianness=capstone.CS_MODE_LITTLE_ENDIAN,
+        Architecture(type='CS_ARCH_ARM',
+                     mode='CS_MODE_ARM',
+                     endianness='CS_MODE_LITTLE_ENDIAN',
                      description="ARM 실행 코드, 32비트, 리틀 엔디안"),
-        Architecture(type=capstone.CS_ARCH_ARM64,
-                     mode=capstone.CS_MODE_ARM,
-                     endianness=capstone.CS_MODE_BIG_ENDIAN,
+        Architecture(type='CS_ARCH_ARM64',
+                     mode='CS_MODE_ARM',
+                     endianness='CS_MODE_BIG_ENDIAN',
                      description="ARM 실행 코드, 64비트, 빅 엔디안"),
-        Architecture(type=capstone.CS_ARCH_ARM64,
-                     mode=capstone.CS_MODE_ARM,
-                     endianness=capstone.CS_MODE_LITTLE_ENDIAN,
+        Architecture(type='CS_ARCH_ARM64',
+                     mode='CS_MODE_ARM',
+                     endianness='CS_MODE_LITTLE_ENDIAN',
                      description="ARM 실행 코드, 64비트, 리틀 엔디안"),
-        Architecture(type=capstone.CS_ARCH_PPC,
-                     mode=capstone.CS_MODE_BIG_ENDIAN,
-                     endianness=capstone.CS_MODE_BIG_ENDIAN,
+        Architecture(type='CS_ARCH_PPC',
+                     mode='CS_MODE_BIG_ENDIAN',
+                     endianness='CS_MODE_BIG_ENDIAN',
                      description="PPC 실행 코드, 32/64비트, 빅 엔디안"),
-        Architecture(type=capstone.CS_ARCH_MIPS,
-                     mode=capstone.CS_MODE_64,
-                     endianness=capstone.CS_MODE_BIG_ENDIAN,
+        Architecture(type='CS_ARCH_MIPS',
+                     mode='CS_MODE_64',
+                     endianness='CS_MODE_BIG_ENDIAN',
                      description="MIPS 실행 코드, 32/64비트, 빅 엔디안"),
-        Architecture(type=capstone.CS_ARCH_MIPS,
-                     mode=capstone.CS_MODE_64,
-                     endianness=capstone.CS_MODE_LITTLE_ENDIAN,
+        Architecture(type='CS_ARCH_MIPS',
+                     mode='CS_MODE_64',
+                     endianness='CS_MODE_LITTLE_ENDIAN',
                      description="MIPS 실행 코드, 32/64비트, 리틀 엔디안"),
-        Architecture(type=capstone.CS_ARCH_ARM,
-                     mode=capstone.CS_MODE_THUMB,
-                     endianness=capstone.CS_MODE_LITTLE_ENDIAN,
+        Architecture(type='CS_ARCH_ARM',
+                     mode='CS_MODE_THUMB',
+                     endianness='CS_MODE_LITTLE_ENDIAN',
                      description="ARM 실행 코드, 16비트 (Thumb), 리틀 엔디안"),
-        Architecture(type=capstone.CS_ARCH_ARM,
-                     mode=capstone.CS_MODE_THUMB,
-                     endianness=capstone.CS_MODE_BIG_ENDIAN,
+        Architecture(type='CS_ARCH_ARM',
+                     mode='CS_MODE_THUMB',
+                     endianness='CS_MODE_BIG_ENDIAN',
                      description="ARM 실행 코드, 16비트 (Thumb), 빅 엔디안"),
     ]
 
@@ -101,9 +102,19 @@ class Disasm(Module):   # Disasm 클래스는 파일에서 CPU 아키텍처를 
 
         self.disasm_data_size = self.min_insn_count * 10
 
+        try:
+
+            import capstone
+
+        except ImportError:
+
+            raise ModuleException("capstone 모듈을 찾을 수 없습니다. 디스어셈블리 스캔을 사용하려면 capstone을 설치하십시오.")
+
         for arch in self.ARCHITECTURES:
         
-            self.disassemblers.append((capstone.Cs(arch.type, (arch.mode + arch.endianness)), arch.description))
+            self.disassemblers.append((capstone.Cs(getattr(capstone, arch.type),
+                                                   (getattr(capstone, arch.mode) + getattr(capstone, arch.endianness))),
+                                       arch.description))
 
     def scan_file(self, fp):    # 파일을 스캔하여 유효한 명령어 시퀀스를 찾는 함수
         
@@ -126,6 +137,9 @@ class Disasm(Module):   # Disasm 클래스는 파일에서 CPU 아키텍처를 
                 block_offset = 0
 
                 while (block_offset < dlen) and (result is None or result.count < self.THRESHOLD):
+
+                    # 바이트마다 디스어셈블을 시도하므로, 중단 요청을 오프셋마다 확인합니다.
+                    self.parent.check_stopped()
             
                     # 대규모 데이터 블록을 효율적으로 처리하기 위해 작은 코드 블록으로 나눕니다.
             
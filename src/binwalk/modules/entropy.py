@@ -1,22 +1,12 @@
 # 입력 파일들의 엔트로피를 계산하고, 선택적으로 그래프로 출력하는 모듈입니다.
 
 import os
-import sys
 import math
 import zlib
 import binwalk.core.common
 from binwalk.core.compat import *
 from binwalk.core.module import Module, Option, Kwarg
-
-try:
-
-    from numba import njit  # numba를 사용하여 JIT 컴파일을 통한 성능 향상
-
-except ImportError:
-
-    def njit(func):
-    
-        return func  # numba가 없을 경우 JIT을 사용하지 않고 함수를 그대로 반환
+from binwalk.core.exceptions import ModuleException
 
 class Entropy(Module):
 
@@ -36,12 +26,33 @@ class Entropy(Module):
     DEFAULT_BLOCK_SIZE = 1024  # 기본 블록 크기
     DEFAULT_DATA_POINTS = 2048  # 기본 데이터 포인트 수
 
+    # numpy 엔진이 한 번에 계산할 최대 히스토그램 카운터 수 (창 수 * 256)입니다. 작은 블록 크기에서 메모리 사용량을 제한합니다.
+    NUMPY_MAX_COUNTERS = 1024 * 1024
+
+    # 영역 분류 (--classify) 기준
+    PADDING_RATIO = .9  # 가장 많은 바이트 값의 비율이 이 값 이상이면 패딩
+    TEXT_RATIO = .9  # 출력 가능한 ASCII 문자의 비율이 이 값 이상이면 텍스트
+    HIGH_ENTROPY = .9  # 보정된 엔트로피가 이 값 이상이면 압축 또는 암호화된 데이터
+    RANDOM_SIGMAS = 3  # 카이 제곱, 산술 평균, 몬테카를로 pi가 모두 균일 분포의 기댓값에서 이 표준 편차 이내이면 암호화된 데이터
+    TEXT_BYTES = [9, 10, 13] + list(range(32, 127))
+
+    # 영역 분류 이름과 설명
+    REGION_LABELS = {
+        'padding': '패딩',
+        'plaintext': '텍스트',
+        'code': '코드 또는 구조화된 데이터',
+        'compressed': '압축된 데이터',
+        'encrypted': '암호화된 (또는 압축된) 데이터',
+    }
+
     DEFAULT_TRIGGER_HIGH = .95  # 상승 엣지 트리거 임계값
     DEFAULT_TRIGGER_LOW = .85  # 하강 엣지 트리거 임계값
 
     TITLE = "Entropy"  # 모듈의 제목
     ORDER = 8  # 모듈 실행 순서
 
+    COMPACT_RESULTS = True  # 데이터 블록마다 결과가 생성되므로 결과를 열 단위로 저장 (참조: Module.COMPACT_RESULTS)
+
     # 명령줄 인터페이스 옵션 설정
     CLI = [
         Option(short='E',
@@ -74,6 +85,16 @@ class Entropy(Module):
                type=float,
                kwargs={'trigger_low': DEFAULT_TRIGGER_LOW},
                description='하강 엣지 엔트로피 트리거 임계값 설정 (기본값: %.2f)' % DEFAULT_TRIGGER_LOW),
+        Option(long='step',
+               type=int,
+               kwargs={'step': 0},
+               description='블록 크기의 창을 지정된 바이트만큼씩 이동하며 엔트로피 계산 (슬라이딩 창)'),
+        Option(long='classify',
+               kwargs={'classify': True},
+               description='각 블록의 바이트 분포로 데이터 영역 분류 (패딩, 텍스트, 코드, 압축, 암호화; numpy 필요)'),
+        Option(long='pyramid',
+               kwargs={'pyramid': True},
+               description='여러 블록 크기의 엔트로피를 한 번에 계산하여 저장하고, 이후 스캔에서 재사용 (numpy 필요)'),
     ]
 
     KWARGS = [
@@ -86,6 +107,9 @@ class Entropy(Module):
         Kwarg(name='do_plot', default=True),
         Kwarg(name='show_legend', default=True),
         Kwarg(name='block_size', default=0),
+        Kwarg(name='step', default=0),
+        Kwarg(name='pyramid', default=False),
+        Kwarg(name='classify', default=False),
     ]
 
     # 이 모듈을 마지막에 실행하여 다른 모듈의 결과를 처리하고 엔트로피 그래프에 오버레이합니다.
@@ -99,20 +123,60 @@ class Entropy(Module):
         self.output_file = None
 
         # 엔트로피 분석에 사용할 알고리즘 설정
+        # self.algorithm은 하나의 데이터 창, self.block_algorithm은 읽은 데이터 블록의 모든 창의 엔트로피를 계산합니다.
+        self.numpy = None
+        self.block_algorithm = self.entropy_windows
+
         if self.use_zlib:
         
             self.algorithm = self.gzip
         
         else:
-        
-            if 'numpy' in sys.modules:
-        
+
+            # numpy는 이 모듈이 활성화된 경우에만 가져오며, 설치되지 않은 경우 순수 Python 구현을 사용합니다.
+            try:
+
+                import numpy
+
+                self.numpy = numpy
                 self.algorithm = self.shannon_numpy
-        
-            else:
-        
+                self.block_algorithm = self.shannon_numpy_windows
+
+            except ImportError:
+
                 self.algorithm = self.shannon
 
+        # 슬라이딩 창 엔트로피는 창의 바이트 히스토그램을 갱신하여 계산하므로, Shannon 엔트로피만 지원합니다.
+        if self.step and self.use_zlib:
+
+            binwalk.core.common.warning("--step은 Shannon 엔트로피만 지원하므로 --fast 옵션을 무시합니다.")
+
+        # 엔트로피 피라미드는 창의 히스토그램을 합하여 상위 레벨을 계산하므로, Shannon 엔트로피와 겹치지 않는 창에서만 사용할 수 있습니다.
+        if self.pyramid:
+
+            if self.use_zlib or self.step:
+
+                binwalk.core.common.warning("--pyramid는 --fast 또는 --step과 함께 사용할 수 없으므로 무시합니다.")
+
+                self.pyramid = False
+
+            elif self.numpy is None:
+
+                raise ModuleException("numpy 모듈을 찾을 수 없습니다. 엔트로피 피라미드를 사용하려면 numpy를 설치하십시오.")
+
+        # 영역 분류는 Shannon 엔트로피의 히스토그램을 사용하므로, 겹치지 않는 창에서 파일을 읽는 경우에만 사용할 수 있습니다.
+        if self.classify:
+
+            if self.use_zlib or self.step or self.pyramid:
+
+                binwalk.core.common.warning("--classify는 --fast, --step 또는 --pyramid와 함께 사용할 수 없으므로 무시합니다.")
+
+                self.classify = False
+
+            elif self.numpy is None:
+
+                raise ModuleException("numpy 모듈을 찾을 수 없습니다. 영역 분류를 사용하려면 numpy를 설치하십시오.")
+
         # 다른 모듈들의 결과를 가져와 엔트로피 그래프에 표시할 마커 설정
         for (module, obj) in iterator(self.modules):
         
@@ -189,11 +253,14 @@ class Entropy(Module):
                 self.footer()
 
     def calculate_file_entropy(self, fp):   # 파일의 엔트로피를 계산하는 함수
-    
-        last_edge = None  # 마지막으로 표시된 상승/하강 엣지
-        trigger_reset = True  # 트리거 리셋 플래그
+
+        self.last_edge = None  # 마지막으로 표시된 상승/하강 엣지
+        self.trigger_reset = True  # 트리거 리셋 플래그
+        self.region = None  # 분류가 같은 연속된 창의 (분류, 시작 오프셋, 끝 오프셋, 히스토그램 합, pi 합, pi 점 수) (참조: self.region_result)
+        self.region_windows = []  # 영역이 끝날 때까지 생성하지 않고 보류한 창의 (오프셋, 엔트로피, kwargs) 목록 (--classify)
 
         self.clear(results=True)  # 이전 분석 결과 제거
+        self.entropy_points = []  # 그래프에 표시할 (오프셋, 엔트로피) 목록; 결과를 저장하지 않는 경우에도 사용됨 (참조: binwalk.scan_iter)
 
         # 블록 크기 설정
         if self.block_size is None:
@@ -212,71 +279,484 @@ class Entropy(Module):
         binwalk.core.common.debug("엔트로피 블록 크기 (%d 데이터 포인트): %d" %
                                   (self.DEFAULT_DATA_POINTS, block_size))
 
-        while True:
+        if self.step > 0:
 
-            file_offset = fp.tell()
+            self.calculate_rolling_entropy(fp, block_size, self.step)
 
-            (data, dlen) = fp.read_block()
-            
-            if dlen < 1:
-            
-                break
+        elif self.pyramid:
 
-            i = 0
-            
-            while i < dlen:
-            
-                entropy = self.algorithm(data[i:i + block_size])
-                display = self.display_results
-                description = "%f" % entropy
+            self.calculate_pyramid_entropy(fp, block_size)
 
-                if not self.config.verbose:
-            
-                    if last_edge in [None, 0] and entropy > self.trigger_low:
-            
-                        trigger_reset = True
-            
-                    elif last_edge in [None, 1] and entropy < self.trigger_high:
-            
-                        trigger_reset = True
+        else:
 
-                    if trigger_reset and entropy >= self.trigger_high:
-            
-                        description = "상승 엔트로피 엣지 (%f)" % entropy
-            
-                        display = self.display_results
-            
-                        last_edge = 1
-            
-                        trigger_reset = False
-            
-                    elif trigger_reset and entropy <= self.trigger_low:
-            
-                        description = "하강 엔트로피 엣지 (%f)" % entropy
-            
-                        display = self.display_results
-            
-                        last_edge = 0
-            
-                        trigger_reset = False
+            while True:
+
+                file_offset = fp.tell()
+
+                (data, dlen) = fp.read_block()
             
-                    else:
+                if dlen < 1:
             
-                        display = False
-                        description = "%f" % entropy
+                    break
+
+                if self.classify:
+
+                    self.classify_block(fp, file_offset, data, dlen, block_size)
+
+                    continue
+
+                for (i, entropy) in zip(range(0, dlen, block_size), self.block_algorithm(data, dlen, block_size)):
 
-                r = self.result(offset=(file_offset + i),
-                                file=fp,
-                                entropy=entropy,
-                                description=description,
-                                display=display)
+                    self.entropy_result(fp, file_offset + i, entropy)
 
-                i += block_size
+            # 마지막 영역의 결과를 생성합니다.
+            self.region_result(fp)
 
         if self.do_plot:
            
             self.plot_entropy(fp.name)
 
+    def calculate_rolling_entropy(self, fp, block_size, step):
+        '''
+        block_size 크기의 창을 step 바이트씩 이동하며 각 창의 Shannon 엔트로피 결과를 생성합니다 (--step).
+        창의 바이트 히스토그램과 sum(c * log2(c))를 유지하고, 창에 들어오는 바이트를 더하고 나가는 바이트를 빼므로
+        창 크기에 관계없이 이동한 바이트당 일정한 비용이 듭니다.
+        창은 파일 데이터 안에 있는 경우에만 생성됩니다. 파일이 block_size보다 짧은 경우, 전체 파일의 결과 하나를 생성합니다.
+
+        @fp         - 대상 파일의 BlockFile 객체.
+        @block_size - 창 크기.
+        @step       - 창 이동 간격 (바이트).
+
+        반환값은 없습니다.
+        '''
+        log2 = lambda x: math.log(x, 2)
+
+        # c에서 c + 1로 증가할 때 c * log2(c)의 증가량
+        delta = [(c + 1) * log2(c + 1) - (c * log2(c) if c else 0.0) for c in range(0, block_size)]
+
+        hist = [0] * 256
+        total = 0.0  # 창의 sum(c * log2(c))
+        lo = hi = offset = None  # 히스토그램에 포함된 파일 데이터 [lo, hi)와 다음 창의 시작 오프셋
+        base = 0  # buf[0]의 파일 오프셋
+        buf = b''  # 파일 데이터 [base, avail); 창에서 아직 빼지 않았거나 더하지 않은 데이터
+        emitted = False
+
+        while True:
+
+            file_offset = fp.tell()
+
+            (data, dlen) = fp.read_block()
+
+            if dlen < 1:
+
+                break
+
+            data = _block_bytes(data[:dlen])
+
+            if offset is None:
+
+                lo = hi = offset = base = file_offset
+
+            buf = buf[lo - base:] + data
+            base = lo
+            avail = file_offset + dlen
+
+            # 누적된 부동소수점 오차를 없애기 위해 블록마다 히스토그램에서 합을 다시 계산합니다.
+            total = sum(c * log2(c) for c in hist if c)
+
+            while offset + block_size <= avail:
+
+                if offset >= hi:
+
+                    # 창이 겹치지 않는 경우 (step >= block_size), 히스토그램을 비웁니다.
+                    hist = [0] * 256
+                    total = 0.0
+                    lo = hi = offset
+
+                for byte in buf[lo - base:offset - base]:
+
+                    c = hist[byte] - 1
+                    hist[byte] = c
+                    total -= delta[c]
+
+                for byte in buf[hi - base:offset + block_size - base]:
+
+                    c = hist[byte]
+                    hist[byte] = c + 1
+                    total += delta[c]
+
+                lo = offset
+                hi = offset + block_size
+
+                self.entropy_result(fp, offset, (log2(block_size) - total / block_size) / 8)
+
+                emitted = True
+                offset += step
+
+        # 파일이 block_size보다 짧은 경우
+        if not emitted and buf:
+
+            self.entropy_result(fp, base, self.shannon(bytes2str(buf)))
+
+    def calculate_pyramid_entropy(self, fp, block_size):
+        '''
+        엔트로피 피라미드에서 block_size 창의 엔트로피 결과를 생성합니다 (--pyramid).
+        피라미드는 현재 디렉터리의 <파일 이름>.entropy.npz에 저장되며, 대상 파일 (크기, 수정 시간, --offset, --length, --swap)이
+        바뀌지 않았고 요청된 창 크기의 레벨이 있는 경우 파일을 다시 읽지 않고 재사용합니다.
+        블록 크기 (-K)를 지정하지 않은 경우, 기본 블록 크기의 2의 거듭제곱 배 중 계산된 블록 크기 이상인 가장 작은 창 크기를 사용합니다.
+
+        @fp         - 대상 파일의 BlockFile 객체.
+        @block_size - 창 크기.
+
+        반환값은 없습니다.
+        '''
+        if self.block_size is None:
+
+            window = self.DEFAULT_BLOCK_SIZE
+
+            while window < block_size:
+                window *= 2
+
+            block_size = window
+
+        path = os.path.join(os.getcwd(), os.path.basename(fp.name)) + '.entropy.npz'
+        key = self._pyramid_key(fp)
+
+        pyramid = None
+        if key is not None:
+            pyramid = EntropyPyramid.load(self.numpy, path, key)
+
+        if pyramid is None or not pyramid.has_level(block_size):
+
+            pyramid = self.build_pyramid(fp, self._pyramid_base(block_size))
+
+            if key is not None:
+
+                try:
+
+                    pyramid.save(path, key)
+
+                except KeyboardInterrupt:
+
+                    raise
+
+                except Exception as e:
+
+                    binwalk.core.common.warning("엔트로피 피라미드를 저장하지 못했습니다 '%s': %s" % (path, str(e)))
+
+        level = pyramid.level(block_size)
+
+        if level is not None:
+
+            for (i, entropy) in enumerate(level.entropies.tolist()):
+
+                self.entropy_result(fp, fp.offset + (i * level.window), entropy)
+
+    def build_pyramid(self, fp, base):
+        '''
+        파일을 한 번 읽어 base 크기 창의 히스토그램에서 엔트로피 피라미드를 생성합니다.
+
+        @fp   - 대상 파일의 BlockFile 객체.
+        @base - 최하위 레벨의 창 크기.
+
+        EntropyPyramid 객체를 반환합니다.
+        '''
+        np = self.numpy
+        pyramid = EntropyPyramid(np, base)
+        batch = max(self.NUMPY_MAX_COUNTERS // 256, 1)
+        tail = b''  # 이전 블록에서 창을 채우지 못한 데이터
+
+        while True:
+
+            # 피라미드를 만드는 동안에는 결과를 생성하지 않으므로, 중단 요청을 블록마다 확인합니다.
+            self.parent.check_stopped()
+
+            (data, dlen) = fp.read_block()
+
+            if dlen < 1:
+
+                break
+
+            data = tail + _block_bytes(data[:dlen])
+            count = len(data) // base
+
+            for start in range(0, count, batch):
+                n = min(batch, count - start)
+                windows = np.frombuffer(data, dtype=np.uint8, count=n * base, offset=start * base)
+                pyramid.add(self._histograms(windows.reshape(n, base)))
+
+            tail = data[count * base:]
+
+        # 파일 끝의 마지막 창은 base보다 짧을 수 있습니다.
+        if tail:
+            pyramid.add(self._histograms(np.frombuffer(tail, dtype=np.uint8).reshape(1, -1)))
+
+        pyramid.finish()
+
+        return pyramid
+
+    def _pyramid_base(self, window):
+        '''
+        창 크기가 기본 블록 크기의 2의 거듭제곱 배인 경우 기본 블록 크기를, 그렇지 않은 경우 창 크기를 피라미드의 최하위 창 크기로 반환합니다.
+        '''
+        base = self.DEFAULT_BLOCK_SIZE
+
+        while base < window:
+            base *= 2
+
+        if base == window:
+            return self.DEFAULT_BLOCK_SIZE
+
+        return window
+
+    def _pyramid_key(self, fp):
+        '''
+        저장된 피라미드가 대상 파일과 일치하는지 확인하기 위한 값 목록을 반환합니다.
+        메모리 버퍼 (참조: binwalk.scan의 data 인자)처럼 파일이 아닌 경우 None을 반환합니다 (피라미드를 저장하지 않음).
+        '''
+        if binwalk.core.common.BufferFile.lookup(fp.path) is not None:
+            return None
+
+        try:
+            st = os.stat(fp.path)
+        except OSError:
+            return None
+
+        return [st.st_size, st.st_mtime, fp.offset, fp.length, fp.swap_size]
+
+    def classify_block(self, fp, file_offset, data, dlen, block_size):
+        '''
+        읽은 데이터 블록의 각 창의 엔트로피와 ent 방식의 통계 (카이 제곱, 산술 평균, 몬테카를로 pi)를 같은 히스토그램에서 계산하고,
+        창의 데이터를 분류합니다 (--classify). 각 창의 엔트로피 결과에는 통계와 분류 (label)가 포함되며,
+        분류가 같은 연속된 창은 하나의 영역으로 합쳐집니다 (참조: self.region_result).
+        결과가 오프셋 순서로 생성되도록, 창의 엔트로피 결과는 창이 속한 영역의 결과를 생성한 후에 생성합니다.
+
+        @fp          - 대상 파일의 BlockFile 객체.
+        @file_offset - 블록의 파일 오프셋.
+        @data        - read_block이 반환한 블록 데이터.
+        @dlen        - 블록 데이터 길이.
+        @block_size  - 창 크기.
+
+        반환값은 없습니다.
+        '''
+        i = 0
+
+        for windows in self._numpy_windows(data, dlen, block_size):
+
+            counts = self._histograms(windows)
+            entropies = _histogram_entropy(self.numpy, counts)
+            (chi_square, mean, pi, labels) = self._classify(windows, counts, entropies)
+            length = windows.shape[1]
+            points = length // 6
+            labels = labels.tolist()
+            windows = list(zip(entropies.tolist(), chi_square.tolist(), mean.tolist(), pi.tolist(), labels))
+
+            # 분류가 같은 연속된 창 (j부터 k 이전까지)의 히스토그램과 pi는 한 번에 영역에 더하고, 창 결과는 영역이 끝날 때까지 보류합니다.
+            j = 0
+            while j < len(labels):
+
+                k = j + 1
+                while k < len(labels) and labels[k] == labels[j]:
+                    k += 1
+
+                self.region_result(fp,
+                                   file_offset + i,
+                                   ((k - j - 1) * block_size) + length,
+                                   labels[j],
+                                   counts[j:k].sum(axis=0),
+                                   (float(pi[j:k].sum()) * points if points else 0.0),
+                                   (k - j) * points)
+
+                for (entropy, c, m, p, label) in windows[j:k]:
+
+                    self.region_windows.append((file_offset + i, entropy, {'chi_square': c, 'mean': m, 'pi': p, 'label': label, 'region': False}))
+
+                    i += block_size
+
+                j = k
+
+    def _classify(self, windows, counts, entropies):
+        '''
+        (창 수, 창 크기) 배열의 각 행의 카이 제곱, 산술 평균, 몬테카를로 pi와 분류를 계산합니다.
+
+        (카이 제곱, 산술 평균, 몬테카를로 pi, 분류) 배열의 튜플을 반환합니다.
+        '''
+        np = self.numpy
+        (n, length) = windows.shape
+
+        # 균일 분포에 대한 카이 제곱과 Wilson-Hilferty 근사를 사용한 표준 정규 점수 (자유도 255)
+        (chi_square, mean) = self._uniform_statistics(counts, length)
+        k = 255.0
+        chi_z = ((chi_square / k) ** (1 / 3.0) - (1 - 2 / (9 * k))) / math.sqrt(2 / (9 * k))
+
+        # 산술 평균 (균일 분포의 기댓값은 127.5)
+        mean_z = np.abs(mean - 127.5) / (math.sqrt((256 ** 2 - 1) / 12.0) / math.sqrt(length))
+
+        # 몬테카를로 pi: 6 바이트마다 24비트 (x, y) 좌표가 원 안에 있는 비율
+        points = length // 6
+        if points:
+            xy = windows[:, :points * 6].reshape(n, points, 2, 3).astype(np.uint32)
+            xy = ((xy[:, :, :, 0] << 16) | (xy[:, :, :, 1] << 8) | xy[:, :, :, 2]).astype(np.float64)
+            radius = float((1 << 24) - 1)
+            inside = ((xy[:, :, 0] ** 2 + xy[:, :, 1] ** 2) <= radius ** 2).sum(axis=1)
+            pi = 4.0 * inside / points
+            pi_z = np.abs(pi - math.pi) / (4 * math.sqrt((math.pi / 4) * (1 - math.pi / 4) / points))
+        else:
+            pi = np.full(n, np.nan)
+            pi_z = np.zeros(n)
+
+        # 작은 창에서 엔트로피가 낮게 추정되는 것을 Miller-Madow 보정으로 보상합니다.
+        corrected = entropies + ((counts > 0).sum(axis=1) - 1) / (2 * length * math.log(2)) / 8
+
+        peak = counts.max(axis=1) / float(length)
+        printable = counts[:, self.TEXT_BYTES].sum(axis=1) / float(length)
+        random = (chi_z <= self.RANDOM_SIGMAS) & (mean_z <= self.RANDOM_SIGMAS) & (pi_z <= self.RANDOM_SIGMAS)
+
+        labels = np.where(peak >= self.PADDING_RATIO, 'padding',
+                 np.where(printable >= self.TEXT_RATIO, 'plaintext',
+                 np.where(corrected < self.HIGH_ENTROPY, 'code',
+                 np.where(random, 'encrypted', 'compressed'))))
+
+        return (chi_square, mean, pi, labels)
+
+    def _uniform_statistics(self, counts, length):
+        '''
+        (창 수, 256) 히스토그램 배열의 각 행의 균일 분포에 대한 카이 제곱과 산술 평균을 계산합니다.
+
+        (카이 제곱, 산술 평균) 배열의 튜플을 반환합니다.
+        '''
+        expected = length / 256.0
+        chi_square = ((counts - expected) ** 2).sum(axis=1) / expected
+        mean = counts.dot(self.numpy.arange(256)) / float(length)
+
+        return (chi_square, mean)
+
+    def region_result(self, fp, offset=None, length=0, label=None, counts=None, pi_sum=0.0, points=0):
+        '''
+        분류가 같은 연속된 창을 하나의 영역으로 합칩니다.
+        분류가 바뀌거나 파일이 끝나면 (offset이 None) 이전 영역의 결과를 생성하고, 보류한 영역의 창 엔트로피 결과를 생성합니다.
+
+        영역 결과는 창 결과와 같은 모듈 결과로 생성되며 (binwalk.scan_iter, 스캔 서버, --log 등), region 속성이 True입니다 (창 결과는 False).
+        영역 결과의 size와 label은 영역의 크기와 분류이고, entropy, chi_square, mean은 영역의 모든 창의 히스토그램을 합하여 계산하며,
+        pi는 창의 값의 평균입니다. 영역 결과는 첫 번째 창 결과보다 먼저 생성되므로 결과와 표시는 오프셋 순서입니다.
+
+        @fp     - 대상 파일의 BlockFile 객체.
+        @offset - 분류가 같은 연속된 창의 파일 오프셋.
+        @length - 연속된 창의 길이.
+        @label  - 창의 분류.
+        @counts - 연속된 창의 바이트 히스토그램의 합.
+        @pi_sum - 연속된 창의 (몬테카를로 pi * pi 점 수)의 합.
+        @points - 연속된 창의 pi 점 수의 합.
+
+        반환값은 없습니다.
+        '''
+        if self.region is not None:
+
+            (region_label, start, end, region_counts, region_pi_sum, region_points) = self.region
+
+            if offset is not None and label == region_label:
+
+                self.region = (region_label, start, max(end, offset + length), region_counts + counts, region_pi_sum + pi_sum, region_points + points)
+
+                return
+
+            # 창은 읽기 블록의 추가 데이터와 겹칠 수 있으므로, 영역은 다음 창의 시작에서 끝납니다.
+            if offset is not None:
+
+                end = min(end, offset)
+
+            histogram = region_counts.reshape(1, 256)
+            (chi_square, mean) = self._uniform_statistics(histogram, int(region_counts.sum()))
+
+            self.result(offset=start,
+                        size=(end - start),
+                        file=fp,
+                        entropy=float(_histogram_entropy(self.numpy, histogram)[0]),
+                        chi_square=float(chi_square[0]),
+                        mean=float(mean[0]),
+                        pi=(region_pi_sum / region_points if region_points else float('nan')),
+                        label=region_label,
+                        region=True,
+                        description="%s 영역, 크기: %d 바이트" % (self.REGION_LABELS[region_label], end - start),
+                        plot=False,
+                        display=self.display_results)
+
+            # 영역 결과 다음에 영역의 창 엔트로피 결과를 생성합니다.
+            for (window_offset, entropy, kwargs) in self.region_windows:
+
+                self.entropy_result(fp, window_offset, entropy, **kwargs)
+
+            self.region_windows = []
+
+        if offset is not None:
+
+            self.region = (label, offset, offset + length, counts.astype(self.numpy.int64), pi_sum, points)
+
+        else:
+
+            self.region = None
+
+    def entropy_result(self, fp, offset, entropy, **kwargs):
+        '''
+        창의 엔트로피 결과를 생성합니다. 자세한 출력 (--verbose)이 아닌 경우, 상승/하강 엔트로피 엣지만 표시합니다.
+
+        @fp      - 대상 파일의 BlockFile 객체.
+        @offset  - 창의 파일 오프셋.
+        @entropy - 창의 엔트로피.
+
+        필요한 경우 결과에 추가할 kwargs를 제공합니다.
+
+        반환값은 없습니다.
+        '''
+        display = self.display_results
+        description = "%f" % entropy
+
+        if not self.config.verbose:
+    
+            if self.last_edge in [None, 0] and entropy > self.trigger_low:
+    
+                self.trigger_reset = True
+    
+            elif self.last_edge in [None, 1] and entropy < self.trigger_high:
+    
+                self.trigger_reset = True
+
+            if self.trigger_reset and entropy >= self.trigger_high:
+    
+                description = "상승 엔트로피 엣지 (%f)" % entropy
+    
+                display = self.display_results
+    
+                self.last_edge = 1
+    
+                self.trigger_reset = False
+    
+            elif self.trigger_reset and entropy <= self.trigger_low:
+    
+                description = "하강 엔트로피 엣지 (%f)" % entropy
+    
+                display = self.display_results
+    
+                self.last_edge = 0
+    
+                self.trigger_reset = False
+    
+            else:
+    
+                display = False
+                description = "%f" % entropy
+
+        r = self.result(offset=offset,
+                        file=fp,
+                        entropy=entropy,
+                        description=description,
+                        display=display,
+                        **kwargs)
+
+        if r.valid and self.do_plot:
+
+            self.entropy_points.append((r.offset, r.entropy))
+
     def shannon(self, data):    # Shannon 엔트로피 분석을 수행하는 함수.
         
         entropy = 0
@@ -301,29 +781,76 @@ class Entropy(Module):
 
         return (entropy / 8)
 
-    def shannon_numpy(self, data):
+    def entropy_windows(self, data, dlen, block_size):
+        '''
+        데이터 블록의 각 창 (data[i:i + block_size], i = 0, block_size, ... < dlen)의 엔트로피를 self.algorithm으로 계산합니다.
+        마지막 창은 블록의 추가 데이터 (dlen 이후의 데이터)를 포함할 수 있습니다.
+
+        @data       - read_block이 반환한 블록 데이터.
+        @dlen       - 블록 데이터 길이.
+        @block_size - 창 크기.
+
+        각 창의 엔트로피 목록을 반환합니다.
+        '''
+        return [self.algorithm(data[i:i + block_size]) for i in range(0, dlen, block_size)]
+
+    def shannon_numpy(self, data):  # numpy를 사용하여 하나의 데이터 창의 Shannon 엔트로피를 계산하는 함수
         
         if data:
         
-            return self._shannon_numpy(bytes2str(data))
+            return self.shannon_numpy_windows(data, len(data), len(data))[0]
         
         else:
         
             return 0
-    
-    @staticmethod
-    
-    @njit
-    
-    def _shannon_numpy(data):   # Numpy를 사용하여 Shannon 엔트로피를 계산하는 함수
 
-        A = np.frombuffer(data, dtype=np.uint8)
-    
-        pA = np.bincount(A) / len(A)
-    
-        entropy = -np.nansum(pA*np.log2(pA))
-    
-        return (entropy / 8)
+    def shannon_numpy_windows(self, data, dlen, block_size):
+        '''
+        entropy_windows와 동일하지만, 블록 데이터를 복사 없이 (창 수, block_size) 배열로 보고 모든 창의 엔트로피를 한 번에 계산합니다.
+        '''
+        entropies = []
+
+        for windows in self._numpy_windows(data, dlen, block_size):
+            entropies += self._shannon_numpy(windows).tolist()
+
+        return entropies
+
+    def _numpy_windows(self, data, dlen, block_size):
+        '''
+        데이터 블록의 창 (참조: self.entropy_windows)을 복사 없이 (창 수, block_size) numpy 배열로 생성합니다.
+        히스토그램의 메모리 사용량을 제한하기 위해 최대 NUMPY_MAX_COUNTERS / 256개의 창씩 생성합니다.
+        '''
+        np = self.numpy
+
+        data = _block_bytes(data)
+
+        count = (dlen + block_size - 1) // block_size
+        full = min(count, len(data) // block_size)
+        batch = max(self.NUMPY_MAX_COUNTERS // 256, 1)
+
+        for start in range(0, full, batch):
+            n = min(batch, full - start)
+            windows = np.frombuffer(data, dtype=np.uint8, count=n * block_size, offset=start * block_size)
+            yield windows.reshape(n, block_size)
+
+        # 파일 끝의 마지막 창은 block_size보다 짧을 수 있습니다.
+        if full < count:
+            window = np.frombuffer(data, dtype=np.uint8, offset=full * block_size)
+            yield window.reshape(1, -1)
+
+    def _shannon_numpy(self, windows):  # (창 수, 창 크기) 배열의 각 행의 Shannon 엔트로피를 계산하는 함수
+
+        return _histogram_entropy(self.numpy, self._histograms(windows))
+
+    def _histograms(self, windows):     # (창 수, 창 크기) 배열의 각 행의 바이트 히스토그램을 (창 수, 256) 배열로 계산하는 함수
+
+        np = self.numpy
+        n = windows.shape[0]
+
+        # 각 행의 바이트 값을 행마다 다른 256개 구간으로 옮겨, 하나의 bincount로 모든 행의 히스토그램을 계산합니다.
+        index = windows + (np.arange(n, dtype=np.intp) * 256)[:, None]
+
+        return np.bincount(index.ravel(), minlength=n * 256).reshape(n, 256)
 
     def gzip(self, data, truncate=True):    # zlib 압축 비율을 기반으로 엔트로피 분석을 수행하는 함수. , 이는 Shannon 엔트로피 분석보다 빠르지만 정확도는 떨어집니다.
         
@@ -351,10 +878,10 @@ class Entropy(Module):
         
         plotted_colors = {}
 
-        for r in self.results:
+        for (offset, entropy) in self.entropy_points:
         
-            x.append(r.offset)
-            y.append(r.entropy)
+            x.append(offset)
+            y.append(entropy)
 
         fig = plt.figure()
 
@@ -409,3 +936,178 @@ class Entropy(Module):
         else:
         
             plt.show()
+
+
+class EntropyPyramid(object):
+    '''
+    여러 창 크기의 Shannon 엔트로피 (엔트로피 피라미드)를 저장하는 클래스입니다 (참조: Entropy.calculate_pyramid_entropy).
+
+    레벨 k의 창 크기는 base * 2**k이며, 각 창의 히스토그램은 하위 레벨 두 창의 히스토그램의 합입니다.
+    따라서 최하위 레벨의 히스토그램만으로 모든 레벨의 엔트로피를 정확하게 계산할 수 있습니다.
+    최상위 레벨은 전체 데이터를 하나의 창으로 포함하며, 각 레벨의 마지막 창은 창 크기보다 짧을 수 있습니다.
+    '''
+
+    VERSION = 1
+
+    def __init__(self, numpy, base):
+        '''
+        클래스 생성자.
+
+        @numpy - numpy 모듈.
+        @base  - 최하위 레벨의 창 크기.
+
+        반환값은 없습니다.
+        '''
+        self.numpy = numpy
+        self.base = base
+        # 레벨별 엔트로피 배열
+        self.levels = []
+        # 생성 중인 레벨별 엔트로피 배열 목록과, 아직 상위 레벨 창으로 합해지지 않은 히스토그램 (참조: self.add)
+        self.entropies = []
+        self.pending = []
+
+    def add(self, counts, level=0):
+        '''
+        레벨에 다음 창들의 히스토그램을 추가하고, 두 창씩 합하여 상위 레벨에 추가합니다.
+
+        @counts - (창 수, 256) 히스토그램 배열.
+        @level  - 레벨.
+
+        반환값은 없습니다.
+        '''
+        np = self.numpy
+
+        if level == len(self.entropies):
+            self.entropies.append([])
+            self.pending.append(None)
+
+        self.entropies[level].append(_histogram_entropy(np, counts))
+
+        if self.pending[level] is not None:
+            counts = np.concatenate((self.pending[level], counts))
+
+        n = len(counts) - (len(counts) % 2)
+        self.pending[level] = counts[n:] if n < len(counts) else None
+
+        if n:
+            self.add(counts[0:n:2] + counts[1:n:2], level + 1)
+
+    def finish(self):
+        '''
+        모든 창을 추가한 후 호출합니다. 짝이 없는 마지막 창을 최상위 레벨까지 전달하여 피라미드를 완성합니다.
+
+        반환값은 없습니다.
+        '''
+        np = self.numpy
+        level = 0
+
+        while level < len(self.entropies):
+            if level == len(self.entropies) - 1 and sum(len(e) for e in self.entropies[level]) == 1:
+                break
+
+            if self.pending[level] is not None:
+                counts = self.pending[level]
+                self.pending[level] = None
+                self.add(counts, level + 1)
+
+            level += 1
+
+        self.levels = [np.concatenate(entropies) for entropies in self.entropies]
+        self.entropies = []
+        self.pending = []
+
+    def has_level(self, window):
+        '''
+        창 크기가 window인 레벨이 있으면 True를 반환합니다.
+        window가 최상위 레벨의 창 크기보다 큰 경우, 결과는 최상위 레벨 (전체 데이터의 창 하나)과 같으므로 True를 반환합니다.
+        '''
+        if not self.levels:
+            return False
+
+        for k in range(0, len(self.levels)):
+            if (self.base << k) == window:
+                return True
+
+        return (self.base << (len(self.levels) - 1)) < window
+
+    def level(self, window):
+        '''
+        창 크기가 window 이상인 가장 작은 레벨을 반환합니다. 그러한 레벨이 없으면 최상위 레벨을 반환합니다.
+
+        @window - 창 크기.
+
+        window 및 entropies 속성을 가진 GenericContainer를 반환합니다. 피라미드가 비어 있으면 None을 반환합니다.
+        '''
+        for (k, entropies) in enumerate(self.levels):
+            if (self.base << k) >= window or k == len(self.levels) - 1:
+                return binwalk.core.common.GenericContainer(window=(self.base << k), entropies=entropies)
+
+        return None
+
+    def save(self, path, key):
+        '''
+        피라미드를 numpy .npz 파일로 저장합니다.
+
+        @path - 파일 경로.
+        @key  - 대상 파일을 식별하는 숫자 목록 (참조: self.load).
+
+        반환값은 없습니다.
+        '''
+        np = self.numpy
+
+        arrays = dict([('level%d' % k, entropies) for (k, entropies) in enumerate(self.levels)])
+        arrays['header'] = np.array([self.VERSION, self.base] + list(key), dtype=np.float64)
+
+        # 다른 스캔이 불완전한 파일을 읽지 않도록 임시 파일에 저장한 후 이름을 바꿉니다.
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as fp:
+            np.savez(fp, **arrays)
+        os.rename(tmp, path)
+
+    @staticmethod
+    def load(numpy, path, key):
+        '''
+        저장된 피라미드를 읽습니다.
+
+        @numpy - numpy 모듈.
+        @path  - 파일 경로.
+        @key   - 대상 파일을 식별하는 숫자 목록. 저장된 값과 다르면 피라미드를 사용하지 않습니다.
+
+        EntropyPyramid 객체를 반환합니다. 파일이 없거나, 읽을 수 없거나, 대상 파일과 일치하지 않으면 None을 반환합니다.
+        '''
+        try:
+            with numpy.load(path) as data:
+                header = data['header'].tolist()
+                if header[0] != EntropyPyramid.VERSION or header[2:] != [float(x) for x in key]:
+                    return None
+
+                pyramid = EntropyPyramid(numpy, int(header[1]))
+                pyramid.levels = [data['level%d' % k] for k in range(0, len(data.files) - 1)]
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            if os.path.exists(path):
+                binwalk.core.common.debug("엔트로피 피라미드를 읽지 못했습니다 '%s': %s" % (path, str(e)))
+            return None
+
+        return pyramid
+
+
+def _histogram_entropy(np, counts):
+    '''
+    (창 수, 256) 히스토그램 배열의 각 행의 Shannon 엔트로피 배열을 반환합니다.
+    '''
+    p = counts / counts.sum(axis=1, keepdims=True).astype(np.float64)
+    log_p = np.log2(p, out=np.zeros_like(p), where=(p > 0))
+
+    return (0.0 - (p * log_p).sum(axis=1)) / 8
+
+
+def _block_bytes(data):
+    '''
+    read_block이 반환한 블록 데이터를 numpy.frombuffer 및 바이트 값 인덱싱에 사용할 수 있는 객체로 반환합니다.
+    str은 bytes로 변환하고, bytes 및 memoryview는 복사하지 않고 그대로 반환합니다.
+    '''
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return data
+    return str2bytes(data)
@@ -6,12 +6,14 @@ import os
 import re
 import pwd
 import stat
+import time
 import shlex
+import signal
 import tempfile
 import subprocess
 import binwalk.core.common
 from binwalk.core.compat import *
-from binwalk.core.exceptions import ModuleException
+from binwalk.core.exceptions import ModuleException, ScanStoppedException
 from binwalk.core.module import Module, Option, Kwarg
 from binwalk.core.common import file_size, file_md5, unique_file_name, BlockFile
 
@@ -42,12 +44,19 @@ class Extractor(Module):
     # extract.conf 파일에서 주석은 #으로 시작합니다.
     COMMENT_DELIM = '#'
 
+    # 외부 추출기 실행 중 스캔 중단 여부를 확인하는 간격 (초) (참조: self._wait)
+    PROCESS_POLL_INTERVAL = .1
+
     # 명령어에서 추출된 파일 이름을 나타내는 플레이스홀더
     FILE_NAME_PLACEHOLDER = '%e'
 
     # 고유한 출력 파일/디렉터리 이름을 생성하기 위한 구분자
     UNIQUE_PATH_DELIMITER = '%%'
 
+    # 추출 규칙 파일 경로별 (파일 상태, 규칙 목록)입니다.
+    # 각 규칙 파일은 변경되지 않는 한 프로세스당 한 번만 파싱됩니다 (참조: self._file_rules).
+    RULES_REGISTRY = {}
+
     # 클래스의 메타정보
     TITLE = 'Extraction'
     ORDER = 9
@@ -454,15 +463,42 @@ class Extractor(Module):
         반환 값 없음.
         '''
         try:
-            # extract 파일에서 각 줄을 처리하고, 주석을 무시함
-            with open(fname, 'r') as f:
-                for rule in f.readlines():
-                    self.add_rule(rule.split(self.COMMENT_DELIM, 1)[0])
+            for r in self._file_rules(fname):
+                self.append_rule(r)
         except KeyboardInterrupt as e:
             raise e
         except Exception as e:
             raise Exception("Extractor.load_from_file 파일 '%s' 로드 실패: %s" % (fname, str(e)))
 
+    def _file_rules(self, fname):
+        '''
+        지정된 파일의 추출 규칙을 생성합니다.
+        생성된 규칙은 self.RULES_REGISTRY에 저장되며, 파일이 변경되지 않은 경우 다시 파싱하지 않습니다.
+
+        @fname - 추출 규칙 파일의 경로.
+
+        규칙 목록을 반환합니다. 규칙은 self.append_rule로 복사하여 사용해야 합니다.
+        '''
+        st = os.stat(fname)
+        state = (st.st_mtime, st.st_size)
+
+        try:
+            (cached_state, rules) = self.RULES_REGISTRY[fname]
+            if cached_state == state:
+                return rules
+        except KeyError:
+            pass
+
+        rules = []
+        # extract 파일에서 각 줄을 처리하고, 주석을 무시함
+        with open(fname, 'r') as f:
+            for rule in f.readlines():
+                rules += [r.copy() for r in self.create_rule(rule.split(self.COMMENT_DELIM, 1)[0])]
+
+        self.RULES_REGISTRY[fname] = (state, rules)
+
+        return rules
+
     def load_defaults(self):
         '''
         사용자 및 시스템 extract.conf 파일에서 기본 추출 규칙을 로드합니다.
@@ -582,7 +618,11 @@ class Extractor(Module):
         command_line = ''
         original_dir = os.getcwd()
         rules = self.match(description)
-        file_path = os.path.realpath(file_name)
+        # 등록된 메모리 버퍼는 등록된 이름 그대로 찾습니다 (참조: binwalk.core.common.BufferFile.register).
+        if binwalk.core.common.BufferFile.lookup(file_name) is not None:
+            file_path = file_name
+        else:
+            file_path = os.path.realpath(file_name)
 
         # 이 파일에 대한 추출 규칙이 없는 경우
         if not rules:
@@ -598,86 +638,90 @@ class Extractor(Module):
         if not size:
             size = file_size(file_path) - offset
 
-        if os.path.isfile(file_path):
+        # 메모리 버퍼 (참조: binwalk.core.common.BufferFile)에서는 추출된 데이터만 디스크에 기록됩니다.
+        if os.path.isfile(file_path) or binwalk.core.common.BufferFile.lookup(file_path) is not None:
             binwalk.core.common.debug("디렉터리를 다음으로 변경: %s" % output_directory)
             os.chdir(output_directory)
 
-            # 오프셋으로 명명된 하위 디렉터리에 추출
-            if self.extract_into_subdirs:
-                # hex()에 의해 추가된 끝에 있는 L을 제거
-                offset_dir = "0x%X" % offset
-                os.mkdir(offset_dir)
-                os.chdir(offset_dir)
-
-            # 각 추출 규칙을 반복하여 하나가 성공할 때까지 시도
-            for i in range(0, len(rules)):
-                rule = rules[i]
-
-                binwalk.core.common.debug("추출 규칙 #%d (%s) 처리 중" % (i, str(rule['cmd'])))
-
-                # 추출된 디렉터리로 재귀하지 않도록 지시된 경우 확인
-                if rule['recurse'] in [True, False]:
-                    recurse = rule['recurse']
-                else:
-                    recurse = True
-
-                binwalk.core.common.debug("%s[%d:]에서 %s로 추출 중" % (file_path, offset, name))
-
-                # 아직 데이터를 디스크에 복사하지 않은 경우 복사
-                fname = self._dd(file_path, offset, size, rule['extension'], output_file_name=name)
-
-                # 이 규칙에 대해 명령이 지정된 경우 실행 시도
-                # 실행에 실패하면 다음 규칙이 시도됨
-                if rule['cmd']:
-
-                    # 원본 파일의 해시 기록; --rm이 지정되고 추출 유틸리티가 새 파일을 생성하는 대신 원본 파일을 수정하는 경우
-                    if self.remove_after_execute:
-                        fname_md5 = file_md5(fname)
-
-                    binwalk.core.common.debug("추출 명령 실행 중 %s" % (str(rule['cmd'])))
-
-                    # 추출된 파일에 대해 지정된 명령 실행
-                    if self.run_extractors:
-                        (extract_ok, command_line) = self.execute(rule['cmd'], fname, rule['codes'])
+            # 추출이 중단되어도 (예: ScanStoppedException) 작업 디렉터리는 복원합니다.
+            try:
+                # 오프셋으로 명명된 하위 디렉터리에 추출
+                if self.extract_into_subdirs:
+                    # hex()에 의해 추가된 끝에 있는 L을 제거
+                    offset_dir = "0x%X" % offset
+                    os.mkdir(offset_dir)
+                    os.chdir(offset_dir)
+
+                # 각 추출 규칙을 반복하여 하나가 성공할 때까지 시도
+                for i in range(0, len(rules)):
+                    rule = rules[i]
+
+                    binwalk.core.common.debug("추출 규칙 #%d (%s) 처리 중" % (i, str(rule['cmd'])))
+
+                    # 추출된 디렉터리로 재귀하지 않도록 지시된 경우 확인
+                    if rule['recurse'] in [True, False]:
+                        recurse = rule['recurse']
                     else:
-                        extract_ok = True
-                        command_line = ''
-
-                    binwalk.core.common.debug("추출 명령 실행: %s" % command_line)
-                    binwalk.core.common.debug("추출 성공: %s" % extract_ok)
-
-                    # remove_after_execute가 지정된 경우에만 파일 정리
-                    # 파일이 성공적으로 추출된 경우에만 정리; 그렇지 않으면 남아있음
-                    if self.remove_after_execute and (extract_ok == True or i == (len(rules) - 1)):
-
-                        # 추출된 원본 파일이 추출기에 의해 수정되지 않은 경우 삭제
-                        try:
-                            if file_md5(fname) == fname_md5:
+                        recurse = True
+
+                    binwalk.core.common.debug("%s[%d:]에서 %s로 추출 중" % (file_path, offset, name))
+
+                    # 아직 데이터를 디스크에 복사하지 않은 경우 복사
+                    fname = self._dd(file_path, offset, size, rule['extension'], output_file_name=name)
+
+                    # 이 규칙에 대해 명령이 지정된 경우 실행 시도
+                    # 실행에 실패하면 다음 규칙이 시도됨
+                    if rule['cmd']:
+
+                        # 원본 파일의 해시 기록; --rm이 지정되고 추출 유틸리티가 새 파일을 생성하는 대신 원본 파일을 수정하는 경우
+                        if self.remove_after_execute:
+                            fname_md5 = file_md5(fname)
+
+                        binwalk.core.common.debug("추출 명령 실행 중 %s" % (str(rule['cmd'])))
+
+                        # 추출된 파일에 대해 지정된 명령 실행
+                        if self.run_extractors:
+                            (extract_ok, command_line) = self.execute(rule['cmd'], fname, rule['codes'])
+                        else:
+                            extract_ok = True
+                            command_line = ''
+
+                        binwalk.core.common.debug("추출 명령 실행: %s" % command_line)
+                        binwalk.core.common.debug("추출 성공: %s" % extract_ok)
+
+                        # remove_after_execute가 지정된 경우에만 파일 정리
+                        # 파일이 성공적으로 추출된 경우에만 정리; 그렇지 않으면 남아있음
+                        if self.remove_after_execute and (extract_ok == True or i == (len(rules) - 1)):
+
+                            # 추출된 원본 파일이 추출기에 의해 수정되지 않은 경우 삭제
+                            try:
+                                if file_md5(fname) == fname_md5:
+                                    os.unlink(fname)
+                            except KeyboardInterrupt as e:
+                                raise e
+                            except Exception as e:
+                                pass
+
+                        # 명령이 성공적으로 실행된 경우, 더 이상의 규칙 시도 중지
+                        if extract_ok == True:
+                            break
+                        # 그렇지 않으면, 목록의 마지막 규칙이 아닌 경우 추출된 파일을 삭제
+                        # 마지막 규칙인 경우 사용자가 파일을 검사할 수 있도록 디스크에 남겨둠
+                        elif i != (len(rules) - 1):
+                            try:
                                 os.unlink(fname)
-                        except KeyboardInterrupt as e:
-                            raise e
-                        except Exception as e:
-                            pass
+                            except KeyboardInterrupt as e:
+                                raise e
+                            except Exception as e:
+                                pass
 
-                    # 명령이 성공적으로 실행된 경우, 더 이상의 규칙 시도 중지
-                    if extract_ok == True:
+                    # 실행할 명령이 없었던 경우, 첫 번째 규칙을 사용
+                    else:
                         break
-                    # 그렇지 않으면, 목록의 마지막 규칙이 아닌 경우 추출된 파일을 삭제
-                    # 마지막 규칙인 경우 사용자가 파일을 검사할 수 있도록 디스크에 남겨둠
-                    elif i != (len(rules) - 1):
-                        try:
-                            os.unlink(fname)
-                        except KeyboardInterrupt as e:
-                            raise e
-                        except Exception as e:
-                            pass
-
-                # 실행할 명령이 없었던 경우, 첫 번째 규칙을 사용
-                else:
-                    break
 
-            binwalk.core.common.debug("디렉터리 다시 변경: %s" % original_dir)
-            os.chdir(original_dir)
+            finally:
+                binwalk.core.common.debug("디렉터리 다시 변경: %s" % original_dir)
+                os.chdir(original_dir)
 
         return (output_directory, fname, recurse, command_line)
 
@@ -793,8 +837,8 @@ class Extractor(Module):
 
             offset -= adjust
 
-            # 대상 파일을 열고 오프셋으로 이동
-            fdin = self.config.open_file(file_name)
+            # 대상 파일을 열고 오프셋으로 이동 (데이터를 그대로 복사하므로 str로 변환하지 않음)
+            fdin = self.config.open_file(file_name, binary=True)
             fdin.seek(offset)
 
             # 출력 파일 열기
@@ -815,7 +859,7 @@ class Extractor(Module):
                     total_size += (dlen - adjust)
                     if total_size > size:
                         dlen -= (total_size - size)
-                    fdout.write(str2bytes(data[adjust:dlen]))
+                    fdout.write(data[adjust:dlen])
                     adjust = 0
 
             # 정리
@@ -847,6 +891,13 @@ class Extractor(Module):
         rval = 0
         retval = True
         command_list = []
+        start = time.time()
+
+        # 성능 통계에 기록할 추출기 이름 (명령 템플릿 또는 내부 추출기 이름)
+        if callable(cmd):
+            name = get_class_name_from_method(cmd)
+        else:
+            name = str(cmd)
 
         binwalk.core.common.debug("추출기 '%s' 실행 중" % str(cmd))
 
@@ -892,6 +943,9 @@ class Extractor(Module):
             binwalk.core.common.warning("Extractor.execute 외부 추출기 '%s' 실행 실패: %s, '%s'이(가) 올바르게 설치되지 않았을 수 있습니다." % (str(cmd), str(e), str(cmd)))
             retval = None
 
+        if self.parent.stats is not None:
+            self.parent.stats.add('extractor', name, time.time() - start, failed=(retval is not True))
+
         return (retval, '&&'.join(command_list))
 
     def shell_call(self, command):
@@ -907,29 +961,66 @@ class Extractor(Module):
             
             # 자식 프로세스 포크
             child_pid = os.fork()
+
+            # 자식 프로세스와 추출기는 새 프로세스 그룹에서 실행되므로, 스캔이 중단되면 함께 종료할 수 있습니다 (참조: self._wait).
+            # 어느 쪽이 먼저 실행되더라도 그룹이 생성되도록 부모와 자식 모두에서 설정합니다.
+            try:
+                os.setpgid(child_pid, child_pid)
+            except OSError:
+                pass
+
+            # 진정한 자식 프로세스는 실행할 사용자 권한으로 전환한 후 명령을 실행하고, subprocess 종료 값으로 종료해야 함
+            # 자식 프로세스는 부모 프로세스의 스캔으로 돌아가지 않도록 (예: 명령 실행 실패 또는 self.extract의 작업 디렉터리 복원)
+            # 예외가 발생하더라도 sys.exit 대신 os._exit로 종료합니다.
             if child_pid is 0:
-                # 실행할 사용자 권한으로 전환, 설정된 경우
-                if self.runas_uid is not None and self.runas_gid is not None:
-                    os.setgid(self.runas_uid)
-                    os.setuid(self.runas_gid)
-        else:
-            # child_pid가 None이면 os.fork()가 발생하지 않음
-            child_pid = None
-            
-        # 자식 프로세스이거나 os.fork()가 발생하지 않은 경우 명령 실행
-        if child_pid in [0, None]:
-            binwalk.core.common.debug("subprocess.call(%s, stdout=%s, stderr=%s)" % (command, str(tmp), str(tmp)))
-            rval = subprocess.call(shlex.split(command), stdout=tmp, stderr=tmp)
-
-        # 진정한 자식 프로세스는 subprocess 종료 값으로 종료해야 함
-        if child_pid is 0:
-            sys.exit(rval)
-        # os.fork()가 발생하지 않은 경우, subprocess 종료 값을 반환
-        elif child_pid is None:
-            return rval
-        # os.fork()가 발생했으며 부모 프로세스인 경우, 자식 프로세스의 종료 값을 대기하고 반환
-        else:
-            return os.wait()[1]
+                rval = 1
+                try:
+                    if self.runas_uid is not None and self.runas_gid is not None:
+                        os.setgid(self.runas_uid)
+                        os.setuid(self.runas_gid)
+
+                    binwalk.core.common.debug("subprocess.Popen(%s, stdout=%s, stderr=%s)" % (command, str(tmp), str(tmp)))
+                    rval = subprocess.Popen(shlex.split(command), stdout=tmp, stderr=tmp).wait()
+                finally:
+                    os._exit(rval)
+
+            # 부모 프로세스는 자식 프로세스의 종료 값을 대기하고 반환
+            return self._wait(lambda timeout: _poll_pid(child_pid, timeout),
+                              lambda: _kill_group(child_pid),
+                              lambda: os.waitpid(child_pid, 0))
+
+        # 현재 사용자로 실행하는 경우 os.fork() 없이 명령을 실행하고 subprocess 종료 값을 반환
+        # 추출기는 새 프로세스 그룹 (세션)에서 실행되므로, 스캔이 중단되면 추출기가 생성한 프로세스도 함께 종료됩니다.
+        binwalk.core.common.debug("subprocess.Popen(%s, stdout=%s, stderr=%s)" % (command, str(tmp), str(tmp)))
+        process = subprocess.Popen(shlex.split(command), stdout=tmp, stderr=tmp, start_new_session=True)
+
+        return self._wait(lambda timeout: _poll_process(process, timeout),
+                          lambda: _kill_group(process.pid),
+                          process.wait)
+
+    def _wait(self, poll, kill, wait):
+        '''
+        외부 추출기 프로세스가 종료될 때까지 대기합니다.
+        스캔이 중단되면 (참조: Modules.check_stopped) 프로세스 그룹을 종료하고 ScanStoppedException을 발생시킵니다.
+        추출기는 별도의 프로세스 그룹에서 실행되어 터미널의 Ctrl-C를 받지 않으므로, KeyboardInterrupt의 경우에도 프로세스 그룹을 종료합니다.
+
+        @poll - 최대 timeout 초 동안 대기하여, 프로세스가 종료된 경우 종료 값을, 실행 중인 경우 None을 반환하는 함수.
+        @kill - 프로세스 그룹 (추출기가 생성한 프로세스 포함)을 종료하는 함수.
+        @wait - 종료된 프로세스를 회수하는 함수.
+
+        프로세스의 종료 값을 반환합니다.
+        '''
+        try:
+            while True:
+                rval = poll(self.PROCESS_POLL_INTERVAL)
+                if rval is not None:
+                    return rval
+
+                self.parent.check_stopped()
+        except (ScanStoppedException, KeyboardInterrupt):
+            kill()
+            wait()
+            raise
 
     def symlink_sanitizer(self, file_list, extraction_directory):
         # 사용자가 이 기능을 비활성화할 수 있음
@@ -950,3 +1041,42 @@ class Extractor(Module):
                     binwalk.core.common.warning("심볼릭 링크가 추출 디렉터리 외부를 가리킵니다: %s -> %s; 보안 목적으로 링크 대상이 %s로 변경됩니다." % (file_name, linktarget, os.devnull))
                     os.remove(file_name)
                     os.symlink(os.devnull, file_name)
+
+
+def _poll_process(process, timeout):
+    '''
+    subprocess.Popen 프로세스가 종료될 때까지 최대 timeout 초 동안 대기합니다.
+
+    프로세스의 종료 값을 반환합니다. 프로세스가 실행 중인 경우 None을 반환합니다.
+    '''
+    try:
+        return process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None
+
+
+def _kill_group(pgid):
+    '''
+    프로세스 그룹의 모든 프로세스를 종료합니다. 이미 종료된 그룹은 무시합니다.
+    '''
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def _poll_pid(pid, timeout):
+    '''
+    os.fork로 생성된 자식 프로세스가 종료될 때까지 최대 timeout 초 동안 대기합니다.
+
+    os.wait와 같은 자식 프로세스의 종료 상태를 반환합니다. 프로세스가 실행 중인 경우 None을 반환합니다.
+    '''
+    deadline = time.time() + timeout
+
+    while True:
+        (wpid, status) = os.waitpid(pid, os.WNOHANG)
+        if wpid:
+            return status
+        if time.time() >= deadline:
+            return None
+        time.sleep(.01)
@@ -9,8 +9,10 @@ import binwalk.core.idb
 import binwalk.core.common
 import binwalk.core.display
 import binwalk.core.settings
+import binwalk.core.skipmap
 from binwalk.core.compat import *
 from binwalk.core.module import Module, Option, Kwarg, show_help
+from binwalk.core.exceptions import ModuleException
 
 
 class General(Module):
@@ -47,11 +49,26 @@ class General(Module):
                type=int,
                kwargs={'swap_size': 0},
                description='스캔 전에 매 n 바이트마다 순서를 반전'),
+        Option(long='binary',
+               kwargs={'binary': True},
+               description='스캔 데이터를 str로 변환하지 않고 bytes로 처리 (지원하는 모듈에 한함)'),
+        Option(long='mmap',
+               kwargs={'subclass': binwalk.core.common.MMapFile},
+               description='mmap을 사용하여 대상 파일을 읽음 (대용량 파일에 유용)'),
+        Option(long='skip',
+               type=list,
+               dtype=str.__name__,
+               kwargs={'skip_regions': []},
+               description='시그니처 및 원시 압축 스캔에서 건너뛸 영역 (fill: 고정 값 패딩, entropy: 높은 엔트로피 데이터)'),
         Option(long='log',
                short='f',
                type=argparse.FileType,
                kwargs={'log_file': None},
                description='결과를 파일에 기록'),
+        Option(long='stats-file',
+               type=argparse.FileType,
+               kwargs={'stats_file': None},
+               description='모듈 단계, 플러그인, 추출기 명령 및 시그니처별 성능 통계를 JSON 파일에 기록'),
         Option(long='csv',
                short='c',
                kwargs={'csv': True},
@@ -87,15 +104,26 @@ class General(Module):
                type=int,
                kwargs={'status_server_port': 0},
                description='지정된 포트에서 상태 서버 활성화'),
+        Option(long='jobs',
+               type=int,
+               kwargs={'jobs': 1},
+               description='지정된 수의 프로세스로 여러 대상 파일을 병렬 스캔'),
+        Option(long='serve',
+               type=str,
+               kwargs={'serve_socket': None},
+               description='지정된 Unix 소켓에서 스캔 요청을 처리 (--jobs: 동시 작업 수)'),
+        Option(long='serve-extract',
+               kwargs={'serve_extract': True},
+               description='--serve 요청에서 추출 옵션 (-e, -D, --run-as, -C 등)을 허용'),
         Option(long=None,
                short=None,
                type=binwalk.core.common.BlockFile,
                kwargs={'files': []}),
 
         # 숨겨진, API 전용 인자들
-        Option(long="string",
+        Option(long="buffer",
                hidden=True,
-               kwargs={'subclass': binwalk.core.common.StringFile}),
+               kwargs={'subclass': binwalk.core.common.BufferFile}),
     ]
 
     # 클래스 초기화 시 사용할 기본 값들
@@ -105,8 +133,14 @@ class General(Module):
         Kwarg(name='base', default=0),
         Kwarg(name='block', default=0),
         Kwarg(name='status_server_port', default=0),
+        Kwarg(name='jobs', default=1),
+        Kwarg(name='serve_socket', default=None),
+        Kwarg(name='serve_extract', default=False),
         Kwarg(name='swap_size', default=0),
+        Kwarg(name='binary', default=False),
+        Kwarg(name='skip_regions', default=[]),
         Kwarg(name='log_file', default=None),
+        Kwarg(name='stats_file', default=None),
         Kwarg(name='csv', default=False),
         Kwarg(name='format_to_terminal', default=False),
         Kwarg(name='quiet', default=False),
@@ -140,6 +174,12 @@ class General(Module):
         if self.file_name_exclude_regex:
             self.file_name_exclude_regex = re.compile(self.file_name_exclude_regex)
 
+        # 건너뛸 영역 종류 확인 (참조: binwalk.core.skipmap.SkipMap)
+        for kind in self.skip_regions:
+            if kind not in binwalk.core.skipmap.SkipMap.KINDS:
+                raise ModuleException("알 수 없는 건너뛰기 영역 종류 '%s' (%s 중 하나를 지정하십시오)" %
+                                      (kind, ", ".join(binwalk.core.skipmap.SkipMap.KINDS)))
+
         # 설정 및 디스플레이 객체 초기화
         self.settings = binwalk.core.settings.Settings()
         self.display = binwalk.core.display.Display(log=self.log_file,
@@ -159,8 +199,8 @@ class General(Module):
             self.parent.status_server(self.status_server_port)
 
     def reset(self):
-        # 리셋 시 수행할 작업 (현재는 빈 메서드)
-        pass
+        # 이 인스턴스는 모든 모듈이 공유하므로, 이전 주 모듈이 변경한 디스플레이 설정을 복원합니다 (예: hexdiff).
+        self.display.fit_to_screen = self.format_to_terminal
 
     def _set_verbosity(self):
         '''
@@ -187,9 +227,10 @@ class General(Module):
 
         return True
 
-    def open_file(self, fname, length=None, offset=None, swap=None, block=None, peek=None):
+    def open_file(self, fname, length=None, offset=None, swap=None, block=None, peek=None, binary=False):
         '''
         모든 관련 구성 설정으로 지정된 파일을 엽니다.
+        binary가 True인 경우, 파일은 bytes를 반환하는 BlockFile로 열립니다.
         '''
         if length is None:
             length = self.length
@@ -204,7 +245,8 @@ class General(Module):
                                              offset=offset,
                                              swap=swap,
                                              block=block,
-                                             peek=peek)
+                                             peek=peek,
+                                             binary=binary)
 
     def _open_target_files(self):
         '''
@@ -214,7 +256,7 @@ class General(Module):
         # target_files에 나열된 대상 파일을 검증
         for tfile in self.files:
             # 디렉토리를 무시
-            if not self.subclass == io.FileIO or not os.path.isdir(tfile):
+            if self.subclass not in [io.FileIO, binwalk.core.common.MMapFile, binwalk.core.common.BufferFile] or not os.path.isdir(tfile):
                 # 대상 파일을 열 수 있는지 확인
                 try:
                     fp = self.open_file(tfile)
@@ -1,11 +1,14 @@
 # 기본 서명 스캔 모듈입니다. binwalk의 기본 (주요) 기능입니다.
+import os
 import binwalk.core.magic
+import binwalk.core.skipmap
 from binwalk.core.module import Module, Option, Kwarg
 
 class Signature(Module):
 
     TITLE = "Signature Scan"  # 모듈의 제목
     ORDER = 10  # 모듈 실행 순서
+    BINARY = True  # bytes 데이터 블록을 직접 스캔할 수 있음
 
     # 명령줄 인터페이스 옵션 설정
     CLI = [
@@ -65,6 +68,16 @@ class Signature(Module):
     ]
 
     VERBOSE_FORMAT = "%s    %d"  # 자세한 출력 형식
+    SKIP_VERBOSE_FORMAT = "%s    %d\n%s       %s"  # 건너뛸 영역이 지정된 경우 (--skip)의 자세한 출력 형식
+
+    # 병렬 스캔 (--jobs) 시 작업자 프로세스당 미리 분석할 데이터 블록 수 (참조: self._analyzed_blocks)
+    BLOCKS_PER_JOB = 2
+
+    # self._magic_key별로 로드된 binwalk.core.magic.Magic 인스턴스입니다.
+    # 같은 프로세스의 이후 스캔 (예: 스캔 서버)은 서명을 다시 파싱하지 않고 복사본을 사용합니다 (참조: Magic.copy).
+    MAGIC_REGISTRY = {}
+    # self.MAGIC_REGISTRY에 보관할 최대 항목 수입니다.
+    MAGIC_REGISTRY_SIZE = 8
 
     def init(self):
         self.one_of_many = None  # 여러 서명이 반복되는 것을 방지하는 플래그
@@ -81,10 +94,54 @@ class Signature(Module):
             self.magic_files += self.config.settings.user.magic + \
                 self.config.settings.system.magic
 
+        # 같은 magic 파일과 옵션으로 로드된 서명은 프로세스 내에서 재사용합니다 (참조: self.MAGIC_REGISTRY).
+        key = self._magic_key()
+        try:
+            magic = self.MAGIC_REGISTRY[key]
+        except KeyError:
+            magic = self._load_magic()
+            if len(self.MAGIC_REGISTRY) >= self.MAGIC_REGISTRY_SIZE:
+                self.MAGIC_REGISTRY.clear()
+            self.MAGIC_REGISTRY[key] = magic
+
+        self.magic = magic.copy()
+        self.magic.stats = self.parent.stats
+
+        self.VERBOSE = ["Signatures:", len(self.magic.signatures)]
+
+        # 건너뛸 영역 (참조: self.run)
+        self.skip_map = None
+        if self.config.skip_regions:
+            self.VERBOSE_FORMAT = self.SKIP_VERBOSE_FORMAT
+
+    def _magic_key(self):
+        '''
+        self.MAGIC_REGISTRY의 키를 계산합니다.
+        magic 파일이 변경되면 (수정 시간 또는 크기) 키도 변경되므로 서명을 다시 로드합니다.
+
+        로드된 서명에 영향을 주는 모든 옵션의 튜플을 반환합니다.
+        '''
+        files = []
+        for fname in self.magic_files:
+            st = os.stat(fname)
+            files.append((fname, st.st_mtime, st.st_size))
+
+        return (tuple(files),
+                tuple(self.raw_bytes),
+                tuple(self.include_filters),
+                tuple(self.exclude_filters),
+                self.show_invalid)
+
+    def _load_magic(self):
+        '''
+        self.raw_bytes와 self.magic_files에서 서명을 로드합니다.
+
+        binwalk.core.magic.Magic 인스턴스를 반환합니다.
+        '''
         # libmagic 초기화
-        self.magic = binwalk.core.magic.Magic(include=self.include_filters,
-                                              exclude=self.exclude_filters,
-                                              invalid=self.show_invalid)
+        magic = binwalk.core.magic.Magic(include=self.include_filters,
+                                         exclude=self.exclude_filters,
+                                         invalid=self.show_invalid)
 
         # 지정된 바이트 시퀀스에서 서명을 생성
         if self.raw_bytes:
@@ -92,15 +149,15 @@ class Signature(Module):
             for raw_bytes in self.raw_bytes:
                 raw_signatures.append("0    string    %s    Raw signature (%s)" % (raw_bytes, raw_bytes))
             binwalk.core.common.debug("Parsing raw signatures: %s" % str(raw_signatures))
-            self.magic.parse(raw_signatures)
+            magic.parse(raw_signatures)
 
         # magic 파일을 파싱
         if self.magic_files:
             binwalk.core.common.debug("Loading magic files: %s" % str(self.magic_files))
-            for f in self.magic_files:
-                self.magic.load(f)
+            # 파싱된 서명은 사용자 캐시 디렉토리에 캐시됩니다
+            magic.load_files(self.magic_files, cache=self.config.settings.user.cache)
 
-        self.VERBOSE = ["Signatures:", len(self.magic.signatures)]
+        return magic
 
     def validate(self, r):
         '''
@@ -135,20 +192,20 @@ class Signature(Module):
         self.one_of_many = None
         self.magic.reset()
 
-        while True:
-            (data, dlen) = fp.read_block()
-            if dlen < 1:
-                break
+        # 여러 작업자 프로세스가 지정된 경우 (--jobs), 두 블록 이상인 파일의 데이터 블록은 작업자 프로세스에서 미리 분석됩니다.
+        if self.config.jobs > 1 and fp.length > fp.block_read_size and \
+                _fork_available():
+            blocks = self._analyzed_blocks(fp)
+        else:
+            blocks = self._blocks(fp)
 
-            current_block_offset = 0
-            block_start = fp.tell() - dlen
+        for (block_start, results) in blocks:
+            self.parent.check_stopped()
             self.status.completed = block_start - fp.offset
 
             # 이 데이터 블록을 서명으로 스캔
-            for r in self.magic.scan(data, dlen):
-                if r.offset < current_block_offset:
-                    continue
-
+            # 결과는 요청할 때 하나씩 분석되므로, 점프로 건너뛴 영역의 시그니처는 분석되지 않습니다 (참조: self.magic.skip).
+            for r in results:
                 relative_offset = r.offset + r.adjust
 
                 r.offset = block_start + relative_offset
@@ -162,15 +219,212 @@ class Signature(Module):
 
                 if r.valid and r.jump > 0 and not self.dumb_scan:
                     absolute_jump_offset = r.offset + r.jump
-                    current_block_offset = relative_offset + r.jump
+                    self.magic.skip(relative_offset + r.jump)
 
+                    # 점프 대상이 현재 블록 안에 있으면 이미 읽은 데이터에서 계속 스캔하고 (self.magic.skip),
+                    # 블록 뒤에 있는 경우에만 새 블록을 읽습니다. 이미 읽은 추가 데이터는 재사용됩니다 (참조: BlockFile.read_block).
                     if absolute_jump_offset >= fp.tell():
                         fp.seek(r.offset + r.jump)
                         break
 
+    def _blocks(self, fp):
+        '''
+        파일의 현재 위치에서 데이터 블록을 읽고 스캔합니다.
+
+        @fp - 스캔할 BlockFile.
+
+        (블록 시작 오프셋, 블록의 SignatureResult 생성기) 튜플을 생성합니다.
+        '''
+        while True:
+            position = fp.tell()
+
+            # 건너뛸 영역 안에 있으면 영역의 끝으로 이동합니다 (--skip).
+            if self.skip_map is not None:
+                region = self.skip_map.region(position)
+                if region is not None:
+                    fp.seek(region[1])
+                    continue
+
+            (data, dlen) = fp.read_block()
+            if dlen < 1:
+                break
+
+            # 블록 안에서 건너뛸 영역이 시작되면, 영역의 시작까지만 스캔하고 다음 블록은 영역의 시작에서 읽습니다.
+            if self.skip_map is not None:
+                limit = self.skip_map.limit(position, dlen)
+                if limit < dlen:
+                    fp.seek(position + limit)
+                    dlen = limit
+
+            yield (position, self.magic.scan_iter(data, dlen))
+
+    def _analyzed_blocks(self, fp):
+        '''
+        self._blocks와 동일한 결과를 생성하지만, 데이터 블록은 작업자 프로세스에서 미리 분석됩니다 (참조: Magic.analyze).
+
+        점프가 없다고 가정하고 다음 블록들을 작업자 프로세스에 미리 요청합니다.
+        점프로 인해 블록 시작 오프셋이 달라지면, 새 위치에서 다시 요청합니다.
+        결과 (점프, 'once' 태그, 플러그인, 검증)는 이 프로세스에서 순서대로 처리되므로 출력은 순차 스캔과 동일합니다.
+
+        @fp - 스캔할 BlockFile.
+
+        (블록 시작 오프셋, 블록의 SignatureResult 생성기) 튜플을 생성합니다.
+        '''
+        import multiprocessing
+
+        pending = {}
+        end = fp.offset + fp.length
+        # 작업자는 fork로 생성되어 이 프로세스의 self.magic을 그대로 사용합니다.
+        pool = multiprocessing.get_context('fork').Pool(self.config.jobs,
+                                                        _block_worker_init,
+                                                        (self.magic, self.config, fp))
+
+        try:
+            while True:
+                position = fp.tell()
+
+                # self._blocks와 마찬가지로 건너뛸 영역을 건너뜁니다.
+                if self.skip_map is not None:
+                    region = self.skip_map.region(position)
+                    if region is not None:
+                        fp.seek(region[1])
+                        continue
+
+                blocks = self._planned_blocks(position, end, fp.block_read_size, self.config.jobs * self.BLOCKS_PER_JOB)
+
+                # 현재 위치에서 읽을 블록과 맞지 않는 요청은 버립니다.
+                for start in list(pending):
+                    if start not in blocks:
+                        del pending[start]
+
+                for (start, length) in blocks.items():
+                    if start not in pending:
+                        pending[start] = pool.apply_async(_block_worker, (start, length))
+
+                if position not in pending:
+                    break
+
+                (dlen, analyzed, stats) = pending.pop(position).get()
+                if stats:
+                    self.magic.stats.merge(stats)
+                if dlen < 1:
+                    break
+
+                # self._blocks와 마찬가지로 파일 위치는 블록의 끝으로 이동합니다.
+                fp.seek(position + dlen)
+
+                yield (position, self.magic.scan_analyzed(analyzed))
+        finally:
+            # 스캔이 끝나거나 중단되면 남은 요청은 더 이상 필요하지 않습니다.
+            pool.terminate()
+            pool.join()
+
+    def _planned_blocks(self, position, end, block_size, count):
+        '''
+        점프가 없다고 가정하고, position부터 self._blocks가 차례로 읽을 데이터 블록을 계산합니다 (참조: self._analyzed_blocks).
+        건너뛸 영역 (--skip) 안의 블록은 포함하지 않으며, 영역 앞에서 잘리는 블록은 영역의 시작까지만 분석합니다.
+
+        @position   - 첫 번째 블록의 시작 오프셋.
+        @end        - 스캔할 데이터의 끝 오프셋.
+        @block_size - 데이터 블록 크기.
+        @count      - 최대 블록 수.
+
+        {블록 시작 오프셋: 분석할 길이} 사전을 반환합니다.
+        '''
+        blocks = {}
+
+        while len(blocks) < count and position < end:
+            length = block_size
+
+            if self.skip_map is not None:
+                region = self.skip_map.region(position)
+                if region is not None:
+                    position = region[1]
+                    continue
+                length = self.skip_map.limit(position, length)
+
+            blocks[position] = length
+            position += length
+
+        return blocks
+
+    def _skip_margin(self):
+        '''
+        'fill' 영역 뒤에서 스캔할 바이트 수를 반환합니다 (참조: SkipMap).
+        시그니처의 결과 오프셋은 매직 바이트의 위치보다 시그니처 오프셋만큼 앞서고, 매직 바이트는 패딩과 같은 값으로 시작할 수 있으므로,
+        로드된 시그니처의 (오프셋 + 매직 길이) 중 최댓값을 사용합니다.
+        '''
+        return max([0] + [s.offset + s.lines[0].size for s in self.magic.signatures])
+
     def run(self):
         # 모듈 실행 시 호출되는 메인 함수
         for fp in iter(self.next_file, None):
+            # 건너뛸 영역은 스캔 전에 찾으며, 자세한 출력에 표시됩니다 (--skip).
+            if self.config.skip_regions:
+                self.skip_map = binwalk.core.skipmap.SkipMap(fp, self.config.skip_regions, margin=self._skip_margin())
+                self.VERBOSE = ["Signatures:", len(self.magic.signatures), "Skipped:", self.skip_map.summary()]
+
             self.header()
             self.scan_file(fp)
             self.footer()
+
+
+# 병렬 스캔 작업자 프로세스의 (Magic, BlockFile) (참조: Signature._analyzed_blocks)
+_block_worker_state = None
+
+def _fork_available():
+    '''
+    작업자 프로세스를 fork로 생성할 수 있는지 확인합니다 (참조: Signature._analyzed_blocks).
+    multiprocessing은 병렬 스캔이 요청된 경우에만 가져옵니다.
+    '''
+    import multiprocessing
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+def _block_worker_init(magic, config, fp):
+    '''
+    병렬 스캔 작업자 프로세스를 초기화합니다. 대상 파일은 부모 프로세스와 같은 설정으로 다시 엽니다.
+    '''
+    global _block_worker_state
+    import signal
+
+    # Ctrl+C는 부모 프로세스에서만 처리합니다.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # 부모 프로세스에서 이미 수집된 통계가 다시 합산되지 않도록 합니다.
+    if magic.stats is not None:
+        magic.stats.clear()
+
+    _block_worker_state = (magic, config.open_file(fp.path,
+                                                   length=fp.args.length,
+                                                   offset=fp.args.offset,
+                                                   swap=fp.args.swap,
+                                                   block=fp.block_read_size,
+                                                   peek=fp.block_peek_size,
+                                                   binary=fp.binary))
+
+def _block_worker(start, length):
+    '''
+    지정된 오프셋의 데이터 블록을 읽고 분석합니다.
+
+    @start  - 블록의 시작 오프셋.
+    @length - 분석할 최대 길이 (건너뛸 영역 앞에서 잘린 블록, 참조: Signature._planned_blocks).
+
+    (블록 데이터 길이, Magic.analyze의 반환값, 이 블록의 시그니처 통계 (Stats.report 또는 None)) 튜플을 반환합니다.
+    '''
+    (magic, fp) = _block_worker_state
+
+    fp.seek(start)
+    (data, dlen) = fp.read_block()
+    if dlen < 1:
+        return (dlen, [], None)
+
+    dlen = min(dlen, length)
+    analyzed = magic.analyze(data, dlen)
+
+    # 작업자에서 수집된 통계는 부모 프로세스의 통계에 합산됩니다 (참조: Signature._analyzed_blocks).
+    stats = None
+    if magic.stats is not None:
+        stats = magic.stats.report()
+        magic.stats.clear()
+
+    return (dlen, analyzed, stats)
@@ -17,6 +17,7 @@ class CPIOPlugin(binwalk.core.plugin.Plugin):
 
     # 이 플러그인이 적용될 모듈을 지정합니다.
     MODULES = ['Signature']
+    BINARY = True  # 파일 데이터를 result.file을 통해 str로 읽지 않음 (참조: Plugin.BINARY)
 
     def init(self):
         # 연속으로 발견된 항목의 수를 초기화합니다.
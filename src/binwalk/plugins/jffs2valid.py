@@ -12,6 +12,8 @@ class JFFS2ValidPlugin(binwalk.core.plugin.Plugin):
     유효한 일부 JFFS2 노드를 잘못된 것으로 잘못 표시할 수 있습니다.
     '''
     MODULES = ['Signature']  # 이 플러그인이 적용될 모듈을 지정합니다.
+    BINARY = True  # 파일 데이터를 result.file을 통해 str로 읽지 않음 (참조: Plugin.BINARY)
+    SCAN_DESCRIPTIONS = ['jffs2 filesystem']  # scan이 처리하는 결과 설명의 접두사 (참조: Plugin.SCAN_DESCRIPTIONS)
 
     def _check_crc(self, node_header):
         # struct 및 binascii 모듈은 Python3에서 바이트 객체를 원합니다.
@@ -34,7 +36,7 @@ class JFFS2ValidPlugin(binwalk.core.plugin.Plugin):
         if result.file and result.description.lower().startswith('jffs2 filesystem'):
 
             # 의심되는 JFFS2 노드 헤더로 이동하여 데이터를 읽어옵니다.
-            fd = self.module.config.open_file(result.file.path, offset=result.offset)
+            fd = self.module.config.open_file(result.file.path, offset=result.offset, binary=True)
             # JFFS2 헤더는 12바이트 크기이지만, 디스크에서 데이터를 더 많이 읽어오면
             # 반복적인 디스크 액세스를 빠르게 하고 성능 저하를 줄일 수 있습니다 (디스크 캐싱 효과).
             #
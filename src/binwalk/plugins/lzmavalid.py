@@ -9,10 +9,12 @@ class LZMAPlugin(binwalk.core.plugin.Plugin):
     LZMA 서명 결과를 검증하는 플러그인입니다.
     '''
     MODULES = ['Signature']  # 이 플러그인이 적용될 모듈을 지정합니다.
+    BINARY = True  # 파일 데이터를 result.file을 통해 str로 읽지 않음 (참조: Plugin.BINARY)
+    SCAN_DESCRIPTIONS = ['lzma compressed data']  # scan이 처리하는 결과 설명의 접두사 (참조: Plugin.SCAN_DESCRIPTIONS)
 
     # 일부 LZMA 파일에는 파일 크기가 포함되지 않으므로, 이를 다시 추가해야 합니다.
     # lzmamod.py 플러그인도 참조하십시오.
-    FAKE_LZMA_SIZE = "\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF"  # 크기 필드가 없는 경우 사용되는 더미 크기 값
+    FAKE_LZMA_SIZE = b"\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF"  # 크기 필드가 없는 경우 사용되는 더미 크기 값
 
     # 첫 64KB까지 검사합니다.
     MAX_DATA_SIZE = 64 * 1024
@@ -51,7 +53,7 @@ class LZMAPlugin(binwalk.core.plugin.Plugin):
         if result.valid and result.file and result.description.lower().startswith('lzma compressed data'):
 
             # LZMA 데이터로 추정되는 부분으로 이동하여 읽습니다.
-            fd = self.module.config.open_file(result.file.path, offset=result.offset, length=self.MAX_DATA_SIZE)
+            fd = self.module.config.open_file(result.file.path, offset=result.offset, length=self.MAX_DATA_SIZE, binary=True)
             data = fd.read(self.MAX_DATA_SIZE)
             fd.close()
 
@@ -6,6 +6,8 @@ import binwalk.core.plugin
 class TarPlugin(binwalk.core.plugin.Plugin):
 
     MODULES = ['Signature']  # 이 플러그인이 적용될 모듈을 지정합니다.
+    BINARY = True  # 파일 데이터를 result.file을 통해 str로 읽지 않음 (참조: Plugin.BINARY)
+    SCAN_DESCRIPTIONS = ['posix tar archive']  # scan이 처리하는 결과 설명의 접두사 (참조: Plugin.SCAN_DESCRIPTIONS)
 
     # Python의 tarfile 모듈에서 차용한 TAR 블록 크기
     TAR_BLOCKSIZE = 512
@@ -15,7 +17,7 @@ class TarPlugin(binwalk.core.plugin.Plugin):
         널 종료된 문자열 필드를 파이썬 문자열로 변환합니다.
         """
         # 첫 번째 널 문자가 나올 때까지의 문자열을 사용합니다.
-        p = s.find("\0")
+        p = s.find(b"\0")
         if p == -1:
             return s
         return s[:p]
@@ -25,30 +27,30 @@ class TarPlugin(binwalk.core.plugin.Plugin):
         숫자 필드를 파이썬 숫자로 변환합니다.
         """
         # 숫자 필드에 대한 두 가지 가능한 인코딩이 있습니다.
-        if s[0] != chr(0x80):  # 일반 8진수 형식
+        if s[0] != 0x80:  # 일반 8진수 형식
             try:
-                n = int(self.nts(s) or "0", 8)  # 8진수로 변환
+                n = int(self.nts(s) or b"0", 8)  # 8진수로 변환
             except ValueError:
                 raise ValueError("유효하지 않은 tar 헤더입니다")
         else:
             n = 0
             for i in range(len(s) - 1):  # 비표준 형식 처리
                 n <<= 8
-                n += ord(s[i + 1])
+                n += s[i + 1]
         return n
 
     def scan(self, result):
         if result.description.lower().startswith('posix tar archive'):
             is_tar = True
             file_offset = result.offset
-            fd = self.module.config.open_file(result.file.path, offset=result.offset)
+            fd = self.module.config.open_file(result.file.path, offset=result.offset, binary=True)
 
             while is_tar:
                 # tar 헤더 구조체를 읽습니다.
                 buf = fd.read(self.TAR_BLOCKSIZE)
 
                 # 현재 여전히 tarball 내부에 있는지 확인합니다.
-                if buf[257:262] == 'ustar':  # TAR 헤더의 매직 넘버 확인
+                if buf[257:262] == b'ustar':  # TAR 헤더의 매직 넘버 확인
                     # tar에 포함된 파일 크기를 가져와 블록 단위로 변환합니다 (헤더 포함하여 +1 블록)
                     try:
                         size = self.nti(buf[124:136])  # 파일 크기를 추출
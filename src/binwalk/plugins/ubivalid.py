@@ -1,7 +1,6 @@
 import struct
 import binascii
 import binwalk.core.plugin
-import binwalk.core.compat
 
 
 class UBIValidPlugin(binwalk.core.plugin.Plugin):
@@ -12,6 +11,8 @@ class UBIValidPlugin(binwalk.core.plugin.Plugin):
     헤더 CRC를 확인하고, 점프 값을 계산합니다.
     '''
     MODULES = ['Signature']  # 이 플러그인이 적용될 모듈을 지정합니다.
+    BINARY = True  # 파일 데이터를 result.file을 통해 str로 읽지 않음 (참조: Plugin.BINARY)
+    SCAN_DESCRIPTIONS = ['ubi erase count header']  # scan이 처리하는 결과 설명의 접두사 (참조: Plugin.SCAN_DESCRIPTIONS)
     current_file = None  # 현재 처리 중인 파일 경로를 저장합니다.
     last_ec_hdr_offset = None  # 마지막 UBI 소거 카운트 헤더의 오프셋을 저장합니다.
     peb_size = None  # 물리적 지우기 블록(PEB)의 크기를 저장합니다.
@@ -56,9 +57,9 @@ class UBIValidPlugin(binwalk.core.plugin.Plugin):
     def scan(self, result):
         if result.file and result.description.lower().startswith('ubi erase count header'):
             # UBI 소거 카운트 헤더로 의심되는 부분을 읽어옵니다.
-            fd = self.module.config.open_file(result.file.path, offset=result.offset)
+            fd = self.module.config.open_file(result.file.path, offset=result.offset, binary=True)
 
-            ec_header = binwalk.core.compat.str2bytes(fd.read(1024))
+            ec_header = fd.read(1024)
             fd.close()
 
             # CRC를 검증하여 유효성을 확인합니다.
@@ -8,6 +8,8 @@ class ZipHelperPlugin(binwalk.core.plugin.Plugin):
     Zip 아카이브의 끝이 발견되면 이 플래그를 리셋합니다.
     '''
     MODULES = ['Signature']
+    BINARY = True  # 파일 데이터를 result.file을 통해 str로 읽지 않음 (참조: Plugin.BINARY)
+    SCAN_DESCRIPTIONS = ['zip archive data', 'end of zip archive']  # scan이 처리하는 결과 설명의 접두사 (참조: Plugin.SCAN_DESCRIPTIONS)
 
     # Zip 아카이브 추출이 활성화되었는지를 추적하는 플래그
     extraction_active = False
@@ -1,6 +1,5 @@
 import os
 import zlib
-import binwalk.core.compat
 import binwalk.core.common
 import binwalk.core.plugin
 
@@ -27,12 +26,12 @@ class ZLIBExtractPlugin(binwalk.core.plugin.Plugin):
 
         try:
             # 입력 파일을 열고 압축된 데이터를 읽어들임
-            fpin = binwalk.core.common.BlockFile(fname)
+            fpin = binwalk.core.common.BlockFile(fname, binary=True)
             # 출력 파일을 작성하기 위해 엶
             fpout = binwalk.core.common.BlockFile(outfile, 'w')
 
             # Zlib로 압축된 데이터를 해제
-            plaintext = zlib.decompress(binwalk.core.compat.str2bytes(fpin.read()))
+            plaintext = zlib.decompress(fpin.read())
             # 압축 해제된 데이터를 출력 파일에 씀
             fpout.write(plaintext)
 
@@ -1,5 +1,4 @@
 import zlib
-import binwalk.core.compat
 import binwalk.core.plugin
 from binwalk.core.common import BlockFile
 
@@ -10,6 +9,8 @@ class ZlibValidPlugin(binwalk.core.plugin.Plugin):
     Zlib 압축 데이터를 검증하는 플러그인입니다.
     '''
     MODULES = ['Signature']
+    BINARY = True  # 파일 데이터를 result.file을 통해 str로 읽지 않음 (참조: Plugin.BINARY)
+    SCAN_DESCRIPTIONS = ['zlib']  # scan이 처리하는 결과 설명의 접두사 (참조: Plugin.SCAN_DESCRIPTIONS)
 
     MAX_DATA_SIZE = 33 * 1024  # 최대 데이터 크기 설정 (33KB)
 
@@ -27,7 +28,7 @@ class ZlibValidPlugin(binwalk.core.plugin.Plugin):
             offset = result.offset - adjust
 
             # 의심되는 zlib 데이터를 찾아서 읽어옵니다.
-            fd = self.module.config.open_file(result.file.path)
+            fd = self.module.config.open_file(result.file.path, binary=True)
             fd.seek(offset)
             data = fd.read(self.MAX_DATA_SIZE)[adjust:]
             fd.close()
@@ -37,7 +38,7 @@ class ZlibValidPlugin(binwalk.core.plugin.Plugin):
             # 1. 오류 없이 압축이 해제될 때
             # 2. 입력 데이터가 잘려서 해제 실패 시
             try:
-                zlib.decompress(binwalk.core.compat.str2bytes(data))
+                zlib.decompress(data)
             except zlib.error as e:
                 # 에러 -5는 데이터 입력이 불완전하거나 잘린 경우입니다.
                 if not str(e).startswith("Error -5"):
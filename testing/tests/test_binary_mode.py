@@ -0,0 +1,33 @@
+import os
+import binwalk
+from nose.tools import eq_, ok_
+
+def test_binary_mode():
+    '''
+    테스트: bytes 모드(binary=True)로 입력 벡터 파일들의 시그니처를 스캔합니다.
+    결과가 기본 (str) 모드의 결과와 동일한지 확인합니다.
+    '''
+    for input_vector in ["firmware.squashfs", "foobar.lzma", "dirtraversal.tar"]:
+        # 테스트에 사용할 입력 벡터 파일의 경로를 설정합니다.
+        input_vector_file = os.path.join(os.path.dirname(__file__),
+                                         "input-vectors",
+                                         input_vector)
+
+        # 두 모드로 시그니처를 스캔합니다.
+        str_result = binwalk.scan(input_vector_file,
+                                  signature=True,
+                                  quiet=True)
+        bytes_result = binwalk.scan(input_vector_file,
+                                    signature=True,
+                                    binary=True,
+                                    quiet=True)
+
+        # 결과가 있어야 합니다.
+        ok_(str_result[0].results)
+
+        # 두 모드의 결과는 같아야 합니다.
+        eq_([(r.offset, r.description, r.valid) for r in str_result[0].results],
+            [(r.offset, r.description, r.valid) for r in bytes_result[0].results])
+
+        # bytes 모드에서 결과의 파일은 bytes 모드로 열려 있어야 합니다.
+        ok_(bytes_result[0].results[0].file.binary)
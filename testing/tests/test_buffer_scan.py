@@ -0,0 +1,57 @@
+import os
+import binwalk
+from binwalk.core.common import BufferFile
+from nose.tools import eq_, ok_
+
+def test_buffer_scan():
+    '''
+    테스트: 입력 벡터 파일들의 내용을 메모리 버퍼 (data=...)로 전달하여 시그니처를 스캔합니다.
+    결과가 파일을 스캔한 결과와 동일한지 확인합니다.
+    '''
+    for input_vector in ["firmware.squashfs", "foobar.lzma", "dirtraversal.tar"]:
+        # 테스트에 사용할 입력 벡터 파일의 경로를 설정합니다.
+        input_vector_file = os.path.join(os.path.dirname(__file__),
+                                         "input-vectors",
+                                         input_vector)
+
+        expected = binwalk.scan(input_vector_file,
+                                signature=True,
+                                quiet=True)
+        ok_(expected[0].results)
+
+        with open(input_vector_file, "rb") as fp:
+            data = fp.read()
+
+        # bytes, bytearray, memoryview 모두 str 모드와 bytes 모드에서 같은 결과를 내야 합니다.
+        for buf in [data, bytearray(data), memoryview(data)]:
+            for binary in [False, True]:
+                buffer_result = binwalk.scan(data=buf,
+                                             signature=True,
+                                             binary=binary,
+                                             quiet=True)
+
+                eq_([(r.offset, r.description, r.valid) for r in expected[0].results],
+                    [(r.offset, r.description, r.valid) for r in buffer_result[0].results])
+                eq_(buffer_result[0].results[0].file.size, len(data))
+
+    # 스캔이 끝나면 버퍼 등록이 해제되어야 합니다.
+    eq_(BufferFile.BUFFERS, {})
+
+def test_named_buffer_scan():
+    '''
+    테스트: 이름이 지정된 여러 메모리 버퍼를 스캔합니다.
+    결과의 파일 이름이 버퍼 이름과 같은지 확인합니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "foobar.lzma")
+
+    with open(input_vector_file, "rb") as fp:
+        data = fp.read()
+
+    result = binwalk.scan(data={"first.lzma": data, "second.bin": b"\x00" * 1024 + data},
+                          signature=True,
+                          quiet=True)
+
+    eq_([(os.path.basename(r.file.path), r.offset) for r in result[0].results],
+        [("first.lzma", 0), ("second.bin", 1024)])
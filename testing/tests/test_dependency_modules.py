@@ -0,0 +1,29 @@
+import os
+import binwalk
+from nose.tools import eq_, ok_
+
+def test_dependency_modules():
+    '''
+    테스트: 시그니처 및 엔트로피 모듈로 입력 벡터 파일을 스캔합니다.
+    두 주 모듈이 같은 의존성 모듈 인스턴스(General, Extractor)를 공유하는지 확인합니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "foobar.lzma")
+
+    modules = binwalk.scan(input_vector_file,
+                           signature=True,
+                           entropy=True,
+                           nplot=True,
+                           quiet=True)
+
+    eq_([module.name for module in modules], ["Signature", "Entropy"])
+    ok_(modules[0].config is modules[1].config)
+    ok_(modules[0].extractor is modules[1].extractor)
+    ok_(modules[0].extractor.config is modules[0].config)
+
+    # 각 실행은 새로운 의존성 모듈 인스턴스를 사용해야 합니다.
+    again = binwalk.scan(input_vector_file,
+                         signature=True,
+                         quiet=True)
+    ok_(again[0].config is not modules[0].config)
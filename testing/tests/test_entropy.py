@@ -0,0 +1,171 @@
+import os
+import math
+import random
+import shutil
+import tempfile
+import binwalk
+from nose.tools import eq_, ok_
+from nose.plugins.skip import SkipTest
+
+def _shannon(data):
+    entropy = 0.0
+    for count in [data.count(bytes([x])) for x in range(0, 256)]:
+        if count:
+            p_x = float(count) / len(data)
+            entropy -= p_x * math.log(p_x, 2)
+    return entropy / 8
+
+def test_entropy():
+    '''
+    테스트: 입력 벡터 파일의 엔트로피를 여러 블록 크기로 계산합니다.
+    각 결과의 엔트로피가 해당 오프셋에서 시작하는 블록의 Shannon 엔트로피와 같은지 확인합니다.
+    블록 크기가 읽기 블록 크기의 약수가 아닌 경우, 일부 블록은 읽기 블록의 경계에 걸칩니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "firmware.squashfs")
+    with open(input_vector_file, "rb") as fp:
+        data = fp.read()
+
+    for block_size in [1024, 3000]:
+        scan_result = binwalk.scan(input_vector_file,
+                                   entropy=True,
+                                   nplot=True,
+                                   quiet=True,
+                                   block=block_size)
+
+        results = scan_result[0].results
+        ok_(results)
+
+        for r in results:
+            ok_(abs(r.entropy - _shannon(data[r.offset:r.offset + block_size])) < 1e-9)
+
+def test_rolling_entropy():
+    '''
+    테스트: 입력 벡터 파일의 엔트로피를 슬라이딩 창 (--step)으로 계산합니다.
+    결과가 step 바이트마다 생성되고, 각 결과의 엔트로피가 해당 오프셋에서 시작하는 창의 Shannon 엔트로피와 같은지 확인합니다.
+    창은 읽기 블록의 경계에 걸칩니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "firmware.squashfs")
+    with open(input_vector_file, "rb") as fp:
+        data = fp.read()
+
+    (block_size, step, length) = (1024, 333, 1536 * 1024)
+
+    scan_result = binwalk.scan(input_vector_file,
+                               entropy=True,
+                               nplot=True,
+                               quiet=True,
+                               block=block_size,
+                               step=step,
+                               length=length)
+
+    results = scan_result[0].results
+    eq_([r.offset for r in results], list(range(0, length - block_size + 1, step)))
+
+    for r in results:
+        ok_(abs(r.entropy - _shannon(data[r.offset:r.offset + block_size])) < 1e-9)
+
+def test_entropy_pyramid():
+    '''
+    테스트: 입력 벡터 파일의 엔트로피 피라미드 (--pyramid)를 생성하고, 저장된 피라미드에서 여러 블록 크기의 엔트로피를 가져옵니다.
+    결과가 피라미드 없이 계산한 결과와 같고, 피라미드 파일이 다시 생성되지 않는지 확인합니다.
+    '''
+    try:
+        import numpy
+    except ImportError:
+        raise SkipTest("엔트로피 피라미드에는 numpy가 필요합니다")
+
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "firmware.squashfs")
+
+    def entropy(**kwargs):
+        scan_result = binwalk.scan(input_vector_file,
+                                   entropy=True,
+                                   nplot=True,
+                                   quiet=True,
+                                   **kwargs)
+        return [(r.offset, round(r.entropy, 9), r.description) for r in scan_result[0].results]
+
+    cwd = os.getcwd()
+    directory = tempfile.mkdtemp()
+    try:
+        # 피라미드는 현재 디렉터리에 저장됩니다.
+        os.chdir(directory)
+        pyramid_file = os.path.join(directory, "firmware.squashfs.entropy.npz")
+
+        eq_(entropy(block=1024, pyramid=True), entropy(block=1024))
+        ok_(os.path.exists(pyramid_file))
+        mtime = os.path.getmtime(pyramid_file)
+
+        for block_size in [4096, 65536]:
+            eq_(entropy(block=block_size, pyramid=True), entropy(block=block_size))
+        eq_(os.path.getmtime(pyramid_file), mtime)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory)
+
+def test_entropy_classify():
+    '''
+    테스트: 패딩, 텍스트, 의사 난수 데이터로 구성된 버퍼의 영역을 분류합니다 (--classify).
+    연속된 창이 분류별 영역 결과 (region 속성이 True)로 합쳐지고, 영역 결과와 창 엔트로피 결과가 오프셋 순서로
+    결과, 스트리밍 API (binwalk.scan_iter) 및 로그 파일 (--log)에 함께 생성되는지 확인합니다.
+    '''
+    try:
+        import numpy
+    except ImportError:
+        raise SkipTest("영역 분류에는 numpy가 필요합니다")
+
+    text = b"binwalk classifies regions by their byte distribution.\n" * 600
+    text = text[:32 * 1024]
+    rng = random.Random(0)
+    noise = bytes(bytearray(rng.getrandbits(8) for i in range(0, 64 * 1024)))
+    data = (b"\xFF" * 16 * 1024) + text + noise
+
+    directory = tempfile.mkdtemp()
+    try:
+        log_file = os.path.join(directory, "entropy.log")
+        scan_result = binwalk.scan(data=data,
+                                   entropy=True,
+                                   nplot=True,
+                                   quiet=True,
+                                   classify=True,
+                                   block=4096,
+                                   log=log_file)
+        with open(log_file, "rb") as fp:
+            logged = [int(line.split()[0]) for line in fp.read().decode('utf-8').splitlines() if line[:1].isdigit()]
+    finally:
+        shutil.rmtree(directory)
+
+    results = list(scan_result[0].results)
+
+    regions = [(r.offset, r.size, r.label) for r in results if r.region]
+    eq_(regions, [(0, 16 * 1024, 'padding'),
+                  (16 * 1024, 32 * 1024, 'plaintext'),
+                  (48 * 1024, 64 * 1024, 'encrypted')])
+
+    offsets = [r.offset for r in results if not r.region]
+    eq_(offsets, list(range(0, len(data), 4096)))
+
+    # 영역 결과는 영역의 첫 번째 창 결과보다 먼저 생성됩니다.
+    eq_([(r.offset, r.region) for r in results],
+        sorted([(r.offset, r.region) for r in results], key=lambda x: (x[0], not x[1])))
+    eq_(logged, sorted(logged))
+    ok_(16 * 1024 in logged)
+
+    for r in results:
+        ok_(0 <= r.entropy <= 1)
+        if r.offset >= 48 * 1024:
+            ok_(abs(r.mean - 127.5) < 10)
+            ok_(abs(r.pi - 3.14) < 0.5)
+
+    streamed = [(r.offset, r.description) for (name, r) in binwalk.scan_iter(data=data,
+                                                                             entropy=True,
+                                                                             nplot=True,
+                                                                             quiet=True,
+                                                                             classify=True,
+                                                                             block=4096)]
+    eq_(streamed, [(r.offset, r.description) for r in results])
@@ -0,0 +1,51 @@
+import os
+import binwalk
+from nose.tools import eq_, ok_
+
+def test_jobs():
+    '''
+    테스트: 여러 입력 벡터 파일을 작업자 프로세스로 병렬 스캔합니다 (jobs=2).
+    결과가 순차 스캔의 결과와 같은 순서로 동일한지 확인합니다.
+    '''
+    input_vector_files = [os.path.join(os.path.dirname(__file__), "input-vectors", input_vector)
+                          for input_vector in ["firmware.squashfs", "foobar.lzma", "dirtraversal.tar"]]
+
+    serial = binwalk.scan(*input_vector_files,
+                          signature=True,
+                          quiet=True)
+    parallel = binwalk.scan(*input_vector_files,
+                            signature=True,
+                            jobs=2,
+                            quiet=True)
+
+    # 결과가 있어야 합니다.
+    ok_(serial[0].results)
+
+    eq_([module.name for module in serial], [module.name for module in parallel])
+
+    for (serial_module, parallel_module) in zip(serial, parallel):
+        eq_([(r.file.path, r.offset, r.description, r.valid) for r in serial_module.results],
+            [(r.file.path, r.offset, r.description, r.valid) for r in parallel_module.results])
+
+def test_jobs_single_file():
+    '''
+    테스트: 여러 데이터 블록으로 구성된 하나의 입력 벡터 파일을 작업자 프로세스로 병렬 스캔합니다 (jobs=2).
+    결과가 순차 스캔의 결과와 동일한지 확인합니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "firmware.squashfs")
+
+    serial = binwalk.scan(input_vector_file,
+                          signature=True,
+                          quiet=True)
+    parallel = binwalk.scan(input_vector_file,
+                            signature=True,
+                            jobs=2,
+                            quiet=True)
+
+    # 결과가 있어야 합니다.
+    ok_(serial[0].results)
+
+    eq_([(r.offset, r.description, r.valid, r.display) for r in serial[0].results],
+        [(r.offset, r.description, r.valid, r.display) for r in parallel[0].results])
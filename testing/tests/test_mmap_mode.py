@@ -0,0 +1,30 @@
+import os
+import binwalk
+from nose.tools import eq_, ok_
+
+def test_mmap_mode():
+    '''
+    테스트: mmap 모드(mmap=True)로 입력 벡터 파일들의 시그니처를 스캔합니다.
+    결과가 기본 모드의 결과와 동일한지 확인합니다.
+    '''
+    for input_vector in ["firmware.squashfs", "foobar.lzma", "dirtraversal.tar"]:
+        # 테스트에 사용할 입력 벡터 파일의 경로를 설정합니다.
+        input_vector_file = os.path.join(os.path.dirname(__file__),
+                                         "input-vectors",
+                                         input_vector)
+
+        expected = binwalk.scan(input_vector_file,
+                                signature=True,
+                                quiet=True)
+        ok_(expected[0].results)
+
+        # mmap 모드는 str 모드와 bytes 모드 모두에서 같은 결과를 내야 합니다.
+        for binary in [False, True]:
+            mmap_result = binwalk.scan(input_vector_file,
+                                       signature=True,
+                                       mmap=True,
+                                       binary=binary,
+                                       quiet=True)
+
+            eq_([(r.offset, r.description, r.valid) for r in expected[0].results],
+                [(r.offset, r.description, r.valid) for r in mmap_result[0].results])
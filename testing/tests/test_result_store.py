@@ -0,0 +1,56 @@
+import os
+import binwalk
+import binwalk.core.magic
+from binwalk.core.module import Result, ResultStore
+from nose.tools import eq_, ok_
+
+def _attributes(r):
+    return dict([(name, getattr(r, name, None)) for name in
+                 list(Result.FIELDS) + ['entropy', 'jump', 'id', 'exception']])
+
+def test_result_store():
+    '''
+    테스트: 여러 형식의 결과를 ResultStore에 저장합니다.
+    저장된 결과의 클래스와 속성이 원래 결과와 동일한지 확인합니다.
+    '''
+    results = [
+        Result(offset=0, description="0.500000", entropy=0.5),
+        Result(offset=1024, description="0.500000", entropy=0.5, display=False),
+        # 배열에 저장할 수 없는 값 (None, 큰 정수)과 이전 결과에 없던 속성
+        Result(offset=2 ** 64, size=None, description="하강 엔트로피 엣지", jump=16),
+        binwalk.core.magic.SignatureResult(offset=4096, description="LZMA compressed data", id=3, invalid=True),
+    ]
+
+    store = ResultStore(results[:2])
+    store += results[2:]
+
+    eq_(len(store), len(results))
+    eq_([r.__class__ for r in store], [r.__class__ for r in results])
+    eq_([_attributes(r) for r in store], [_attributes(r) for r in results])
+    eq_(_attributes(store[-1]), _attributes(results[-1]))
+    eq_([r.offset for r in store[1:3]], [1024, 2 ** 64])
+
+    # 이전 결과에 없던 속성은 설정되지 않아야 합니다.
+    ok_(not hasattr(store[0], 'jump'))
+
+def test_entropy_result_store():
+    '''
+    테스트: 입력 벡터 파일의 엔트로피를 스캔합니다.
+    엔트로피 결과가 ResultStore에 저장되고, 결과 속성을 그대로 사용할 수 있는지 확인합니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "firmware.squashfs")
+
+    streamed = [r for (name, r) in binwalk.scan_iter(input_vector_file,
+                                                     entropy=True,
+                                                     nplot=True,
+                                                     quiet=True)]
+    modules = binwalk.scan(input_vector_file,
+                           entropy=True,
+                           nplot=True,
+                           quiet=True)
+
+    ok_(isinstance(modules[0].results, ResultStore))
+    eq_([(r.offset, r.entropy, r.description, r.display, r.file.path) for r in streamed],
+        [(r.offset, r.entropy, r.description, r.display, r.file.path) for r in modules[0].results])
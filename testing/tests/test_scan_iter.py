@@ -0,0 +1,152 @@
+import os
+import binwalk
+from nose.tools import eq_, ok_
+
+def test_scan_iter():
+    '''
+    테스트: 입력 벡터 파일의 시그니처와 엔트로피를 스트리밍 API (binwalk.scan_iter)로 스캔합니다.
+    생성된 결과가 binwalk.scan의 결과와 같은 순서로 동일한지 확인합니다.
+    '''
+    # 엔트로피 모듈은 마지막 파일의 결과만 module.results에 남기므로, 하나의 파일로 비교합니다.
+    input_vector_files = [os.path.join(os.path.dirname(__file__), "input-vectors", "firmware.squashfs")]
+
+    expected = binwalk.scan(*input_vector_files,
+                            signature=True,
+                            entropy=True,
+                            nplot=True,
+                            quiet=True)
+    expected = [(module.name, r.file.path, r.offset, r.description) for module in expected for r in module.results]
+
+    # 결과가 있어야 합니다.
+    ok_(expected)
+
+    # 결과 저장 여부 및 큐 크기와 관계없이 같은 결과가 생성되어야 합니다.
+    for (keep_results, queue_size) in [(True, 1024), (False, 1)]:
+        streamed = [(name, r.file.path, r.offset, r.description)
+                    for (name, r) in binwalk.scan_iter(*input_vector_files,
+                                                       signature=True,
+                                                       entropy=True,
+                                                       nplot=True,
+                                                       quiet=True,
+                                                       keep_results=keep_results,
+                                                       queue_size=queue_size)]
+        eq_(expected, streamed)
+
+def test_scan_iter_stop():
+    '''
+    테스트: 스트리밍 API (binwalk.scan_iter)에서 첫 번째 결과를 받은 후 중단합니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "firmware.squashfs")
+
+    results = binwalk.scan_iter(input_vector_file,
+                                entropy=True,
+                                nplot=True,
+                                quiet=True,
+                                queue_size=1)
+
+    (name, r) = next(results)
+    eq_(name, "Entropy")
+    results.close()
+
+def test_scan_iter_stop_long_loop():
+    '''
+    테스트: 결과 없이 오래 실행되는 루프 (RawCompression의 오프셋별 압축 해제) 중에 스트리밍 API를 중단합니다.
+    생성기를 닫는 데 남은 스캔 시간만큼 걸리지 않는지 확인합니다.
+    '''
+    import time
+    import zlib
+
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    data = compressor.compress(b"binwalk " * 4096) + compressor.flush()
+
+    # 0xFF 바이트에서는 raw deflate 결과가 발견되지 않으므로, 압축 데이터의 결과 이후에는 결과 없이 스캔이 계속됩니다.
+    expected = binwalk.scan(data=data + b"\xFF" * 1024, deflate=True, quiet=True)[0].results
+    ok_(expected)
+    data += b"\xFF" * (4 * 1024 * 1024)
+
+    start = time.time()
+    results = binwalk.scan_iter(data=data,
+                                deflate=True,
+                                quiet=True,
+                                queue_size=1)
+
+    # 압축 데이터의 결과를 모두 받은 후에는 스캔 스레드가 결과를 보고하지 않는 루프에 있습니다.
+    for r in expected:
+        (name, streamed) = next(results)
+        eq_(name, "RawCompression")
+        eq_(streamed.offset, r.offset)
+    results.close()
+
+    # 전체 스캔은 수십 초가 걸립니다.
+    ok_(time.time() - start < 5)
+
+def _running(pid):
+    # 종료되었지만 회수되지 않은 프로세스 (좀비)는 실행 중이 아닙니다.
+    try:
+        with open("/proc/%d/stat" % pid) as fp:
+            return fp.read().split()[2] != "Z"
+    except IOError:
+        return False
+
+def test_scan_iter_stop_extractor():
+    '''
+    테스트: 외부 추출기가 실행 중일 때 스트리밍 API (binwalk.scan_iter)를 중단합니다.
+    추출기가 생성한 프로세스까지 종료되고, 생성기를 닫는 데 추출기의 실행 시간만큼 걸리지 않는지 확인합니다.
+    루트로 실행하는 경우 다른 사용자로 추출기를 실행하는 경우 (--run-as, os.fork 사용)도 확인합니다.
+    '''
+    import pwd
+    import time
+    import shutil
+    import tempfile
+
+    users = [pwd.getpwuid(os.getuid()).pw_name]
+    if os.getuid() == 0:
+        try:
+            users.append(pwd.getpwnam("nobody").pw_name)
+        except KeyError:
+            pass
+
+    for user in users:
+        directory = tempfile.mkdtemp()
+        os.chmod(directory, 0o777)
+        try:
+            target = os.path.join(directory, "target.bin")
+            with open(target, "wb") as fp:
+                fp.write((b"\x00" * 64 + b"BINWALKSTOPTEST") * 2 + b"\x00" * 64)
+
+            # 첫 번째 추출은 바로 끝나고, 두 번째 추출은 추출기가 생성한 프로세스 (sleep)가 끝날 때까지 실행됩니다.
+            first = os.path.join(directory, "first")
+            pid_file = os.path.join(directory, "pid")
+            rule = "raw signature:bin:sh -c 'if [ -e %s ]; then sleep 60 & echo $! > %s; wait; else touch %s; fi'" % (first, pid_file, first)
+
+            start = time.time()
+            results = binwalk.scan_iter(target,
+                                        raw="BINWALKSTOPTEST",
+                                        dd=[rule],
+                                        run_as=user,
+                                        directory=os.path.join(directory, "output"),
+                                        quiet=True,
+                                        queue_size=1)
+            next(results)
+
+            pid = None
+            while pid is None and time.time() - start < 10:
+                try:
+                    with open(pid_file) as fp:
+                        pid = int(fp.read())
+                except (IOError, ValueError):
+                    time.sleep(.05)
+            ok_(pid is not None)
+            ok_(_running(pid))
+
+            results.close()
+            ok_(time.time() - start < 10)
+
+            deadline = time.time() + 5
+            while _running(pid) and time.time() < deadline:
+                time.sleep(.05)
+            ok_(not _running(pid), "추출기가 생성한 프로세스가 실행 중입니다 (%s)" % user)
+        finally:
+            shutil.rmtree(directory)
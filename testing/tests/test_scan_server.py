@@ -0,0 +1,208 @@
+import os
+import json
+import socket
+import base64
+import tempfile
+import threading
+import binwalk
+from binwalk.core.scanserver import ScanServer
+from nose.tools import eq_, ok_
+
+def _start_server(workers, extract=False):
+    path = os.path.join(tempfile.mkdtemp(), "binwalk.sock")
+    server = ScanServer(path, workers=workers, extract=extract)
+
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    return (server, path)
+
+def _connect(path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(path)
+    return (sock, sock.makefile('rwb'))
+
+def _send(fp, request):
+    fp.write((json.dumps(request) + "\n").encode('utf-8'))
+    fp.flush()
+
+def test_scan_server():
+    '''
+    테스트: 스캔 서버 (binwalk --serve)에 입력 벡터 파일과 메모리 버퍼의 스캔 작업을 요청합니다.
+    각 작업의 결과가 binwalk.scan의 결과와 동일한지 확인합니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "firmware.squashfs")
+    with open(input_vector_file, "rb") as fp:
+        data = fp.read()
+
+    expected_signature = binwalk.scan(input_vector_file, signature=True, quiet=True)
+    expected_entropy = binwalk.scan(input_vector_file, entropy=True, nplot=True, quiet=True)
+
+    (server, path) = _start_server(workers=2)
+    try:
+        (sock, fp) = _connect(path)
+
+        _send(fp, {"id": "signature", "files": [input_vector_file]})
+        _send(fp, {"id": "entropy", "files": [input_vector_file], "options": {"entropy": True, "nplot": True}})
+        _send(fp, {"id": "buffer", "data": base64.b64encode(data).decode('utf-8'), "options": {"signature": True}})
+        _send(fp, {"id": "empty"})
+        # 요청 전송을 마쳐도 진행 중인 작업의 결과는 모두 전송되어야 합니다.
+        sock.shutdown(socket.SHUT_WR)
+
+        results = {}
+        status = {}
+        for line in fp:
+            message = json.loads(line.decode('utf-8'))
+            if "result" in message:
+                results.setdefault(message["id"], []).append((message["module"],
+                                                              message["result"]["offset"],
+                                                              message["result"]["description"]))
+            else:
+                status[message["id"]] = message["status"]
+        sock.close()
+    finally:
+        server.server.shutdown()
+
+    eq_(status, {"signature": "done", "entropy": "done", "buffer": "done", "empty": "error"})
+    eq_(results["signature"], [("Signature", r.offset, r.description) for r in expected_signature[0].results])
+    eq_(results["entropy"], [("Entropy", r.offset, r.description) for r in expected_entropy[0].results])
+    eq_(results["buffer"], results["signature"])
+
+def test_scan_server_cancel():
+    '''
+    테스트: 스캔 서버에 요청한 엔트로피 스캔 작업을 첫 번째 결과를 받은 후 취소합니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "firmware.squashfs")
+
+    (server, path) = _start_server(workers=1)
+    try:
+        (sock, fp) = _connect(path)
+
+        _send(fp, {"id": 1, "files": [input_vector_file], "options": {"entropy": True, "nplot": True}})
+        ok_("result" in json.loads(fp.readline().decode('utf-8')))
+        _send(fp, {"cancel": 1})
+
+        for line in fp:
+            message = json.loads(line.decode('utf-8'))
+            if "status" in message:
+                break
+        sock.close()
+    finally:
+        server.server.shutdown()
+
+    eq_(message, {"id": 1, "status": "cancelled"})
+
+def test_scan_server_extract_buffers():
+    '''
+    테스트: 추출 작업 (작업 디렉터리를 변경함)과 메모리 버퍼 스캔 작업을 스캔 서버에 함께 요청합니다.
+    모든 버퍼 작업이 추출 작업과 관계없이 성공하고 binwalk.scan과 같은 결과를 내는지 확인합니다.
+    '''
+    import pwd
+    import shutil
+
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "foobar.lzma")
+    with open(input_vector_file, "rb") as fp:
+        data = base64.b64encode(fp.read()).decode('utf-8')
+
+    expected = [("Signature", r.offset, r.description)
+                for r in binwalk.scan(input_vector_file, signature=True, quiet=True)[0].results]
+
+    directory = tempfile.mkdtemp()
+    extract_options = {"extract": True,
+                       "directory": directory,
+                       "run_as": pwd.getpwuid(os.getuid()).pw_name}
+
+    (server, path) = _start_server(workers=4, extract=True)
+    try:
+        (sock, fp) = _connect(path)
+
+        for i in range(0, 30):
+            _send(fp, {"id": "extract-%d" % i, "files": [input_vector_file], "options": extract_options})
+            for j in range(0, 10):
+                _send(fp, {"id": "buffer-%d-%d" % (i, j), "data": data})
+        sock.shutdown(socket.SHUT_WR)
+
+        results = {}
+        status = {}
+        for line in fp:
+            message = json.loads(line.decode('utf-8'))
+            if "result" in message:
+                results.setdefault(message["id"], []).append((message["module"],
+                                                              message["result"]["offset"],
+                                                              message["result"]["description"]))
+            else:
+                status[message["id"]] = message
+        sock.close()
+    finally:
+        server.server.shutdown()
+        shutil.rmtree(directory)
+
+    for i in range(0, 30):
+        for j in range(0, 10):
+            job_id = "buffer-%d-%d" % (i, j)
+            eq_(status[job_id], {"id": job_id, "status": "done", "errors": []})
+            eq_(results[job_id], expected)
+
+def test_scan_server_rejected_options():
+    '''
+    테스트: 서버 프로세스를 fork하거나, 임의의 경로에 파일을 쓰거나, 외부 명령을 실행하는 옵션을 스캔 서버에 요청합니다.
+    추출을 허용하지 않은 서버에서 요청이 실행되지 않고 오류로 끝나는지 확인합니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "foobar.lzma")
+
+    directory = tempfile.mkdtemp()
+    log_file = os.path.join(directory, "log.txt")
+    command = "touch %s" % os.path.join(directory, "pwned")
+    rejected = [{"jobs": 2},
+                {"serve": os.path.join(directory, "other.sock")},
+                {"status": 8080},
+                {"s": 8080},
+                {"log": log_file},
+                {"f": log_file},
+                {"-f": log_file},
+                {"stats_file": log_file},
+                {"stats": log_file},
+                {"-Bf": log_file},
+                {"dd": "lzma:lzma:%s" % command},
+                {"D": "lzma:lzma:%s" % command},
+                {"extract": True, "run_as": "root", "directory": directory},
+                {"run_as": "root"},
+                {"0": "root"},
+                {"directory": directory},
+                {"C": directory},
+                {"e": True},
+                {"matryoshka": True},
+                {"rm": True},
+                {"pyramid": True, "entropy": True},
+                {"serve_extract": True}]
+
+    (server, path) = _start_server(workers=1)
+    try:
+        (sock, fp) = _connect(path)
+
+        for (i, options) in enumerate(rejected):
+            _send(fp, {"id": i, "files": [input_vector_file], "options": options})
+        _send(fp, {"id": "allowed", "files": [input_vector_file], "options": {"B": True, "raw": "\\x5D"}})
+        sock.shutdown(socket.SHUT_WR)
+
+        status = {}
+        for line in fp:
+            message = json.loads(line.decode('utf-8'))
+            if "status" in message:
+                status[message["id"]] = message["status"]
+        sock.close()
+    finally:
+        server.server.shutdown()
+
+    eq_(status, dict([(i, "error") for i in range(0, len(rejected))] + [("allowed", "done")]))
+    ok_(not os.listdir(directory))
+    os.rmdir(directory)
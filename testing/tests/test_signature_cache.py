@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+import binwalk
+from binwalk.core.magic import Magic
+from nose.tools import eq_, ok_
+
+def _signatures(magic):
+    return [(s.id, s.title, s.offset, s.confidence, s.magic, len(s.lines)) for s in magic.signatures]
+
+def test_signature_cache():
+    '''
+    테스트: 시그니처 파일을 캐시 디렉토리를 지정하여 로드합니다.
+    캐시에서 로드한 시그니처가 직접 파싱한 시그니처와 같은지, 시그니처 파일이 바뀌면 키가 바뀌고
+    캐시 파일이 쌓이지 않고 덮어써지는지 확인합니다.
+    '''
+    magic_file = os.path.join(os.path.dirname(binwalk.__file__), "magic", "compressed")
+
+    directory = tempfile.mkdtemp()
+    try:
+        cache = os.path.join(directory, "cache")
+        os.mkdir(cache)
+        fname = os.path.join(directory, "compressed")
+        shutil.copy(magic_file, fname)
+
+        parsed = Magic()
+        parsed.load(fname)
+
+        cached = Magic()
+        cached.load_files([fname], cache=cache)
+        eq_(_signatures(cached), _signatures(parsed))
+
+        cache_files = os.listdir(cache)
+        eq_(len(cache_files), 1)
+        ok_(cache_files[0].startswith("magic-"))
+        inode = os.stat(os.path.join(cache, cache_files[0])).st_ino
+
+        # 캐시에서 로드하는 경우 캐시 파일은 다시 저장되지 않습니다 (저장은 새 파일로 교체합니다).
+        cached = Magic()
+        cached.load_files([fname], cache=cache)
+        eq_(_signatures(cached), _signatures(parsed))
+        eq_(os.stat(os.path.join(cache, cache_files[0])).st_ino, inode)
+        key = cached._cache_key([fname])
+
+        # 시그니처 파일이 바뀌면 키가 바뀌고, 같은 캐시 파일을 새 시그니처로 덮어씁니다.
+        with open(fname, "a") as fp:
+            fp.write("\n0    string    BINWALKCACHETEST    Cache test signature\n")
+
+        changed = Magic()
+        changed.load_files([fname], cache=cache)
+        ok_(changed._cache_key([fname]) != key)
+        eq_(len(changed.signatures), len(parsed.signatures) + 1)
+        eq_(os.listdir(cache), cache_files)
+
+        reloaded = Magic()
+        reloaded.load_files([fname], cache=cache)
+        eq_(_signatures(reloaded), _signatures(changed))
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,68 @@
+import os
+import random
+import binwalk
+from nose.tools import eq_, ok_
+
+def test_skip_map():
+    '''
+    테스트: 0xFF 패딩, 입력 벡터 파일, 0x00 패딩 및 무작위 데이터로 구성된 버퍼를 건너뛸 영역 (--skip)을 지정하여 스캔합니다.
+    패딩 영역이 바이트 단위로 정확히 찾아지고 (영역은 다음 값보다 margin 바이트 앞에서 끝남),
+    결과가 건너뛰기 없이 스캔한 결과와 동일한지 확인합니다 (병렬 스캔 포함).
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "firmware.squashfs")
+    with open(input_vector_file, "rb") as fp:
+        squashfs = fp.read()
+
+    rng = random.Random(0)
+    data = b"\xFF" * 300001 + squashfs + b"\x00" * 200000 + bytes(bytearray(rng.getrandbits(8) for i in range(300000)))
+
+    expected = binwalk.scan(data=data, signature=True, quiet=True)[0].results
+
+    # 파일 시스템 이미지 끝의 0x00 패딩은 뒤의 0x00 패딩 영역에 포함됩니다.
+    fill_start = 300001 + len(squashfs.rstrip(b"\x00"))
+    fill_end = 300001 + len(squashfs) + 200000
+
+    for (skip, jobs) in [(["fill"], 1), (["fill", "entropy"], 1), (["fill", "entropy"], 2)]:
+        module = binwalk.scan(data=data, signature=True, quiet=True, skip=skip, jobs=jobs)[0]
+
+        eq_([(r.offset, r.description) for r in module.results],
+            [(r.offset, r.description) for r in expected])
+
+        regions = [(start, end) for (start, end, kind) in module.skip_map.regions if kind == "fill"]
+        margin = module.skip_map.margin
+        eq_(margin, module._skip_margin())
+        eq_(regions, [(0, 300001 - margin), (fill_start, fill_end - margin)])
+
+        if "entropy" in skip:
+            ok_([region for region in module.skip_map.regions if region[2] == "entropy"])
+
+        # 병렬 스캔 (--jobs)에서 미리 분석하는 블록은 건너뛸 영역에서 시작하지 않고, 영역의 시작에서 끝나야 합니다.
+        blocks = module._planned_blocks(0, len(data), 1024 * 1024, len(data))
+        for (start, length) in blocks.items():
+            eq_(module.skip_map.region(start), None)
+            eq_(module.skip_map.limit(start, length), length)
+        scanned = sum([min(start + length, len(data)) - start for (start, length) in blocks.items()])
+        eq_(scanned + sum([end - start for (start, end, kind) in module.skip_map.regions]), len(data))
+
+def test_skip_map_fill_header():
+    '''
+    테스트: 0xFF 패딩 바로 뒤에 0xFF로 시작하는 헤더 (Snappy 스트림 식별자)가 있는 버퍼를 --skip fill로 스캔합니다.
+    패딩 영역이 헤더의 앞에서 끝나고, 헤더가 건너뛰기 없이 스캔한 결과와 같이 발견되는지 확인합니다.
+    '''
+    header = b"\xFF\x06\x00\x00sNaPpY"
+    offset = 256 * 1024
+    data = b"\xFF" * offset + header + b"\x01" * 1024 + b"\xFF" * (64 * 1024)
+
+    expected = binwalk.scan(data=data, signature=True, quiet=True)[0].results
+    eq_([r.offset for r in expected], [offset])
+
+    module = binwalk.scan(data=data, signature=True, quiet=True, skip=["fill"])[0]
+
+    eq_([(r.offset, r.description) for r in module.results],
+        [(r.offset, r.description) for r in expected])
+
+    regions = [(start, end) for (start, end, kind) in module.skip_map.regions]
+    eq_(regions[0], (0, offset + 1 - module.skip_map.margin))
+    eq_(module.skip_map.region(offset), None)
@@ -0,0 +1,27 @@
+import os
+import sys
+import subprocess
+from nose.tools import eq_
+
+# 기본 시그니처 스캔에서 가져오지 않아야 하는 모듈입니다 (각 모듈이 활성화된 경우에만 가져옵니다).
+LAZY_IMPORTS = ['capstone', 'numpy', 'numba', 'matplotlib', 'multiprocessing', 'socketserver']
+
+STARTUP_SCRIPT = '''
+import sys
+import binwalk
+binwalk.scan(sys.argv[1], signature=True, quiet=True)
+print(",".join(sorted(m for m in sys.argv[2].split(",") if m in sys.modules)))
+'''
+
+def test_startup():
+    '''
+    테스트: 새 인터프리터에서 binwalk를 가져오고 입력 벡터 파일의 시그니처를 스캔합니다.
+    무거운 의존성 (LAZY_IMPORTS)을 가져오지 않았는지 확인합니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "foobar.lzma")
+
+    output = subprocess.check_output([sys.executable, "-c", STARTUP_SCRIPT, input_vector_file, ",".join(LAZY_IMPORTS)],
+                                     stderr=subprocess.DEVNULL)
+    eq_(output.decode('utf-8').strip(), "")
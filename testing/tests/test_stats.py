@@ -0,0 +1,40 @@
+import os
+import json
+import shutil
+import tempfile
+import binwalk
+from nose.tools import eq_, ok_
+
+def test_stats_file():
+    '''
+    테스트: 입력 벡터 파일의 시그니처를 스캔하면서 성능 통계를 --stats-file에 기록합니다.
+    모듈 단계, 플러그인 콜백 및 시그니처별 통계가 기록되었는지 확인합니다.
+    '''
+    input_vector_file = os.path.join(os.path.dirname(__file__),
+                                     "input-vectors",
+                                     "firmware.squashfs")
+
+    directory = tempfile.mkdtemp()
+    try:
+        stats_file = os.path.join(directory, "stats.json")
+
+        modules = binwalk.scan(input_vector_file,
+                               signature=True,
+                               quiet=True,
+                               stats_file=stats_file)
+
+        with open(stats_file, "r") as fp:
+            report = json.load(fp)
+    finally:
+        shutil.rmtree(directory)
+
+    for phase in ["init", "pre_scan", "run", "post_scan"]:
+        eq_(report["modules"]["Signature.%s" % phase]["calls"], 1)
+        eq_(report["modules"]["Signature.%s" % phase]["failures"], 0)
+
+    ok_(report["plugins"])
+
+    # 각 시그니처의 분석된 결과 수는 후보 수를 넘지 않으며, 유효한 결과 수의 합은 스캔 결과 수와 같아야 합니다.
+    for entry in report["signatures"]:
+        ok_(entry["valid"] + entry["invalid"] <= entry["candidates"])
+    eq_(sum(entry["valid"] for entry in report["signatures"]), len(modules[0].results))